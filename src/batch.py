@@ -0,0 +1,123 @@
+"""Évaluation en lot de plusieurs donjons sur un pool de processus.
+
+Tous les donjons sont joués contre le même roster de héros (celui d'un
+`Level`). Chaque worker reçoit le roster une seule fois à son démarrage,
+puis une description compacte de chaque donjon (uniquement les cases qui
+ne sont pas du sol) ou le chemin d'une sauvegarde, qu'il reconstruit
+localement avant de jouer la vague en mode headless.
+
+Usage:
+    from src.batch import evaluate_layouts
+
+    results = evaluate_layouts([dungeon_a, dungeon_b, "save/dungeon.json"], level)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+
+from src.commands.importDungeon import dungeon_from_dict
+from src.model.binary_save import BINARY_EXTENSION, read_binary_save
+from src.headless import run_wave
+from src.model.dungeon import Dungeon
+from src.model.layout_cache import CompactLayout, Placement
+from src.model.level import Level, LevelBuilder
+
+
+@dataclass
+class WaveSetup:
+    """Description picklable du roster d'un niveau (sans son donjon)."""
+
+    budget: int
+    difficulty: int
+    heroes: List[Tuple[int, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_level(cls, level: Level) -> "WaveSetup":
+        return cls(
+            budget=level.budget_tot,
+            difficulty=level.difficulty,
+            heroes=[(h.pv_total, h.strategy) for h in level.heroes],
+        )
+
+    def build_level(self, dungeon: Dungeon) -> Level:
+        """Construit un niveau neuf avec ce roster sur le donjon donné."""
+        builder = (LevelBuilder()
+                   .set_dungeon(dungeon)
+                   .set_budget(self.budget)
+                   .set_difficulty(self.difficulty))
+        for pv, strategy in self.heroes:
+            builder.add_hero(pv=pv, strategy=strategy)
+        return builder.build()
+
+
+Layout = Union[Dungeon, CompactLayout, str]
+
+
+# Roster partagé par toutes les tâches d'un même worker
+_worker_setup: Optional[WaveSetup] = None
+_worker_max_ticks: Optional[int] = None
+
+
+def _init_worker(setup: WaveSetup, max_ticks: Optional[int]) -> None:
+    global _worker_setup, _worker_max_ticks
+    _worker_setup = setup
+    _worker_max_ticks = max_ticks
+
+
+def _evaluate_one(layout: Union[CompactLayout, str]) -> dict:
+    """Joue une vague sur un donjon dans le worker courant."""
+    if isinstance(layout, str) and layout.endswith(BINARY_EXTENSION):
+        dungeon, header = read_binary_save(layout)
+        current_budget = header["current_budget"]
+    elif isinstance(layout, str):
+        with open(layout, "r") as f:
+            data = json.load(f)
+        dungeon = dungeon_from_dict(data)
+        current_budget = data.get("current_budget", _worker_setup.budget)
+    else:
+        dungeon, total_cost = layout.build()
+        current_budget = _worker_setup.budget - total_cost
+    level = _worker_setup.build_level(dungeon)
+    return run_wave(level, current_budget, _worker_max_ticks).to_dict()
+
+
+def evaluate_layouts(
+    layouts: List[Layout],
+    level: Union[Level, WaveSetup],
+    max_workers: Optional[int] = None,
+    max_ticks: Optional[int] = None,
+) -> List[dict]:
+    """Joue une vague headless sur chaque donjon, en parallèle.
+
+    Args:
+        layouts: Donjons, layouts compacts ou chemins de sauvegardes (JSON
+            ou binaires)
+        level: Niveau (ou roster) dont les héros attaquent chaque donjon
+        max_workers: Nombre de processus (défaut : nombre de cœurs). Avec 1,
+            les vagues sont jouées dans le processus courant.
+        max_ticks: Borne optionnelle sur la durée de chaque vague
+
+    Returns:
+        Un `waveResult.to_dict()` par donjon, dans l'ordre des entrées.
+    """
+    setup = level if isinstance(level, WaveSetup) else WaveSetup.from_level(level)
+    tasks = [
+        CompactLayout.from_dungeon(layout) if isinstance(layout, Dungeon) else layout
+        for layout in layouts
+    ]
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(setup, max_ticks)
+        return [_evaluate_one(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(setup, max_ticks)
+    ) as executor:
+        return list(executor.map(_evaluate_one, tasks, chunksize=chunksize))
@@ -0,0 +1,295 @@
+"""Banc de mesure des performances, sans affichage.
+
+Chaque mesure est répétée sur des donjons de tailles, densités d'entités et
+nombres de héros paramétrables. Les résultats sont écrits en JSON pour
+suivre l'évolution des courbes de passage à l'échelle d'une version à
+l'autre.
+
+Mesures disponibles :
+
+- ``step`` : un tick de `Simulation.step` (moyenne sur ``STEP_TICKS`` ticks)
+- ``step_roster`` : idem avec les héros rangés dans un `HeroRoster`
+- ``wave`` : une vague headless complète (`Simulation.run_headless`)
+- ``shortest`` / ``safest`` : `find_path` de la stratégie, sans cache
+- ``update`` : `Dungeon.update` avec tous les dragons et bombes actifs
+- ``export`` / ``import`` : `exportDungeon` puis `importDungeon` (JSON)
+
+Usage:
+    python -m src.benchmark
+    python -m src.benchmark --sizes 10 100 500 --densities 0.1 --heroes 1 10 \\
+        --benchmarks step shortest --output bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.commands.exportDungeon import exportDungeon
+from src.commands.importDungeon import importDungeon
+from src.generator import STYLES, generate_dungeon
+from src.model.campaign_manager import Campaign
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.level import Level, LevelBuilder
+from src.model.path_strategies import SafestPathStrategy, ShortestPathStrategy
+from src.simulation import Simulation
+
+DEFAULT_SIZES = [10, 50, 100, 200, 500]
+DEFAULT_DENSITIES = [0.0, 0.1, 0.3]
+DEFAULT_HEROES = [1, 5, 20]
+STEP_TICKS = 20
+HERO_PV = 100
+STRATEGIES = ("shortest", "safest")
+
+
+def build_dungeon(size: int, density: float, seed: int = 0, style: str = "scatter") -> Dungeon:
+    """Donjon carré dont une proportion ``density`` des cases est occupée.
+
+    Avec le style ``scatter``, les entités (murs, pièges, dragons, bombes)
+    sont tirées au hasard ; la première ligne et la dernière colonne restent
+    libres pour que l'entrée (0, 0) et la sortie (size-1, size-1) soient
+    toujours reliées. Les autres styles sont ceux de `generate_dungeon`,
+    chaque type d'entité recevant un quart de la densité.
+    """
+    if style != "scatter":
+        share = density / 4
+        return generate_dungeon(size, size, seed=seed, style=style, wall_density=share,
+                                trap_density=share, dragon_density=share, bomb_density=share)
+    rng = random.Random(seed)
+    dungeon = Dungeon(dimension=(size, size), entry=(0, 0), exit=(size - 1, size - 1))
+    makers = [
+        EntityFactory.create_wall,
+        lambda: EntityFactory.create_trap(damage=10),
+        lambda: EntityFactory.create_dragon(orientation=rng.choice("UDLR")),
+        EntityFactory.create_bombe,
+    ]
+    for row in range(1, size):
+        for col in range(size - 1):
+            if rng.random() < density:
+                dungeon.place_entity(rng.choice(makers)(), (row, col))
+    return dungeon
+
+
+def build_level(dungeon: Dungeon, heroes: int, roster: bool = False) -> Level:
+    builder = LevelBuilder().set_dungeon(dungeon).use_roster(roster)
+    for i in range(heroes):
+        builder.add_hero(pv=HERO_PV, strategy=STRATEGIES[i % len(STRATEGIES)])
+    return builder.build()
+
+
+def start_wave(simulation: Simulation) -> None:
+    """Prépare la vague comme la commande startWave (chemins des héros)."""
+    dungeon = simulation.dungeon
+    for hero in simulation.heroes:
+        hero.coord = dungeon.entry
+        hero.compute_path(dungeon, dungeon.entry, dungeon.exit)
+    simulation.isSimStarted = True
+
+
+def _timed(setup: Callable[[], object], run: Callable[[object], None], repeat: int) -> List[float]:
+    """Durées de ``run(setup())``, la préparation n'étant pas chronométrée."""
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_step(size, density, heroes, repeat, seed, style="scatter", roster=False):
+    def setup():
+        simulation = Simulation(build_level(build_dungeon(size, density, seed, style), heroes, roster))
+        start_wave(simulation)
+        return simulation
+
+    def run(simulation):
+        for _ in range(STEP_TICKS):
+            simulation.step()
+
+    return [t / STEP_TICKS for t in _timed(setup, run, repeat)]
+
+
+def bench_step_roster(size, density, heroes, repeat, seed, style="scatter"):
+    return bench_step(size, density, heroes, repeat, seed, style, roster=True)
+
+
+def bench_wave(size, density, heroes, repeat, seed, style="scatter"):
+    def setup():
+        simulation = Simulation(build_level(build_dungeon(size, density, seed, style), heroes))
+        start_wave(simulation)
+        return simulation
+
+    return _timed(setup, lambda simulation: simulation.run_headless(), repeat)
+
+
+def _bench_strategy(strategy_class):
+    def bench(size, density, heroes, repeat, seed, style="scatter"):
+        dungeon = build_dungeon(size, density, seed, style)
+        strategy = strategy_class()
+        return _timed(
+            lambda: dungeon,
+            lambda d: strategy.find_path(d, d.entry, d.exit),
+            repeat,
+        )
+    return bench
+
+
+def bench_update(size, density, heroes, repeat, seed, style="scatter"):
+    def setup():
+        dungeon = build_dungeon(size, density, seed, style)
+        # Déclenche toutes les entités actives (dragons, bombes)
+        for row in dungeon.grid:
+            for cell in row:
+                if cell.entity.type in ("DRAGON", "BOMBE"):
+                    cell.return_damage_if_CD()
+        return dungeon
+
+    return _timed(setup, lambda dungeon: dungeon.update(), repeat)
+
+
+@contextlib.contextmanager
+def _save_dir():
+    """Répertoire de travail temporaire contenant un dossier ./save/."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "save"))
+        os.chdir(tmp)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+
+class _Controller:
+    """Contrôleur minimal attendu par les commandes d'export et d'import."""
+
+    def __init__(self, simulation, campaign_path: str = "campaign.json"):
+        self.simulation = simulation
+        self.campaign = Campaign(os.path.abspath(campaign_path), prefetch=False)
+
+
+def bench_export(size, density, heroes, repeat, seed, style="scatter"):
+    dungeon = build_dungeon(size, density, seed, style)
+    controller = _Controller(Simulation(build_level(dungeon, heroes)))
+    with _save_dir():
+        return _timed(
+            lambda: exportDungeon(dungeon, "bench"),
+            lambda command: command.execute(controller),
+            repeat,
+        )
+
+
+def bench_import(size, density, heroes, repeat, seed, style="scatter"):
+    dungeon = build_dungeon(size, density, seed, style)
+    controller = _Controller(Simulation(build_level(dungeon, heroes)))
+    with _save_dir():
+        with contextlib.redirect_stdout(io.StringIO()):
+            exportDungeon(dungeon, "bench").execute(controller)
+        return _timed(
+            lambda: importDungeon("bench"),
+            lambda command: command.execute(controller),
+            repeat,
+        )
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "step": bench_step,
+    "step_roster": bench_step_roster,
+    "wave": bench_wave,
+    "shortest": _bench_strategy(ShortestPathStrategy),
+    "safest": _bench_strategy(SafestPathStrategy),
+    "update": bench_update,
+    "export": bench_export,
+    "import": bench_import,
+}
+
+# Mesures qui dépendent du nombre de héros
+HERO_BENCHMARKS = {"step", "step_roster", "wave"}
+
+
+def run_benchmarks(
+    benchmarks: Sequence[str] = tuple(BENCHMARKS),
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    densities: Sequence[float] = DEFAULT_DENSITIES,
+    heroes: Sequence[int] = DEFAULT_HEROES,
+    repeat: int = 3,
+    seed: int = 0,
+    style: str = "scatter",
+) -> Dict[str, object]:
+    """Joue chaque mesure sur toutes les combinaisons de paramètres.
+
+    Returns:
+        Un dictionnaire sérialisable en JSON : ``meta`` (environnement et
+        paramètres) et ``results`` (une entrée par mesure et combinaison,
+        durées en secondes).
+    """
+    results = []
+    for name in benchmarks:
+        bench = BENCHMARKS[name]
+        hero_counts = heroes if name in HERO_BENCHMARKS else [None]
+        for size, density, count in itertools.product(sizes, densities, hero_counts):
+            timings = bench(size, density, count or 1, repeat, seed, style)
+            results.append({
+                "benchmark": name,
+                "rows": size,
+                "cols": size,
+                "density": density,
+                "heroes": count,
+                "repeat": repeat,
+                "min": min(timings),
+                "mean": statistics.fmean(timings),
+                "median": statistics.median(timings),
+            })
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "style": style,
+            "step_ticks": STEP_TICKS,
+            "unit": "s",
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Dungeon Manager - benchmarks")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS),
+                        default=list(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="Square grid sizes")
+    parser.add_argument("--densities", nargs="+", type=float, default=DEFAULT_DENSITIES,
+                        help="Fraction of non-floor cells")
+    parser.add_argument("--heroes", nargs="+", type=int, default=DEFAULT_HEROES,
+                        help="Hero counts (step, step_roster and wave only)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per combination")
+    parser.add_argument("--seed", type=int, default=0, help="Layout seed")
+    parser.add_argument("--style", choices=("scatter",) + STYLES, default="scatter",
+                        help="Layout style (scatter or a generator style)")
+    parser.add_argument("--output", default=None, help="JSON file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.benchmarks, args.sizes, args.densities,
+                            args.heroes, args.repeat, args.seed, args.style)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,20 @@ class GameInvoker:
         self.history = []
         self.commandstack = []
         self.game_controller = game_controller
+        # Journal de rejeu optionnel (src.replay.ReplayLog)
+        self.replay_log = None
 
     def execute(self):
         result = None
         for command in self.commandstack:
+            if self.replay_log is not None:
+                self.replay_log.sync()
             res = command.execute(self.game_controller)
             if isinstance(command, startWave):
                 result = res
             self.history.append(command)
+            if self.replay_log is not None:
+                self.replay_log.record(command)
         self.commandstack = []
         if self.game_controller and self.game_controller.simulation:
             self.game_controller.simulation.notify()
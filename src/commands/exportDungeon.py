@@ -1,13 +1,43 @@
 from .Command import Command
 import json
 from ..model.hero import Hero # Added import
+from ..model.binary_save import BINARY_EXTENSION, write_binary_save
+
+
+def dungeon_to_dict(dungeon, level_id: int = 1, current_budget: int = 0) -> dict:
+    """Données de sauvegarde JSON d'un Dungeon (inverse de `dungeon_from_dict`)."""
+    dungeon_data = {
+        "level_id": level_id,
+        "dimension": dungeon.dimension,
+        "entry": dungeon.entry,
+        "exit": dungeon.exit,
+        "grid": [],
+        "current_budget": current_budget
+
+    }
+    for row in dungeon.grid:
+        row_data = []
+        for cell in row:
+            entity_info = {
+                "type": type(cell.entity).__name__,
+                "position": cell.position,
+            }
+            if hasattr(cell.entity, "damage"):
+                entity_info["damage"] = cell.entity.damage
+            if hasattr(cell.entity, "orientation"):
+                entity_info["orientation"] = cell.entity.orientation
+            row_data.append(entity_info)
+        dungeon_data["grid"].append(row_data)
+    return dungeon_data
 
 
 class exportDungeon(Command):
-    def __init__(self, dungeon, filename: str, campaign_progress=None):
+    def __init__(self, dungeon, filename: str, campaign_progress=None, binary: bool = False):
         self.dungeon = dungeon
         self.filename = filename
-        self.filepath="./save/"+filename + ".json"
+        self.binary = binary
+        extension = BINARY_EXTENSION if binary else ".json"
+        self.filepath="./save/"+filename + extension
         self.campaign_progress = campaign_progress
 
     def execute(self, game_controller):
@@ -16,29 +46,14 @@ class exportDungeon(Command):
             return
 
         sim = game_controller.simulation
-        
-
-
-        dungeon_data = {
-            "level_id": sim.level.difficulty,
-            "dimension": self.dungeon.dimension,
-            "entry": self.dungeon.entry,
-            "exit": self.dungeon.exit,
-            "grid": [],
-            "current_budget": sim.current_budget
-
-        }
-        for row in self.dungeon.grid:
-            row_data = []
-            for cell in row:
-                entity_info = {
-                    "type": type(cell.entity).__name__,
-                    "position": cell.position,
-                }
-                if hasattr(cell.entity, "damage"):
-                    entity_info["damage"] = cell.entity.damage
-                row_data.append(entity_info)
-            dungeon_data["grid"].append(row_data)
+
+        if self.binary:
+            # Format binaire compact : la progression de campagne n'y est pas stockée
+            write_binary_save(self.filepath, self.dungeon, sim.level.difficulty, sim.current_budget)
+            print(f"Dungeon exported to {self.filepath}")
+            return
+
+        dungeon_data = dungeon_to_dict(self.dungeon, sim.level.difficulty, sim.current_budget)
 
         # Ajouter la progression de campagne si disponible
         if self.campaign_progress is not None:
@@ -5,6 +5,7 @@ from ..model.cell import Cell
 from ..model.floor import Floor
 from ..model.wall import Wall
 from ..model.trap import Trap
+from ..model.binary_save import BINARY_EXTENSION
 
 
 class getDungeonList(Command):
@@ -22,6 +23,11 @@ class getDungeonList(Command):
             dungeon_files = [
                 f[:-5] for f in files if f.endswith(".json")
             ]  # Remove .json extension
+            # Ajouter les sauvegardes binaires qui n'ont pas d'équivalent JSON
+            dungeon_files += [
+                f[:-len(BINARY_EXTENSION)] for f in files
+                if f.endswith(BINARY_EXTENSION) and f[:-len(BINARY_EXTENSION)] not in dungeon_files
+            ]
             self.result = dungeon_files
             print(f"Dungeon list retrieved from {self.save_directory}")
         except FileNotFoundError:
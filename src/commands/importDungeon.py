@@ -1,5 +1,7 @@
 from .Command import Command
 import json
+import os
+from typing import Optional
 from ..model.dungeon import Dungeon
 from ..model.cell import Cell
 from ..model.hero import Hero
@@ -7,14 +9,67 @@ from ..model.level import Level
 from ..model.campaign_manager import Campaign
 
 from ..model.entity_factory import EntityFactory
+from ..model.binary_save import BINARY_EXTENSION, read_binary_save
+
+
+def dungeon_from_dict(data: dict) -> Dungeon:
+    """Reconstruit un Dungeon à partir des données d'une sauvegarde JSON."""
+    dimension = tuple(data["dimension"])
+    entry = tuple(data["entry"])
+    exit_ = tuple(data["exit"])
+    grid_data = data["grid"]
+    grid = []
+    for row_idx, row in enumerate(grid_data):
+        grid_row = []
+        for col_idx, cell_data in enumerate(row):
+            entity_type = cell_data["type"]
+            position = tuple(cell_data["position"])
+            entity = None
+            if entity_type == "Floor":
+                entity = EntityFactory.create_floor()
+            elif entity_type == "Wall":
+                entity = EntityFactory.create_wall()
+            elif entity_type == "Trap":
+                damage = cell_data.get("damage", 10)
+                entity = EntityFactory.create_trap(damage=damage)
+            elif entity_type == "Dragon":
+                entity = EntityFactory.create_dragon(
+                    cell_data.get("orientation", "U"), damage=cell_data.get("damage", 30)
+                )
+            elif entity_type == "Bombe":
+                entity = EntityFactory.create_bombe(damage=cell_data.get("damage", 40))
+            else:
+                entity = EntityFactory.create_floor()
+
+            if entity:
+                entity.init_range(position)
+
+            cell = Cell(position, entity)
+            grid_row.append(cell)
+        grid.append(grid_row)
+
+    dungeon = Dungeon(dimension=dimension, entry=entry, exit=exit_)
+    dungeon.grid = grid
+    return dungeon
 
 
 class importDungeon(Command):
-    """Command to import a full level state from a JSON file."""
+    """Command to import a full level state from a JSON or binary save."""
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, binary: Optional[bool] = None):
+        """
+        Args:
+            filename: Nom de la sauvegarde dans ./save/, sans extension
+            binary: Format à lire ; par défaut celui du fichier présent
+                (JSON s'il existe, sinon binaire), comme le liste getDungeonList
+        """
         self.filename = filename
-        self.filepath = f"./save/{filename}.json"
+        if binary is None:
+            binary = (not os.path.exists(f"./save/{filename}.json")
+                      and os.path.exists(f"./save/{filename}{BINARY_EXTENSION}"))
+        self.binary = binary
+        extension = BINARY_EXTENSION if binary else ".json"
+        self.filepath = f"./save/{filename}{extension}"
         self.result = None
         self.campaign_progress = None
 
@@ -23,45 +78,13 @@ class importDungeon(Command):
             print("Import failed: Simulation context is not available.")
             return
 
-        with open(self.filepath, "r") as f:
-            data = json.load(f)
-        campaign = game_controller.campaign 
-        # 1. Rebuild Dungeon
-        dimension = tuple(data["dimension"])
-        entry = tuple(data["entry"])
-        exit_ = tuple(data["exit"])
-        grid_data = data["grid"]
-        grid = []
-        for row_idx, row in enumerate(grid_data):
-            grid_row = []
-            for col_idx, cell_data in enumerate(row):
-                entity_type = cell_data["type"]
-                position = tuple(cell_data["position"])
-                entity = None
-                if entity_type == "Floor":
-                    entity = EntityFactory.create_floor()
-                elif entity_type == "Wall":
-                    entity = EntityFactory.create_wall()
-                elif entity_type == "Trap":
-                    damage = cell_data.get("damage", 10)
-                    entity = EntityFactory.create_trap(damage=damage)
-                elif entity_type == "Dragon":
-                    entity = EntityFactory.create_dragon()
-                elif entity_type == "Bombe":
-                    entity = EntityFactory.create_bombe()
-                else:
-                    entity = EntityFactory.create_floor()
-
-                if entity:
-                    entity.init_range(position)
-
-                cell = Cell(position, entity)
-                grid_row.append(cell)
-            grid.append(grid_row)
+        if self.binary:
+            dungeon, data = read_binary_save(self.filepath)
+        else:
+            with open(self.filepath, "r") as f:
+                data = json.load(f)
+            dungeon = dungeon_from_dict(data)
 
-        dungeon = Dungeon(dimension=dimension, entry=entry, exit=exit_)
-        dungeon.grid = grid
-      
         sim = game_controller.simulation
         level_id = data.get("level_id", sim.level.difficulty)
         level = game_controller.campaign.load_level(level_id)
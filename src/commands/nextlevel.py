@@ -17,6 +17,7 @@ class nextLevel(Command):
         if self.simulation.allHeroesDead:
             if self.campaign:
                 current_level_num = self.campaign._current_level_num
+                # Niveau préchargé pendant la partie, chemins des héros compris
                 next_level_instance = self.campaign.load_next_level()
 
                 if next_level_instance:
@@ -17,7 +17,7 @@ class removeEntity(Command):
             if not isinstance(entity_to_remove, Floor):
                 if hasattr(entity_to_remove, 'cost'):
                     self.simulation.current_budget += entity_to_remove.cost
-                cell.entity = Floor()
+                cell.remove_monster()
                 print(f"Entity removed from {self.coord} and budget refunded.")
                 # Notifier les observers (WebSocket) pour rafraîchir l'affichage
                 self.simulation.notify()
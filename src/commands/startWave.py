@@ -1,13 +1,15 @@
 from .Command import Command
 from src.model.hero import Hero
 from src.simulation import Simulation
+from src.controller.wave_loop import WaveLoop
 
 
 class startWave(Command):
     def __init__(self, simulation):
         self.simulation : Simulation = simulation
 
-    def execute(self, game_controller):
+    def prepare(self) -> bool:
+        """Démarre la vague sans jouer de tick ; False si un héros n'a pas de chemin."""
         if not (self.simulation.isSimStarted):
             # Tentative de démarrage : calcule les chemins pour chaque héros.
             # Ne marque la simulation comme démarrée que si tous les héros ont un chemin.
@@ -29,4 +31,15 @@ class startWave(Command):
 
             # Tous les héros ont un chemin donc on peut démarrer
             self.simulation.isSimStarted = True
+        return True
+
+    def execute(self, game_controller):
+        if not self.prepare():
+            return False
+
+        # Avec une boucle de vague (serveur web), c'est elle qui joue les ticks
+        wave_loop = getattr(game_controller, "wave_loop", None)
+        if isinstance(wave_loop, WaveLoop):
+            wave_loop.start(self.simulation)
+            return True
         return self.simulation.step()
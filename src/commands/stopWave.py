@@ -1,4 +1,5 @@
 from .Command import Command
+from src.controller.wave_loop import WaveLoop
 
 
 class stopWave(Command):
@@ -8,6 +9,9 @@ class stopWave(Command):
         self.simulation = simulation
 
     def execute(self, game_controller):
+        wave_loop = getattr(game_controller, "wave_loop", None)
+        if isinstance(wave_loop, WaveLoop):
+            wave_loop.stop()
         try:
             self.simulation.stop()
         except Exception:
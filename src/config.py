@@ -1,3 +1,4 @@
 TOURBOUCLE_REVEIl_HERO = 1
 WIDTH = 20
-HEIGHT = 20
\ No newline at end of file
+HEIGHT = 20
+TICK_DELAY = 0.5
@@ -30,6 +30,8 @@ class GameController:
         self.simulation = simulation
         self.invoker = GameInvoker(self)
         self.campaign = campaign
+        # Boucle de vague asynchrone, fournie par le serveur web
+        self.wave_loop = None
 
     @property
     def dungeon(self) -> Any:
@@ -109,9 +111,9 @@ class GameController:
         self.invoker.push_command(command)
         self.invoker.execute()
 
-    def import_dungeon(self, filepath: str = "dungeon"):
-        """Importe le donjon depuis nom"""
-        command = importDungeon(filepath)
+    def import_dungeon(self, filepath: str = "dungeon", binary: Optional[bool] = None):
+        """Importe le donjon depuis nom (JSON ou binaire selon le fichier présent)"""
+        command = importDungeon(filepath, binary=binary)
         self.invoker.push_command(command)
         self.invoker.execute()
         imported_dungeon = command.result
@@ -133,7 +135,7 @@ class GameController:
             "Niveau": self.simulation.level.difficulty,
             "Temps": self.simulation.ticks,
             "Score": self.simulation.totalscore + self.simulation.score,
-            "Héros Vivants": len(self.simulation.level.get_alive_heroes()),
+            "Héros Vivants": self.simulation.level.get_nb_alive_heroes(),
             "Budget Actuel": self.simulation.current_budget,
         }
 
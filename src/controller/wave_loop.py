@@ -0,0 +1,119 @@
+"""Boucle de vague pilotée par le serveur (interface web).
+
+`Simulation.launch` bloque avec `time.sleep` et ne peut pas tourner dans le
+serveur asynchrone. `WaveLoop` joue la vague dans une tâche asyncio
+annulable, à un nombre de ticks par seconde réglable, et appelle
+``on_tick`` après chaque tick pour que les frames soient poussées aux
+clients. La vague peut être mise en pause, reprise, accélérée ou arrêtée.
+
+Les commandes `startWave` et `stopWave` démarrent et arrêtent la tâche
+quand le contrôleur de jeu expose une ``wave_loop``.
+
+Usage:
+    wave_loop = WaveLoop(on_tick=publish_frame)
+    wave_loop.start(simulation)    # depuis le thread de la boucle asyncio
+    wave_loop.set_speed(4)
+    wave_loop.pause()
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from src.config import TICK_DELAY
+
+DEFAULT_TICKS_PER_SECOND = 1 / TICK_DELAY
+MAX_TICKS_PER_SECOND = 60.0
+
+
+class WaveLoop:
+    """Tâche asyncio qui fait avancer une simulation à cadence fixe.
+
+    Attributes:
+        simulation: Simulation jouée par la tâche courante
+        ticks_per_second: Cadence de la vague
+        paused: True si la vague est en pause
+    """
+
+    def __init__(self, ticks_per_second: float = DEFAULT_TICKS_PER_SECOND,
+                 on_tick: Optional[Callable[[], None]] = None) -> None:
+        self.simulation = None
+        self.ticks_per_second = ticks_per_second
+        self.on_tick = on_tick
+        self.paused = False
+        self._resumed = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, simulation) -> None:
+        """Lance la vague de la simulation (sans effet si elle tourne déjà)."""
+        if self.running and simulation is self.simulation:
+            return
+        self.stop()
+        self.simulation = simulation
+        self.paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        simulation.running = True
+        self._task = asyncio.get_running_loop().create_task(self._run(simulation))
+
+    def stop(self) -> None:
+        """Annule la tâche en cours."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        if self.simulation is not None:
+            self.simulation.running = False
+
+    def pause(self) -> None:
+        if self.running:
+            self.paused = True
+            self._resumed.clear()
+
+    def resume(self) -> None:
+        if self.running:
+            self.paused = False
+            self._resumed.set()
+
+    def set_speed(self, ticks_per_second: float) -> None:
+        """Change la cadence, prise en compte dès le tick suivant.
+
+        Raises:
+            ValueError: Si la cadence n'est pas dans ]0, MAX_TICKS_PER_SECOND]
+        """
+        if not 0 < ticks_per_second <= MAX_TICKS_PER_SECOND:
+            raise ValueError(
+                f"ticks_per_second doit être dans ]0, {MAX_TICKS_PER_SECOND}]"
+            )
+        self.ticks_per_second = ticks_per_second
+
+    def state(self) -> Dict[str, Any]:
+        sim = self.simulation
+        return {
+            "running": self.running,
+            "paused": self.paused,
+            "ticks_per_second": self.ticks_per_second,
+            "ticks": sim.ticks if sim else 0,
+        }
+
+    async def _run(self, simulation) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while simulation.running and not (simulation.tresorReached or simulation.allHeroesDead):
+            if not self._resumed.is_set():
+                await self._resumed.wait()
+                next_tick = loop.time()
+
+            simulation.step()
+            if self.on_tick:
+                self.on_tick()
+
+            # Cadence fixe : le temps passé dans step() est décompté, sans
+            # rattrapage en rafale si la vague a pris du retard
+            next_tick = max(next_tick + 1 / self.ticks_per_second, loop.time())
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        simulation.running = False
@@ -0,0 +1,325 @@
+"""Génération procédurale et reproductible de donjons.
+
+Une même graine et les mêmes paramètres donnent toujours le même donjon.
+Trois styles de murs sont disponibles :
+
+- ``maze`` : labyrinthe parfait (parcours en profondeur), dont on abat des
+  murs au hasard tant que la proportion de murs dépasse ``wall_density`` ;
+- ``cave`` : remplissage aléatoire à ``wall_density`` lissé par automate
+  cellulaire (règle 4-5), qui donne des grottes aux bords irréguliers ;
+- ``rooms`` : salles rectangulaires reliées par des couloirs en L, creusées
+  jusqu'à ce qu'il reste au plus ``wall_density`` de murs.
+
+L'entrée et la sortie sont toujours reliées : si les murs les séparent, le
+chemin qui abat le moins de murs est creusé, puis réservé pour que les
+dragons (bloquants) n'y soient jamais placés. Les pièges et les bombes sont
+ensuite répartis sur le sol selon leurs densités (proportion de la grille).
+
+Les donjons produits s'écrivent au format de sauvegarde existant (JSON ou
+binaire selon l'extension) et se passent tels quels à
+`batch.evaluate_layouts` ou au banc de mesure (``--style``).
+
+Usage:
+    from src.generator import generate_dungeon, write_dungeon
+
+    dungeon = generate_dungeon(50, 50, seed=7, style="cave", trap_density=0.05)
+    write_dungeon(dungeon, "save/cave.json", level_id=1, current_budget=100)
+
+    python -m src.generator 50 50 --seed 7 --style rooms --output save/rooms.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.commands.exportDungeon import dungeon_to_dict
+from src.model.binary_save import BINARY_EXTENSION, write_binary_save
+from src.model.cell import Cell
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+
+STYLES = ("maze", "cave", "rooms")
+DEFAULT_WALL_DENSITY = 0.3
+DEFAULT_TRAP_DENSITY = 0.03
+DEFAULT_DRAGON_DENSITY = 0.01
+DEFAULT_BOMB_DENSITY = 0.01
+TRAP_DAMAGE = 10
+CAVE_SMOOTHING = 4
+
+Coord = Tuple[int, int]
+# 1 pour un mur, 0 pour du sol
+WallMap = List[List[int]]
+
+_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def _maze_walls(rows: int, cols: int, wall_density: float, rng: random.Random) -> WallMap:
+    walls = [[1] * cols for _ in range(rows)]
+    # Les nœuds du labyrinthe sont les cases de coordonnées paires
+    walls[0][0] = 0
+    stack = [(0, 0)]
+    while stack:
+        row, col = stack[-1]
+        neighbours = [
+            (row + 2 * dr, col + 2 * dc, row + dr, col + dc)
+            for dr, dc in _DIRECTIONS
+            if 0 <= row + 2 * dr < rows and 0 <= col + 2 * dc < cols
+            and walls[row + 2 * dr][col + 2 * dc]
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        nr, nc, wr, wc = rng.choice(neighbours)
+        walls[wr][wc] = 0
+        walls[nr][nc] = 0
+        stack.append((nr, nc))
+
+    # Tresse le labyrinthe jusqu'à la densité demandée
+    remaining = [(r, c) for r in range(rows) for c in range(cols) if walls[r][c]]
+    excess = len(remaining) - int(wall_density * rows * cols)
+    if excess > 0:
+        for r, c in rng.sample(remaining, excess):
+            walls[r][c] = 0
+    return walls
+
+
+def _cave_walls(rows: int, cols: int, wall_density: float, rng: random.Random) -> WallMap:
+    walls = [[1 if rng.random() < wall_density else 0 for _ in range(cols)] for _ in range(rows)]
+    for _ in range(CAVE_SMOOTHING):
+        # Somme des 3x3 voisins par sommes glissantes, l'extérieur comptant comme mur
+        padded = [[1] + row + [1] for row in walls]
+        border = [1] * (cols + 2)
+        horizontal = [
+            [a + b + c for a, b, c in zip(row, row[1:], row[2:])]
+            for row in [border] + padded + [border]
+        ]
+        walls = [
+            [1 if a + b + c >= 5 else 0 for a, b, c in zip(up, mid, down)]
+            for up, mid, down in zip(horizontal, horizontal[1:], horizontal[2:])
+        ]
+    return walls
+
+
+def _rooms_walls(rows: int, cols: int, wall_density: float, rng: random.Random) -> WallMap:
+    walls = [[1] * cols for _ in range(rows)]
+    target = (1 - wall_density) * rows * cols
+    floor = 0
+    max_side = max(3, min(rows, cols) // 4)
+    previous: Optional[Coord] = None
+
+    def carve(r: int, c: int) -> None:
+        nonlocal floor
+        if walls[r][c]:
+            walls[r][c] = 0
+            floor += 1
+
+    for _ in range(200 + rows * cols // 20):
+        if floor >= target:
+            break
+        height = min(rows, rng.randint(3, max_side))
+        width = min(cols, rng.randint(3, max_side))
+        top = rng.randrange(rows - height + 1)
+        left = rng.randrange(cols - width + 1)
+        for r in range(top, top + height):
+            for c in range(left, left + width):
+                carve(r, c)
+        center = (top + height // 2, left + width // 2)
+        if previous is not None:
+            # Couloir en L : d'abord horizontal, puis vertical
+            (r0, c0), (r1, c1) = previous, center
+            for c in range(min(c0, c1), max(c0, c1) + 1):
+                carve(r0, c)
+            for r in range(min(r0, r1), max(r0, r1) + 1):
+                carve(r, c1)
+        previous = center
+    return walls
+
+
+_STYLE_BUILDERS: Dict[str, Callable[[int, int, float, random.Random], WallMap]] = {
+    "maze": _maze_walls,
+    "cave": _cave_walls,
+    "rooms": _rooms_walls,
+}
+
+
+def _carve_path(walls: WallMap, entry: Coord, exit: Coord) -> List[Coord]:
+    """Creuse le chemin entrée → sortie qui abat le moins de murs et le retourne."""
+    rows, cols = len(walls), len(walls[0])
+    cost = {entry: 0}
+    parent: Dict[Coord, Coord] = {}
+    queue = deque([entry])
+    # Parcours 0-1 : entrer dans un mur coûte 1, dans du sol 0
+    while queue:
+        coord = queue.popleft()
+        if coord == exit:
+            break
+        row, col = coord
+        for dr, dc in _DIRECTIONS:
+            nr, nc = row + dr, col + dc
+            if not (0 <= nr < rows and 0 <= nc < cols):
+                continue
+            step = walls[nr][nc]
+            new_cost = cost[coord] + step
+            if new_cost < cost.get((nr, nc), new_cost + 1):
+                cost[(nr, nc)] = new_cost
+                parent[(nr, nc)] = coord
+                if step:
+                    queue.append((nr, nc))
+                else:
+                    queue.appendleft((nr, nc))
+
+    path = [exit]
+    while path[-1] != entry:
+        path.append(parent[path[-1]])
+    path.reverse()
+    for row, col in path:
+        walls[row][col] = 0
+    return path
+
+
+def _check_density(name: str, value: float) -> None:
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} doit être entre 0 et 1 (reçu {value})")
+
+
+def generate_dungeon(
+    rows: int,
+    cols: int,
+    seed: Optional[int] = None,
+    style: str = "cave",
+    wall_density: float = DEFAULT_WALL_DENSITY,
+    trap_density: float = DEFAULT_TRAP_DENSITY,
+    dragon_density: float = DEFAULT_DRAGON_DENSITY,
+    bomb_density: float = DEFAULT_BOMB_DENSITY,
+    entry: Coord = (0, 0),
+    exit: Optional[Coord] = None,
+    trap_damage: int = TRAP_DAMAGE,
+) -> Dungeon:
+    """Génère un donjon dont l'entrée et la sortie sont reliées.
+
+    Args:
+        rows, cols: Dimensions du donjon
+        seed: Graine du générateur (None : aléatoire)
+        style: ``maze``, ``cave`` ou ``rooms``
+        wall_density: Proportion de murs visée (approchée selon le style)
+        trap_density, dragon_density, bomb_density: Proportion de la grille
+            occupée par chaque type d'entité, dans la limite du sol disponible
+        entry: Entrée du donjon (défaut : coin haut gauche)
+        exit: Sortie du donjon (défaut : coin bas droit)
+        trap_damage: Dégâts des pièges
+
+    Raises:
+        ValueError: Style inconnu, densité hors de [0, 1], dimensions trop
+            petites, entrée ou sortie hors du donjon.
+    """
+    if style not in _STYLE_BUILDERS:
+        raise ValueError(f"Style inconnu : {style} (attendu : {', '.join(STYLES)})")
+    if rows < 1 or cols < 1 or rows * cols < 2:
+        raise ValueError(f"Dimensions trop petites : {rows}x{cols}")
+    for name, value in (("wall_density", wall_density), ("trap_density", trap_density),
+                        ("dragon_density", dragon_density), ("bomb_density", bomb_density)):
+        _check_density(name, value)
+    entry = tuple(entry)
+    exit = tuple(exit) if exit is not None else (rows - 1, cols - 1)
+    for coord in (entry, exit):
+        if not (0 <= coord[0] < rows and 0 <= coord[1] < cols):
+            raise ValueError(f"Coordonnées hors du donjon : {coord}")
+    if entry == exit:
+        raise ValueError("L'entrée et la sortie doivent être distinctes")
+
+    rng = random.Random(seed)
+    walls = _STYLE_BUILDERS[style](rows, cols, wall_density, rng)
+    reserved = set(_carve_path(walls, entry, exit))
+
+    total = rows * cols
+    free = [
+        (r, c) for r in range(rows) for c in range(cols)
+        if not walls[r][c] and (r, c) != entry and (r, c) != exit
+    ]
+    # Les dragons bloquent le passage : jamais sur le chemin réservé
+    dragon_spots = [coord for coord in free if coord not in reserved]
+    dragons = rng.sample(dragon_spots, min(len(dragon_spots), round(dragon_density * total)))
+    taken = set(dragons)
+    free = [coord for coord in free if coord not in taken]
+    rng.shuffle(free)
+    trap_count = min(len(free), round(trap_density * total))
+    traps = free[:trap_count]
+    bombs = free[trap_count:trap_count + round(bomb_density * total)]
+
+    makers: Dict[Coord, Callable[[], object]] = {}
+    for coord in dragons:
+        orientation = rng.choice("UDLR")
+        makers[coord] = lambda o=orientation: EntityFactory.create_dragon(orientation=o)
+    for coord in traps:
+        makers[coord] = lambda: EntityFactory.create_trap(damage=trap_damage)
+    for coord in bombs:
+        makers[coord] = EntityFactory.create_bombe
+
+    grid = []
+    for r in range(rows):
+        grid_row = []
+        for c in range(cols):
+            if walls[r][c]:
+                entity = EntityFactory.create_wall()
+            else:
+                entity = makers.get((r, c), EntityFactory.create_floor)()
+            entity.init_range((r, c))
+            grid_row.append(Cell((r, c), entity))
+        grid.append(grid_row)
+
+    dungeon = Dungeon(dimension=(rows, cols), entry=entry, exit=exit)
+    dungeon.grid = grid
+    return dungeon
+
+
+def generate_layouts(count: int, rows: int, cols: int, seed: int = 0, **options) -> List[Dungeon]:
+    """Génère ``count`` donjons de graines ``seed``, ``seed + 1``, ...
+
+    Les options sont celles de `generate_dungeon`. Le résultat se passe
+    directement à `batch.evaluate_layouts`.
+    """
+    return [generate_dungeon(rows, cols, seed=seed + i, **options) for i in range(count)]
+
+
+def write_dungeon(dungeon: Dungeon, path: str, level_id: int = 1, current_budget: int = 0) -> None:
+    """Écrit le donjon au format de sauvegarde (binaire si l'extension est ``.pcdb``)."""
+    if path.endswith(BINARY_EXTENSION):
+        write_binary_save(path, dungeon, level_id, current_budget)
+        return
+    with open(path, "w") as f:
+        json.dump(dungeon_to_dict(dungeon, level_id, current_budget), f, indent=2)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Dungeon Manager - dungeon generator")
+    parser.add_argument("rows", type=int, help="Number of rows")
+    parser.add_argument("cols", type=int, help="Number of columns")
+    parser.add_argument("--seed", type=int, default=None, help="Generator seed")
+    parser.add_argument("--style", choices=STYLES, default="cave", help="Wall layout style")
+    parser.add_argument("--walls", type=float, default=DEFAULT_WALL_DENSITY, help="Wall density")
+    parser.add_argument("--traps", type=float, default=DEFAULT_TRAP_DENSITY, help="Trap density")
+    parser.add_argument("--dragons", type=float, default=DEFAULT_DRAGON_DENSITY, help="Dragon density")
+    parser.add_argument("--bombs", type=float, default=DEFAULT_BOMB_DENSITY, help="Bomb density")
+    parser.add_argument("--level", type=int, default=1, help="Level id stored in the save")
+    parser.add_argument("--budget", type=int, default=0, help="Budget stored in the save")
+    parser.add_argument("--output", required=True, help="Save file (.json or .pcdb)")
+    args = parser.parse_args(argv)
+
+    try:
+        dungeon = generate_dungeon(
+            args.rows, args.cols, seed=args.seed, style=args.style,
+            wall_density=args.walls, trap_density=args.traps,
+            dragon_density=args.dragons, bomb_density=args.bombs,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    write_dungeon(dungeon, args.output, args.level, args.budget)
+    print(f"Dungeon generated to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Exécution headless d'une vague, sans affichage ni temporisation.
+
+Usage:
+    python -m src.headless --level 1
+    python -m src.headless --level 2 --save dungeon --max-ticks 500
+"""
+
+import argparse
+import json
+from typing import Optional
+
+from src.commands.importDungeon import dungeon_from_dict
+from src.model.binary_save import BINARY_EXTENSION, read_binary_save
+from src.model.campaign_manager import Campaign
+from src.model.level import Level
+from src.model.waveResult import waveResult
+from src.simulation import Simulation
+
+
+def load_save(level: Level, save_name: str, binary: bool = False) -> int:
+    """Remplace le donjon du niveau par celui d'une sauvegarde.
+
+    Returns:
+        Le budget courant enregistré dans la sauvegarde.
+    """
+    if binary:
+        dungeon, data = read_binary_save(f"./save/{save_name}{BINARY_EXTENSION}")
+    else:
+        with open(f"./save/{save_name}.json", "r") as f:
+            data = json.load(f)
+        dungeon = dungeon_from_dict(data)
+    level.set_dungeon(dungeon)
+    return data.get("current_budget", level.budget_tot)
+
+
+def run_wave(level: Level, current_budget: Optional[int] = None,
+             max_ticks: Optional[int] = None) -> waveResult:
+    """Joue une vague complète du niveau aussi vite que possible."""
+    simulation = Simulation(level, level.dungeon)
+    if current_budget is not None:
+        simulation.current_budget = current_budget
+    return simulation.run_headless(max_ticks=max_ticks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dungeon Manager - headless wave runner")
+    parser.add_argument("--campaign", default="campaign.json", help="Campaign file")
+    parser.add_argument("--level", type=int, default=1, help="Level id in the campaign")
+    parser.add_argument("--save", default=None, help="Save name in ./save/ (without .json)")
+    parser.add_argument("--binary", action="store_true", help="Read the binary save format")
+    parser.add_argument("--max-ticks", type=int, default=None, help="Upper bound on wave length")
+    args = parser.parse_args()
+
+    # Une seule vague : inutile de précharger le niveau suivant
+    campaign = Campaign(args.campaign, prefetch=False)
+    level = campaign.load_level(args.level)
+    if not level:
+        print(f"Error: Could not load level {args.level}.")
+        return
+
+    current_budget = load_save(level, args.save, args.binary) if args.save else None
+    result = run_wave(level, current_budget, args.max_ticks)
+    print(json.dumps(result.to_dict()))
+
+
+if __name__ == "__main__":
+    main()
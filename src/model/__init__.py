@@ -9,6 +9,7 @@ from .trap_creator import TrapCreator
 from .entity_factory import EntityFactory
 from .cell import Cell
 from .dungeon import Dungeon
+from .compact_dungeon import CompactDungeon
 
 __all__ = [
     "Entity",
@@ -22,4 +23,5 @@ __all__ = [
     "EntityFactory",
     "Cell",
     "Dungeon",
+    "CompactDungeon",
 ]
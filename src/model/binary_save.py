@@ -0,0 +1,159 @@
+"""Format de sauvegarde binaire compact pour les donjons.
+
+Le fichier contient un en-tête fixe suivi de trois tableaux à plat,
+indexés par ``row * cols + col`` :
+
+- le code de l'entité de chaque case (1 octet, cf. `compact_dungeon`)
+- l'orientation des dragons (1 octet)
+- les dégâts de chaque case (entier signé 32 bits, little-endian)
+
+Au chargement, le fichier est projeté en mémoire (`mmap`) et les tableaux
+sont recopiés en bloc : directement dans un `CompactDungeon`, ou case par
+case (seulement les cases non vides) dans un `Dungeon`.
+
+Usage:
+    from src.model.binary_save import write_binary_save, read_binary_save
+
+    write_binary_save("save/dungeon.pcdb", dungeon, level_id=1, current_budget=120)
+    dungeon, header = read_binary_save("save/dungeon.pcdb")
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Tuple
+
+from .compact_dungeon import (
+    BOMBE, DRAGON, FLOOR, ORIENTATION_CODES, ORIENTATIONS, TRAP, TYPE_CODES, WALL,
+    CompactDungeon,
+)
+from .dungeon import Dungeon
+from .entity_factory import EntityFactory
+
+BINARY_EXTENSION = ".pcdb"
+MAGIC = b"PCDB"
+FORMAT_VERSION = 1
+
+# magic, version, rows, cols, entry (r, c), exit (r, c), level_id, current_budget
+_HEADER = struct.Struct("<4sHIIIIIIii")
+
+
+def _damage_bytes(damage: array) -> bytes:
+    if sys.byteorder != "little":
+        damage = array("i", damage)
+        damage.byteswap()
+    return damage.tobytes()
+
+
+def _damage_array(buffer) -> array:
+    damage = array("i")
+    damage.frombytes(buffer)
+    if sys.byteorder != "little":
+        damage.byteswap()
+    return damage
+
+
+def write_binary_save(path: str, dungeon, level_id: int = 1, current_budget: int = 0) -> None:
+    """Écrit le donjon (Dungeon ou CompactDungeon) au format binaire."""
+    rows, cols = dungeon.dimension
+    if isinstance(dungeon, CompactDungeon):
+        types = dungeon.types.tobytes()
+        orientation = dungeon.orientation.tobytes()
+        damage = dungeon.damage
+    else:
+        types = bytearray(rows * cols)
+        orientation = bytearray(rows * cols)
+        damage = array("i", bytes(4 * rows * cols))
+        for row in dungeon.grid:
+            for cell in row:
+                entity = cell.entity
+                if entity is None:
+                    continue
+                index = cell.coord[0] * cols + cell.coord[1]
+                types[index] = TYPE_CODES.get(entity.type, FLOOR)
+                orientation[index] = ORIENTATION_CODES.get(getattr(entity, "orientation", ""), 0)
+                damage[index] = int(entity.damage)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, rows, cols,
+        dungeon.entry[0], dungeon.entry[1], dungeon.exit[0], dungeon.exit[1],
+        int(level_id), int(current_budget),
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(types)
+        f.write(orientation)
+        f.write(_damage_bytes(damage))
+
+
+def read_binary_save(path: str, compact: bool = False) -> Tuple[object, dict]:
+    """Charge une sauvegarde binaire.
+
+    Args:
+        path: Chemin du fichier
+        compact: Si True, retourne un `CompactDungeon` rempli en bloc
+
+    Returns:
+        (donjon, en-tête) où l'en-tête contient level_id et current_budget.
+
+    Raises:
+        ValueError: Si le fichier n'est pas une sauvegarde binaire valide
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"{path}: fichier trop court pour une sauvegarde binaire")
+        (magic, version, rows, cols, entry_r, entry_c,
+         exit_r, exit_c, level_id, current_budget) = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path}: format de sauvegarde binaire inconnu")
+
+        size = rows * cols
+        # Types et orientations (1 octet chacun), puis dégâts (4 octets) par case
+        expected = _HEADER.size + 6 * size
+        if len(mm) < expected:
+            raise ValueError(
+                f"{path}: sauvegarde binaire tronquée ({len(mm)} octets, "
+                f"{expected} attendus pour {rows}x{cols})"
+            )
+        view = memoryview(mm)
+        try:
+            offset = _HEADER.size
+            types = bytes(view[offset:offset + size])
+            offset += size
+            orientation = bytes(view[offset:offset + size])
+            offset += size
+            damage = _damage_array(view[offset:offset + 4 * size])
+        finally:
+            view.release()
+
+    dimension = (rows, cols)
+    entry = (entry_r, entry_c)
+    exit_ = (exit_r, exit_c)
+    if compact:
+        dungeon = CompactDungeon.from_buffers(dimension, entry, exit_, types, orientation, damage)
+    else:
+        dungeon = Dungeon(dimension=dimension, entry=entry, exit=exit_)
+        for index, code in enumerate(types):
+            if code != FLOOR:
+                dungeon.place_entity(
+                    _create_entity(code, damage[index], orientation[index]),
+                    divmod(index, cols),
+                )
+
+    header = {"level_id": level_id, "current_budget": current_budget}
+    return dungeon, header
+
+
+def _create_entity(code: int, damage: int, orientation: int):
+    if code == WALL:
+        return EntityFactory.create_wall()
+    if code == TRAP:
+        return EntityFactory.create_trap(damage=damage)
+    if code == DRAGON:
+        return EntityFactory.create_dragon(orientation=ORIENTATIONS[orientation] or "U", damage=damage)
+    if code == BOMBE:
+        return EntityFactory.create_bombe(damage=damage)
+    return EntityFactory.create_floor()
@@ -5,6 +5,11 @@ from .entity import Entity
 class Bombe(Entity):
     """Entité représentant une bombe."""
 
+    __slots__ = ("_damage", "range", "triggered")
+
+    # Déclenchement propre à chaque bombe
+    flyweight = False
+
     def __init__(self, damage: int = 40) -> None:
         self._damage = int(damage)
         self.range = []
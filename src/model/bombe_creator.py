@@ -7,10 +7,13 @@ from .bombe import Bombe
 class BombeCreator(EntityCreator):
     """Créateur concret pour fabriquer des entités Bombe."""
 
-    def factory_method(self) -> Bombe:
+    def factory_method(self, damage: int = 40) -> Bombe:
         """Crée et retourne une nouvelle instance de Bombe.
 
+        Args:
+            damage (int): Dégâts infligés par l'explosion.
+
         Returns:
-            Instance de Bombe avec damage par défaut à 50.
+            Instance de Bombe (damage par défaut à 40).
         """
-        return Bombe()
+        return Bombe(damage)
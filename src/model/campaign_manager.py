@@ -1,21 +1,66 @@
-"""Gestionnaire de campagne simplifié pour charger des niveaux."""
+"""Gestionnaire de campagne simplifié pour charger des niveaux.
+
+Les configurations des niveaux sont indexées par identifiant au chargement
+de la campagne ; un `Level` n'est construit (donjon, chemins des héros)
+qu'au moment où il est demandé.
+
+Pendant qu'un niveau est joué, le suivant est construit en arrière-plan,
+donjon et chemins des héros compris : `load_level` retourne alors le
+`Level` prêt. Les caches des stratégies de chemin, partagés par toute la
+partie, sont protégés par un verrou (cf. `path_strategies`). Un seul thread
+de préchargement sert toutes les campagnes du processus (une par session
+du serveur web). Un niveau préchargé ne sert qu'une fois, puisque la partie
+le modifie.
+
+Le donjon d'un niveau est celui de son ``dungeon_file`` (dans ./save/),
+lu une seule fois grâce au cache de `layout_cache` ; à défaut, une grille
+vide aux ``dimensions`` du niveau. Le niveau garde ce layout
+(`Level.layout`) : réinitialiser la simulation rétablit la sauvegarde au
+lieu de vider le donjon.
+"""
 
 import json
 import os
-from typing import Optional, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, List
 from .level import Level, LevelBuilder
 from .dungeon import Dungeon
 from .cell import Cell
-from .floor import Floor
+from .floor_creator import FloorCreator
+from .binary_save import BINARY_EXTENSION
+from .layout_cache import CompactLayout, LayoutCache, layout_cache as shared_layout_cache
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _shared_prefetch_executor() -> ThreadPoolExecutor:
+    """Thread de préchargement partagé par toutes les campagnes."""
+    global _prefetch_executor
+    with _prefetch_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="campaign-prefetch"
+            )
+        return _prefetch_executor
+
 
 class Campaign:
     """Gère le chargement des niveaux depuis campaign.json et la progression."""
 
-    def __init__(self, campaign_json_path: str = "campaign.json"):
+    def __init__(self, campaign_json_path: str = "campaign.json", prefetch: bool = True,
+                 layout_cache: Optional[LayoutCache] = None):
         self.campaign_json_path = campaign_json_path
+        self.layout_cache = layout_cache if layout_cache is not None else shared_layout_cache
         self._data = None
+        self._level_index: Dict[int, dict] = {}
         self._current_level_num = 0
         self._completed_levels: List[int] = []
+        self.prefetch_enabled = prefetch
+        # Numéro de niveau -> construction du niveau en cours ou terminée
+        self._prefetched: Dict[int, Future] = {}
+        self._prefetch_lock = threading.Lock()
         self._load_campaign_data()
 
     def _load_campaign_data(self) -> None:
@@ -25,47 +70,111 @@ class Campaign:
 
         with open(self.campaign_json_path, "r") as f:
             self._data = json.load(f)
+        # En cas de doublon, le premier niveau d'un identifiant l'emporte
+        self._level_index = {}
+        for level in self._data.get("levels", []):
+            self._level_index.setdefault(level.get("id"), level)
 
     def _get_level_config(self, level_num: int) -> Optional[dict]:
         """Retourne la configuration d'un niveau par son numéro."""
-        if not self._data:
-            return None
+        return self._level_index.get(level_num)
 
-        for level in self._data.get("levels", []):
-            if level.get("id") == level_num:
-                return level
-        return None
+    def _load_layout(self, config: dict) -> Optional[CompactLayout]:
+        """Layout du donjon prédéfini du niveau dans ./save/ (JSON, sinon binaire).
 
-    def _load_dungeon(self, dungeon_file: str) -> Optional[Dungeon]:
-        """Charge un donjon depuis un fichier JSON."""
-        dungeon_path = f"./save/{dungeon_file}.json"
-        
-        if not os.path.exists(dungeon_path):
+        Le fichier n'est relu que s'il a changé depuis le dernier chargement.
+        """
+        dungeon_file = config.get("dungeon_file")
+        if not dungeon_file:
             return None
-
-        from ..commands.importDungeon import importDungeon
-        
-        cmd = importDungeon(dungeon_file)
-        cmd.execute(None)
-        return cmd.result
+        for extension in (".json", BINARY_EXTENSION):
+            layout = self.layout_cache.get(f"./save/{dungeon_file}{extension}")
+            if layout is not None:
+                return layout
+        return None
 
     def load_level(self, level_num: int) -> Optional[Level]:
-        """Charge un niveau par son numéro et retourne un objet Level."""
+        """Charge un niveau par son numéro et retourne un objet Level.
+
+        Le niveau préchargé est retourné s'il existe ; le niveau suivant est
+        ensuite préchargé en arrière-plan.
+        """
         config = self._get_level_config(level_num)
         if not config:
             return None
 
-        dimension = (config.get("dimensions")["width"], config.get("dimensions")["height"])
-        entry = (config.get("entry")["row"], config.get("entry")["col"])
-        exit_ = (config.get("exit")["row"], config.get("exit")["col"])
+        level = self._take_prefetched(level_num)
+        if level is None:
+            level = self._build_level(config)
+
+        self._current_level_num = level_num
+        self.prefetch(level_num + 1)
+        return level
 
-        dungeon = Dungeon(
-            dimension=dimension,
-            grid=[[Cell((r, c), Floor()) for c in range(dimension[1])] for r in range(dimension[0])],
-            entry = entry,
-            exit = exit_,
-        )
+    def prefetch(self, level_num: int) -> None:
+        """Construit le niveau en arrière-plan, en remplaçant le précédent préchargement."""
+        if not self.prefetch_enabled:
+            return
+        config = self._get_level_config(level_num)
+        if not config:
+            return
+        with self._prefetch_lock:
+            if level_num in self._prefetched:
+                return
+            self._cancel_prefetch()
+            self._prefetched[level_num] = _shared_prefetch_executor().submit(self._build_level, config)
+
+    def is_prefetched(self, level_num: int) -> bool:
+        """Indique si le niveau a été préchargé et est prêt."""
+        future = self._prefetched.get(level_num)
+        return future is not None and future.done() and future.exception() is None
+
+    def _take_prefetched(self, level_num: int) -> Optional[Level]:
+        """Retire et retourne le niveau préchargé (en attendant la fin de sa construction)."""
+        with self._prefetch_lock:
+            future = self._prefetched.pop(level_num, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # La construction synchrone donnera l'erreur à l'appelant
+            return None
 
+    def _cancel_prefetch(self) -> None:
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+
+    def close(self) -> None:
+        """Abandonne les préchargements de la campagne (le thread partagé reste disponible)."""
+        with self._prefetch_lock:
+            self._cancel_prefetch()
+
+    def _build_dungeon(self, config: dict, layout: Optional[CompactLayout] = None) -> Dungeon:
+        """Construit le donjon décrit par une configuration (sans toucher aux chemins)."""
+        if layout is None:
+            layout = self._load_layout(config)
+        if layout is not None:
+            dungeon, _ = layout.build()
+        else:
+            # Pas de donjon prédéfini : grille vide aux dimensions du niveau
+            dimension = (config.get("dimensions")["width"], config.get("dimensions")["height"])
+            entry = (config.get("entry")["row"], config.get("entry")["col"])
+            exit_ = (config.get("exit")["row"], config.get("exit")["col"])
+
+            dungeon = Dungeon(
+                dimension=dimension,
+                grid=[[Cell((r, c), FloorCreator().build()) for c in range(dimension[1])] for r in range(dimension[0])],
+                entry = entry,
+                exit = exit_,
+            )
+        return dungeon
+
+    def _build_level(self, config: dict) -> Level:
+        """Construit le niveau décrit par une configuration, chemins des héros compris."""
+        layout = self._load_layout(config)
+        dungeon = self._build_dungeon(config, layout)
 
         builder = LevelBuilder()
         builder.set_dungeon(dungeon)
@@ -77,8 +186,11 @@ class Campaign:
             strategy = hero_config.get("strategy", "shortest")
             builder.add_hero(pv=pv, strategy=strategy)
 
-        self._current_level_num = level_num
-        return builder.build()
+        level = builder.build()
+        if layout is not None:
+            # Réinitialiser la simulation rétablit le donjon sauvegardé
+            level.attach_layout(layout)
+        return level
 
     def load_next_level(self) -> Optional[Level]:
         """Charge le niveau suivant à partir du niveau actuel."""
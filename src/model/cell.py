@@ -14,10 +14,10 @@ class Cell:
     Attributes:
         coord : tuple(int, int): Coordonnées (ligne, colonne) de la case
         entity : Abstract class (wall, monster, trap, floor)
+        dungeon : Donjon propriétaire de la case (None si la case est isolée)
     """
     
-    # Symboles pour l'affichage terminal
-
+    __slots__ = ("coord", "entity", "dungeon")
     
     def __init__(self, coord: tuple[int,int], entity: Optional[Entity] = None):   
         """
@@ -25,6 +25,7 @@ class Cell:
         """    
         self.coord = coord
         self.entity = entity
+        self.dungeon = None
     
     @property
     def position(self) -> tuple[int, int]:
@@ -63,7 +64,11 @@ class Cell:
     
     def return_damage_if_CD(self) :
         if self.entity.current_cooldown == 0 :
+            if self.dungeon is not None:
+                self.dungeon.preserve(self)
             self.entity.triggered = True
+            if self.dungeon is not None:
+                self.dungeon.activate(self)
             return self.get_damage()
         else:
             return 0
@@ -71,12 +76,16 @@ class Cell:
     def remove_monster(self) -> None:
         """
         Retire le monstre de cette case, en le remplaçant par un floor.
+
+        Si la case appartient à un donjon, le remplacement passe par
+        `Dungeon.place_entity` afin de garder l'index des menaces à jour.
         """
         from .floor_creator import FloorCreator
-        
 
-
-        self.entity = FloorCreator().build()
+        if self.dungeon is not None:
+            self.dungeon.place_entity(FloorCreator().build(), self.coord)
+        else:
+            self.entity = FloorCreator().build()
 
     def update(self) -> None : 
         """Met à jour l'état de la cellule en mettant à jour son entité."""
@@ -0,0 +1,444 @@
+"""Backend compact du donjon, stocké dans des tableaux typés.
+
+`CompactDungeon` expose la même interface que `Dungeon` mais ne garde ni
+`Cell` ni `Entity` par case : le type d'entité, les dégâts, le cooldown,
+l'état déclenché et l'orientation de chaque case vivent dans des
+`array.array` à plat, indexés par ``row * cols + col``.
+
+`get_cell` retourne une `CellView` légère sur ces tableaux, et `validMove`
+devient une simple lecture d'index. Les entités renvoyées par
+`CellView.entity` sont reconstruites à la demande : ce sont des copies en
+lecture seule, l'état de jeu (cooldown, déclenchement) est modifié
+directement dans les tableaux par `CellView.return_damage_if_CD` et
+`CompactDungeon.update`.
+
+Comme `Dungeon`, le backend compact prend des snapshots en copie sur
+écriture (`CompactDungeonSnapshot`) : seules les cases modifiées après le
+snapshot voient leurs valeurs recopiées depuis les tableaux.
+
+Usage:
+    from src.model.compact_dungeon import CompactDungeon
+
+    dungeon = CompactDungeon((200, 200), entry=(0, 0), exit=(199, 199))
+    compact = CompactDungeon.from_dungeon(existing_dungeon)
+"""
+
+from __future__ import annotations
+
+import weakref
+from array import array
+from collections import deque
+from typing import Optional
+
+from .bombe import Bombe
+from .cell import Cell
+from .dungeon import CHANGE_LOG_SIZE
+from .dragon import Dragon
+from .entity import Entity
+from .floor import Floor
+from .floor_creator import FloorCreator
+from .trap import Trap
+from .trap_creator import TrapCreator
+from .wall import Wall
+from .wall_creator import WallCreator
+
+# Codes d'entité stockés dans `CompactDungeon.types`
+FLOOR, WALL, TRAP, DRAGON, BOMBE = range(5)
+
+TYPE_CODES = {"FLOOR": FLOOR, "WALL": WALL, "TRAP": TRAP, "DRAGON": DRAGON, "BOMBE": BOMBE}
+ORIENTATIONS = ("", "U", "D", "L", "R")
+ORIENTATION_CODES = {o: i for i, o in enumerate(ORIENTATIONS)}
+
+# Cases qui bloquent le passage des héros (cf. Dungeon.is_Walkable)
+BLOCKING = frozenset((WALL, DRAGON))
+
+_DRAGON_MAX_COOLDOWN = Dragon("U").max_cooldown
+
+
+class CellView:
+    """Vue légère sur une case d'un `CompactDungeon`.
+
+    Reproduit l'interface de `Cell` utilisée par la simulation, les
+    stratégies de chemin et les interfaces.
+    """
+
+    __slots__ = ("dungeon", "index", "coord")
+
+    def __init__(self, dungeon: CompactDungeon, index: int, coord: tuple[int, int]):
+        self.dungeon = dungeon
+        self.index = index
+        self.coord = coord
+
+    @property
+    def position(self) -> tuple[int, int]:
+        """Retourne la position (row, col)"""
+        return self.coord
+
+    @property
+    def entity(self) -> Entity:
+        """Reconstruit l'entité de la case (copie en lecture seule)."""
+        return self.dungeon.entity_at(self.index)
+
+    @entity.setter
+    def entity(self, entity: Optional[Entity]) -> None:
+        self.dungeon.place_entity(entity if entity is not None else FloorCreator().build(), self.coord)
+
+    def is_walkable(self) -> bool:
+        return self.dungeon.types[self.index] != WALL
+
+    def is_dangerous(self) -> bool:
+        return self.dungeon.damage[self.index] > 0
+
+    def get_damage(self) -> int:
+        return self.dungeon.damage[self.index]
+
+    def return_damage_if_CD(self) -> int:
+        dungeon = self.dungeon
+        if dungeon.cooldown[self.index] == 0:
+            dungeon.preserve(self.index)
+            dungeon.triggered[self.index] = 1
+            dungeon.active.add(self.index)
+            return dungeon.damage[self.index]
+        return 0
+
+    def remove_monster(self) -> None:
+        """Remplace l'entité de la case par un sol."""
+        self.dungeon.place_entity(FloorCreator().build(), self.coord)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, CellView)
+            and other.dungeon is self.dungeon
+            and other.index == self.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.dungeon), self.index))
+
+    def __repr__(self) -> str:
+        ent = self.entity.type
+        return f"CellView({self.coord[0]}, {self.coord[1]}, {ent})"
+
+
+class CompactDungeonSnapshot:
+    """État d'un `CompactDungeon` à un instant donné, en copie sur écriture.
+
+    Attributes:
+        dungeon: Donjon d'origine
+        arrays: Tableaux du donjon au moment du snapshot (types, damage,
+            cooldown, triggered, orientation)
+        version: Version du donjon au moment du snapshot
+        cells: Index des cases modifiées depuis, avec leurs valeurs d'origine
+            dans chaque tableau
+    """
+
+    def __init__(self, dungeon: CompactDungeon) -> None:
+        self.dungeon = dungeon
+        self.arrays = dungeon._arrays()
+        self.version = dungeon.version
+        self.cells: dict[int, tuple[int, int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+
+class CompactDungeon:
+    """Donjon dont la grille est stockée dans des tableaux typés à plat.
+
+    Attributes:
+        dimension : tuple(int, int): Dimensions du donjon (lignes, colonnes)
+        entry : tuple(int, int): Coordonnées de l'entrée du donjon
+        exit : tuple(int, int): Coordonnées de la sortie du donjon
+        types, damage, cooldown, triggered, orientation : array: Etat de
+            chaque case, indexé par ``row * cols + col``
+        blocking : bytearray: 1 si la case est infranchissable
+        threat_index : dict[tuple(int, int), list[int]]: Index inverse
+            associant chaque coordonnée aux indices des cases qui la menacent
+        active : set[int]: Indices des cases en cooldown ou déclenchées, seules
+            visitées par `update`
+        version : int: Compteur incrémenté à chaque modification de la grille
+        change_log : deque[tuple(int, tuple(int, int))]: Dernières cases modifiées
+    """
+
+    def __init__(
+        self,
+        dimension: tuple[int, int],
+        entry: tuple[int, int],
+        exit: tuple[int, int],
+        grid: list[list[Cell]] = None,
+    ):
+        self.dimension = dimension
+        self.entry = entry
+        self.exit = exit
+        self.version = 0
+        self.change_log: deque = deque(maxlen=CHANGE_LOG_SIZE)
+        self.threat_index: dict[tuple[int, int], list[int]] = {}
+        self._snapshots: weakref.WeakSet = weakref.WeakSet()
+        self._clear_arrays()
+        if grid is not None:
+            self.grid = grid
+
+    def __getstate__(self) -> dict:
+        # Les snapshots ouverts (références faibles) ne se sérialisent pas
+        state = self.__dict__.copy()
+        del state["_snapshots"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._snapshots = weakref.WeakSet()
+
+    @classmethod
+    def from_dungeon(cls, dungeon) -> CompactDungeon:
+        """Construit un donjon compact équivalent à un `Dungeon` existant."""
+        return cls(dungeon.dimension, dungeon.entry, dungeon.exit, dungeon.grid)
+
+    @classmethod
+    def from_buffers(cls, dimension, entry, exit, types, orientation, damage) -> CompactDungeon:
+        """Construit un donjon compact en bloc à partir de tableaux à plat.
+
+        Args:
+            types, orientation: Octets (codes d'entité et d'orientation)
+            damage: array('i') des dégâts de chaque case
+        """
+        dungeon = cls(dimension, entry, exit)
+        dungeon.types = array("b", types)
+        dungeon.orientation = array("b", orientation)
+        dungeon.damage = array("i", damage)
+        dungeon.blocking = bytearray(code in BLOCKING for code in dungeon.types)
+        dungeon.rebuild_threat_index()
+        dungeon.version += 1
+        return dungeon
+
+    def _clear_arrays(self) -> None:
+        size = self.dimension[0] * self.dimension[1]
+        self.types = array("b", bytes(size))
+        self.damage = array("i", bytes(4 * size))
+        self.cooldown = array("b", bytes(size))
+        self.triggered = array("b", bytes(size))
+        self.orientation = array("b", bytes(size))
+        self.blocking = bytearray(size)
+        self.active: set[int] = set()
+
+    def _arrays(self) -> tuple[array, ...]:
+        return (self.types, self.damage, self.cooldown, self.triggered, self.orientation)
+
+    def _index(self, coord: tuple[int, int]) -> int:
+        return coord[0] * self.dimension[1] + coord[1]
+
+    def _coord(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.dimension[1])
+
+    @property
+    def grid(self) -> list[list[CellView]]:
+        """Grille 2D de vues, construite à la demande (affichage, export)."""
+        rows, cols = self.dimension
+        return [
+            [CellView(self, r * cols + c, (r, c)) for c in range(cols)]
+            for r in range(rows)
+        ]
+
+    @grid.setter
+    def grid(self, grid) -> None:
+        """Recopie une grille de `Cell` dans les tableaux."""
+        self._clear_arrays()
+        self.threat_index = {}
+        for row in grid:
+            for cell in row:
+                if cell.entity is not None:
+                    self._store(cell.entity, cell.coord)
+        self.version += 1
+        self.change_log.clear()
+
+    def get_cell(self, coord: tuple[int, int]) -> CellView:
+        """Retourne une vue sur la case aux coordonnées spécifiées."""
+        return CellView(self, self._index(coord), coord)
+
+    def entity_at(self, index: int) -> Entity:
+        """Reconstruit l'entité stockée à l'index donné."""
+        code = self.types[index]
+        if code == FLOOR:
+            damage = self.damage[index]
+            return Floor(damage) if damage else FloorCreator().build()
+        if code == WALL:
+            return WallCreator().build()
+        if code == TRAP:
+            return TrapCreator(self.damage[index]).build()
+        coord = self._coord(index)
+        if code == DRAGON:
+            entity = Dragon(ORIENTATIONS[self.orientation[index]], self.damage[index])
+            entity.current_cooldown = self.cooldown[index]
+        else:
+            entity = Bombe(self.damage[index])
+        entity.triggered = bool(self.triggered[index])
+        entity.init_range(coord)
+        return entity
+
+    def is_within_bounds(self, coord: tuple[int, int]) -> bool:
+        """Vérifie si les coordonnées sont dans les limites du donjon."""
+        row, col = coord
+        return 0 <= row < self.dimension[0] and 0 <= col < self.dimension[1]
+
+    def is_Walkable(self, coord: tuple[int, int]) -> bool:
+        return not self.blocking[self._index(coord)]
+
+    def validMove(self, coord) -> bool:
+        row, col = coord
+        rows, cols = self.dimension
+        return 0 <= row < rows and 0 <= col < cols and not self.blocking[row * cols + col]
+
+    def place_entity(self, entity: Entity, position: tuple[int, int]) -> None:
+        """Place une entité à la position spécifiée dans le donjon."""
+        if self.is_within_bounds(position):
+            self._unindex_threats(self._index(position))
+            self._store(entity, position)
+            self.version += 1
+            self.change_log.append((self.version, position))
+
+    def _store(self, entity: Entity, position: tuple[int, int]) -> None:
+        index = self._index(position)
+        self.preserve(index)
+        code = TYPE_CODES.get(entity.type, FLOOR)
+        self.types[index] = code
+        self.damage[index] = int(entity.damage or entity.attack_power)
+        self.cooldown[index] = int(getattr(entity, "current_cooldown", 0))
+        self.triggered[index] = int(bool(getattr(entity, "triggered", False)))
+        self.orientation[index] = ORIENTATION_CODES.get(getattr(entity, "orientation", ""), 0)
+        self.blocking[index] = code in BLOCKING
+        self._index_threats(index)
+        if self.cooldown[index] > 0 or self.triggered[index]:
+            self.active.add(index)
+        else:
+            self.active.discard(index)
+
+    def _range_of(self, index: int) -> list[tuple[int, int]]:
+        if self.types[index] in (DRAGON, BOMBE):
+            return self.entity_at(index).getrange()
+        return []
+
+    def _index_threats(self, index: int) -> None:
+        for coord in self._range_of(index):
+            self.threat_index.setdefault(coord, []).append(index)
+
+    def _unindex_threats(self, index: int) -> None:
+        for coord in self._range_of(index):
+            sources = self.threat_index.get(coord)
+            if sources is None:
+                continue
+            if index in sources:
+                sources.remove(index)
+            if not sources:
+                del self.threat_index[coord]
+
+    def threats_at(self, coord: tuple[int, int]) -> list[CellView]:
+        """Retourne les cases dont l'entité menace la coordonnée donnée."""
+        return [
+            CellView(self, index, self._coord(index))
+            for index in self.threat_index.get(coord, [])
+        ]
+
+    def rebuild_threat_index(self) -> None:
+        """Reconstruit entièrement l'index des menaces à partir des tableaux."""
+        self.threat_index = {}
+        for index in range(len(self.types)):
+            self._index_threats(index)
+
+    def reset(self) -> None:
+        """Réinitialise le donjon en vidant toutes les cases de leurs entités."""
+        self._clear_arrays()
+        self.threat_index = {}
+        self.version += 1
+        self.change_log.clear()
+
+    def snapshot(self) -> CompactDungeonSnapshot:
+        """Capture l'état courant ; les cases ne sont recopiées qu'à leur modification."""
+        snapshot = CompactDungeonSnapshot(self)
+        self._snapshots.add(snapshot)
+        return snapshot
+
+    def release(self, snapshot: CompactDungeonSnapshot) -> None:
+        """Abandonne un snapshot : les modifications ne lui sont plus recopiées."""
+        self._snapshots.discard(snapshot)
+
+    def preserve(self, index: int) -> None:
+        """Recopie les valeurs de la case dans les snapshots ouverts avant sa modification."""
+        if not self._snapshots:
+            return
+        for snapshot in self._snapshots:
+            if snapshot.arrays[0] is self.types and index not in snapshot.cells:
+                snapshot.cells[index] = tuple(values[index] for values in snapshot.arrays)
+
+    def restore(self, snapshot: CompactDungeonSnapshot) -> None:
+        """Ramène le donjon à l'état du snapshot, qui reste utilisable (cf. `Dungeon.restore`)."""
+        if snapshot.dungeon is not self:
+            raise ValueError("Ce snapshot appartient à un autre donjon")
+        current = snapshot.arrays[0] is self.types
+        for index, values in snapshot.cells.items():
+            if current:
+                self.preserve(index)
+                self._unindex_threats(index)
+            for array_, value in zip(snapshot.arrays, values):
+                array_[index] = value
+            if current:
+                self._restored(index)
+                self.version += 1
+                self.change_log.append((self.version, self._coord(index)))
+        snapshot.cells.clear()
+        if not current:
+            # Les tableaux ont été remplacés depuis (reset) : on reprend les anciens
+            self.types, self.damage, self.cooldown, self.triggered, self.orientation = snapshot.arrays
+            self.blocking = bytearray(code in BLOCKING for code in self.types)
+            self.active = set()
+            self.rebuild_threat_index()
+            for index in range(len(self.types)):
+                if self.cooldown[index] > 0 or self.triggered[index]:
+                    self.active.add(index)
+            self.version += 1
+            self.change_log.clear()
+        self._snapshots.add(snapshot)
+
+    def _restored(self, index: int) -> None:
+        """Remet à jour les index dérivés d'une case dont les valeurs ont été rétablies."""
+        self.blocking[index] = self.types[index] in BLOCKING
+        self._index_threats(index)
+        if self.cooldown[index] > 0 or self.triggered[index]:
+            self.active.add(index)
+        else:
+            self.active.discard(index)
+
+    def changes_since(self, version: int) -> Optional[list[tuple[int, int]]]:
+        """Retourne les cases modifiées depuis la version donnée (cf. Dungeon)."""
+        if version == self.version:
+            return []
+        if not self.change_log or self.change_log[0][0] > version + 1:
+            return None
+        return [coord for v, coord in self.change_log if v > version]
+
+    def update(self) -> None:
+        """Met à jour les dragons (cooldown) et fait exploser les bombes déclenchées.
+
+        Seuls les indices de `active` sont visités ; ceux qui redeviennent
+        inactifs en sont retirés.
+        """
+        types = self.types
+        cooldown = self.cooldown
+        triggered = self.triggered
+        for index in sorted(self.active):
+            self.preserve(index)
+            code = types[index]
+            if code == DRAGON:
+                if cooldown[index] == 0:
+                    if triggered[index]:
+                        triggered[index] = 0
+                        cooldown[index] = _DRAGON_MAX_COOLDOWN
+                else:
+                    cooldown[index] -= 1
+            elif code == BOMBE and triggered[index]:
+                self.place_entity(FloorCreator().build(), self._coord(index))
+            if cooldown[index] == 0 and not triggered[index]:
+                self.active.discard(index)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactDungeon(dimension={self.dimension}, entry={self.entry}, exit={self.exit})"
+        )
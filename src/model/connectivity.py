@@ -0,0 +1,88 @@
+"""Suivi incrémental de la connexion entre l'entrée et la sortie d'un donjon.
+
+`ReachabilityTracker` garde en cache l'ensemble des cases atteignables
+depuis l'entrée. Il se met à jour à partir de `Dungeon.changes_since`
+après chaque placement :
+
+- une case qui redevient franchissable et touche la zone atteignable
+  étend la zone par un parcours limité aux nouvelles cases ;
+- une case atteignable qui devient bloquante force un nouveau parcours ;
+- les autres modifications ne coûtent rien.
+
+La question « l'entrée et la sortie sont-elles connectées ? » est ensuite
+une simple appartenance à un ensemble.
+"""
+
+from __future__ import annotations
+
+from typing import Set, Tuple
+
+_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+class ReachabilityTracker:
+    """Ensemble des cases atteignables depuis l'entrée d'un donjon.
+
+    Attributes:
+        dungeon: Donjon suivi
+        reachable: Cases atteignables depuis l'entrée
+        version: Version du donjon prise en compte
+    """
+
+    def __init__(self, dungeon) -> None:
+        self.dungeon = dungeon
+        self.reachable: Set[Tuple[int, int]] = set()
+        self.version = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recalcule entièrement la zone atteignable."""
+        self.reachable = {self.dungeon.entry}
+        self._flood([self.dungeon.entry])
+        self.version = self.dungeon.version
+
+    def _flood(self, frontier) -> None:
+        dungeon = self.dungeon
+        reachable = self.reachable
+        while frontier:
+            next_frontier = []
+            for row, col in frontier:
+                for d_row, d_col in _DIRECTIONS:
+                    neighbor = (row + d_row, col + d_col)
+                    if neighbor not in reachable and dungeon.validMove(neighbor):
+                        reachable.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+    def sync(self) -> None:
+        """Prend en compte les modifications du donjon depuis le dernier appel."""
+        if self.version == self.dungeon.version:
+            return
+        changes = self.dungeon.changes_since(self.version)
+        if changes is None:
+            self.rebuild()
+            return
+
+        for coord in changes:
+            if self.dungeon.validMove(coord):
+                if coord in self.reachable:
+                    continue
+                row, col = coord
+                if any((row + d_row, col + d_col) in self.reachable
+                       for d_row, d_col in _DIRECTIONS):
+                    self.reachable.add(coord)
+                    self._flood([coord])
+            elif coord in self.reachable and coord != self.dungeon.entry:
+                # Une case de la zone est bloquée : la zone peut s'être scindée
+                self.rebuild()
+                return
+        self.version = self.dungeon.version
+
+    def is_reachable(self, coord: Tuple[int, int]) -> bool:
+        """Indique si la case est atteignable depuis l'entrée."""
+        self.sync()
+        return coord in self.reachable
+
+    def is_connected(self) -> bool:
+        """Indique si la sortie est atteignable depuis l'entrée."""
+        return self.is_reachable(self.dungeon.exit)
@@ -6,6 +6,11 @@ HEIGHT = 20
 class Dragon(Entity):
     """Entité représentant un dragon."""
 
+    __slots__ = ("_damage", "orientation", "current_cooldown", "range", "triggered")
+
+    # Cooldown et déclenchement propres à chaque dragon
+    flyweight = False
+
     def __init__(self, orientation : str,damage: int = 30) -> None:
         self._damage = int(damage)
         self.orientation = orientation
@@ -7,13 +7,14 @@ from .dragon import Dragon
 class DragonCreator(EntityCreator):
     """Créateur concret pour fabriquer des entités Dragon."""
 
-    def factory_method(self, orientation: str) -> Dragon:
+    def factory_method(self, orientation: str, damage: int = 30) -> Dragon:
         """Crée et retourne une nouvelle instance de Dragon.
 
         Args:
             orientation (str): Orientation du dragon ('R', 'L', 'U', 'D').
+            damage (int): Dégâts infligés par le dragon.
 
         Returns:
             Instance de Dragon.
         """
-        return Dragon(orientation)
+        return Dragon(orientation, damage)
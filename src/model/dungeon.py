@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import weakref
+from collections import deque
+from typing import Optional
+
 from .floor import Floor
 from .wall import Wall
 from .dragon import Dragon
@@ -8,6 +12,51 @@ from .floor_creator import FloorCreator
 
 from .cell import Cell
 
+# Nombre de modifications mémorisées pour la réparation incrémentale des chemins
+CHANGE_LOG_SIZE = 1024
+
+
+def _entity_state(entity: Entity) -> tuple[int, bool]:
+    """État mutable d'une entité : cooldown courant et déclenchement."""
+    if entity is None:
+        return (0, False)
+    return (entity.current_cooldown, bool(getattr(entity, "triggered", False)))
+
+
+def _restore_entity_state(entity: Entity, state: tuple[int, bool]) -> None:
+    if entity is None:
+        return
+    cooldown, triggered = state
+    if entity.current_cooldown != cooldown:
+        entity.current_cooldown = cooldown
+    if bool(getattr(entity, "triggered", False)) != triggered:
+        entity.triggered = triggered
+
+
+class DungeonSnapshot:
+    """État d'un donjon à un instant donné, en copie sur écriture.
+
+    Le snapshot partage la grille avec le donjon : seules les cellules
+    modifiées après sa création sont recopiées (entité et état mutable),
+    la première fois qu'elles sont touchées. Son coût est donc celui des
+    cases modifiées, pas celui de la grille.
+
+    Attributes:
+        dungeon: Donjon d'origine
+        grid: Grille du donjon au moment du snapshot
+        version: Version du donjon au moment du snapshot
+        cells: Cellules modifiées depuis, avec leur entité et son état d'origine
+    """
+
+    def __init__(self, dungeon: Dungeon) -> None:
+        self.dungeon = dungeon
+        self.grid = dungeon.grid
+        self.version = dungeon.version
+        self.cells: dict[Cell, tuple[Entity, tuple[int, bool]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
 
 class Dungeon:
     """
@@ -18,6 +67,13 @@ class Dungeon:
         grid : list[list[Cell]]: Grille 2D de cellules du donjon
         entry : tuple(int, int): Coordonnées de l'entrée du donjon
         exit : tuple(int, int): Coordonnées de la sortie du donjon
+        threat_index : dict[tuple(int, int), list[Cell]]: Index inverse associant
+            chaque coordonnée aux cellules dont l'entité la menace (portée)
+        version : int: Compteur incrémenté à chaque modification de la grille
+        change_log : deque[tuple(int, tuple(int, int))]: Dernières cases
+            modifiées, associées à la version produite par la modification
+        active_cells : set[Cell]: Cellules dont l'entité a un cooldown en cours
+            ou a été déclenchée, seules mises à jour à chaque tick
     """
 
     def __init__(
@@ -32,19 +88,58 @@ class Dungeon:
         Initialise un donjon avec des dimensions, une grille de cellules, une entrée et une sortie.
         """
         self.dimension = dimension
-        self.grid = grid
+        self.version = 0
+        self.change_log: deque = deque(maxlen=CHANGE_LOG_SIZE)
+        self.threat_index: dict[tuple[int, int], list[Cell]] = {}
+        self.active_cells: set[Cell] = set()
+        self._snapshots: weakref.WeakSet = weakref.WeakSet()
+        self._grid: list[list[Cell]] = []
         self.entry = entry
         self.exit = exit
-        if self.grid is None:
-            self.grid = self.blank_grid(dimension[0], dimension[1])
+        if grid is None:
+            grid = self.blank_grid(dimension[0], dimension[1])
+        self.grid = grid
 
+        floor = FloorCreator().build()
         for row in self.grid:
             for cell in row:
-                cell.entity = FloorCreator().build()
+                cell.entity = floor
+        self.threat_index.clear()
+        self.active_cells.clear()
+
+    def __getstate__(self) -> dict:
+        # Les snapshots ouverts (références faibles) ne se sérialisent pas
+        state = self.__dict__.copy()
+        del state["_snapshots"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._snapshots = weakref.WeakSet()
+
+    @property
+    def grid(self) -> list[list[Cell]]:
+        """Grille 2D de cellules du donjon."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: list[list[Cell]]) -> None:
+        """Remplace la grille et reconstruit l'index des menaces."""
+        self._grid = grid
+        for row in grid:
+            for cell in row:
+                cell.dungeon = self
+        self.rebuild_threat_index()
+        self.active_cells = {
+            cell for row in grid for cell in row if self._is_active(cell.entity)
+        }
+        self.version += 1
+        self.change_log.clear()
 
     def blank_grid(self, rows, cols) -> list:
         """Crée une grille vide de cellules."""
-        return [[Cell((r, c), Floor()) for c in range(cols)] for r in range(rows)]
+        floor = FloorCreator().build()
+        return [[Cell((r, c), floor) for c in range(cols)] for r in range(rows)]
 
     def get_cell(self, coord: tuple[int, int]) -> Cell:
         """Retourne la cellule aux coordonnées spécifiées."""
@@ -67,22 +162,141 @@ class Dungeon:
         """Place une entité à la position spécifiée dans le donjon."""
         if self.is_within_bounds(position):
             cell = self.get_cell(position)
+            self.preserve(cell)
+            self._unindex_threats(cell)
             cell.entity = entity
             cell.entity.init_range(position)
+            self._index_threats(cell)
+            self.active_cells.discard(cell)
+            if self._is_active(entity):
+                self.active_cells.add(cell)
+            self.version += 1
+            self.change_log.append((self.version, position))
+
+    def threats_at(self, coord: tuple[int, int]) -> list[Cell]:
+        """Retourne les cellules dont l'entité menace la coordonnée donnée."""
+        return self.threat_index.get(coord, [])
+
+    def rebuild_threat_index(self) -> None:
+        """Reconstruit entièrement l'index des menaces à partir de la grille."""
+        self.threat_index = {}
+        for row in self._grid:
+            for cell in row:
+                self._index_threats(cell)
+
+    def _index_threats(self, cell: Cell) -> None:
+        """Ajoute la portée de l'entité de la cellule à l'index des menaces."""
+        if cell.entity is None:
+            return
+        for coord in cell.entity.getrange():
+            self.threat_index.setdefault(coord, []).append(cell)
+
+    def _unindex_threats(self, cell: Cell) -> None:
+        """Retire la portée de l'entité de la cellule de l'index des menaces."""
+        if cell.entity is None:
+            return
+        for coord in cell.entity.getrange():
+            sources = self.threat_index.get(coord)
+            if sources is None:
+                continue
+            if cell in sources:
+                sources.remove(cell)
+            if not sources:
+                del self.threat_index[coord]
 
-    
     def reset(self) -> None:
         """Réinitialise le donjon en vidant toutes les cellules de leurs entités."""
+        floor = FloorCreator().build()
         for row in self.grid:
             for cell in row:
-                cell.entity = FloorCreator().build()
+                self.preserve(cell)
+                cell.entity = floor
+        self.threat_index.clear()
+        self.active_cells.clear()
+        self.version += 1
+        self.change_log.clear()
+
+    def changes_since(self, version: int) -> Optional[list[tuple[int, int]]]:
+        """Retourne les cases modifiées depuis la version donnée.
+
+        Retourne None si l'historique ne suffit pas (réinitialisation, grille
+        remplacée ou trop de modifications) : il faut alors tout recalculer.
+        """
+        if version == self.version:
+            return []
+        if not self.change_log or self.change_log[0][0] > version + 1:
+            return None
+        return [coord for v, coord in self.change_log if v > version]
+
+    @staticmethod
+    def _is_active(entity: Entity) -> bool:
+        """Indique si l'entité doit être mise à jour au prochain tick."""
+        if entity is None:
+            return False
+        return entity.current_cooldown > 0 or bool(getattr(entity, "triggered", False))
+
+    def snapshot(self) -> DungeonSnapshot:
+        """Capture l'état courant ; les cellules ne sont recopiées qu'à leur modification."""
+        snapshot = DungeonSnapshot(self)
+        self._snapshots.add(snapshot)
+        return snapshot
+
+    def release(self, snapshot: DungeonSnapshot) -> None:
+        """Abandonne un snapshot : les modifications ne lui sont plus recopiées."""
+        self._snapshots.discard(snapshot)
+
+    def preserve(self, cell: Cell) -> None:
+        """Recopie la cellule dans les snapshots ouverts avant sa modification."""
+        if not self._snapshots:
+            return
+        for snapshot in self._snapshots:
+            if snapshot.grid is self._grid and cell not in snapshot.cells:
+                snapshot.cells[cell] = (cell.entity, _entity_state(cell.entity))
+
+    def restore(self, snapshot: DungeonSnapshot) -> None:
+        """Ramène le donjon à l'état du snapshot, qui reste utilisable.
+
+        Seules les cellules modifiées depuis le snapshot sont rétablies ; elles
+        figurent dans le journal des modifications comme un placement.
+        """
+        if snapshot.dungeon is not self:
+            raise ValueError("Ce snapshot appartient à un autre donjon")
+        current = snapshot.grid is self._grid
+        for cell, (entity, state) in snapshot.cells.items():
+            if current:
+                self.preserve(cell)
+                self._unindex_threats(cell)
+            cell.entity = entity
+            _restore_entity_state(entity, state)
+            if current:
+                self._index_threats(cell)
+                self.active_cells.discard(cell)
+                if self._is_active(entity):
+                    self.active_cells.add(cell)
+                self.version += 1
+                self.change_log.append((self.version, cell.coord))
+        snapshot.cells.clear()
+        if not current:
+            # La grille a été remplacée depuis : on reprend l'ancienne
+            self.grid = snapshot.grid
+        self._snapshots.add(snapshot)
+
+    def activate(self, cell: Cell) -> None:
+        """Marque une cellule comme active (entité déclenchée)."""
+        self.active_cells.add(cell)
 
     def update(self) -> None:  
-        """Met à jour l'état du donjon (placeholder pour logique future)."""
-        for row in self.grid:
-            for cell in row:
+        """Met à jour l'état du donjon.
 
-                cell.entity.update(cell) # Placeholder for future update logic
+        Seules les entités actives (dragons en cooldown, entités déclenchées)
+        sont mises à jour : le coût d'un tick dépend du nombre de monstres
+        actifs et non de la taille de la grille.
+        """
+        for cell in list(self.active_cells):
+            self.preserve(cell)
+            cell.entity.update(cell)
+            if not self._is_active(cell.entity):
+                self.active_cells.discard(cell)
 
 
     def __repr__(self) -> str:
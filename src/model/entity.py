@@ -25,8 +25,15 @@ class Entity(ABC):
 	Exemples d'implémentations : Floor, Wall, Trap, Monster.
 	"""
 
+	# Pas de __dict__ : les entités concrètes déclarent leurs attributs dans __slots__
+	__slots__ = ()
+
 	current_cooldown = 0
 
+	# Entité sans état propre, partageable entre les cases (cf. EntityCreator.build).
+	# Les entités à état (cooldown, déclenchement) doivent redéfinir à False.
+	flyweight = True
+
 
 	@property
 	@abstractmethod
@@ -6,7 +6,17 @@ from .entity import Entity
 
 
 class EntityCreator(ABC):
-    """Interface pour tous les ."""
+    """Interface pour tous les créateurs d'entités.
+
+    `build` distribue des instances partagées (poids mouche) pour les
+    entités sans état propre : une seule instance par type de créateur et
+    par paramètres (`flyweight_key`). Les entités dont l'attribut de classe
+    ``flyweight`` vaut False (dragons, bombes : cooldown, déclenchement)
+    sont créées à chaque appel.
+    """
+
+    # Instances partagées, par (classe du créateur, flyweight_key())
+    _flyweights: dict = {}
 
     @abstractmethod
     def factory_method(self) -> Entity:
@@ -17,10 +27,22 @@ class EntityCreator(ABC):
         """
         pass
 
+    def flyweight_key(self) -> tuple:
+        """Paramètres qui distinguent deux instances partagées (aucun par défaut)."""
+        return ()
+
     def build(self) -> Entity:
         """Méthode de construction par défaut utilisant l'entité créée.
 
         Returns:
-            Instance d'Entity créée par factory_method().
+            L'instance partagée si l'entité est sans état, sinon une
+            nouvelle instance créée par factory_method().
         """
-        return self.factory_method()
+        key = (type(self), self.flyweight_key())
+        entity = EntityCreator._flyweights.get(key)
+        if entity is not None:
+            return entity
+        entity = self.factory_method()
+        if not getattr(entity, "flyweight", False):
+            return entity
+        return EntityCreator._flyweights.setdefault(key, entity)
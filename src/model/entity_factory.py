@@ -43,18 +43,18 @@ class EntityFactory:
         """Créer une entité Floor (sol marchable).
 
         Returns:
-            Instance de Floor créée via FloorCreator.
+            Instance partagée de Floor fournie par FloorCreator.
         """
-        return FloorCreator().factory_method()
+        return FloorCreator().build()
 
     @staticmethod
     def create_wall() -> Wall:
         """Créer une entité Wall (mur non franchissable).
 
         Returns:
-            Instance de Wall créée via WallCreator.
+            Instance partagée de Wall fournie par WallCreator.
         """
-        return WallCreator().factory_method()
+        return WallCreator().build()
 
     @staticmethod
     def create_trap(damage: int = 10) -> Trap:
@@ -64,26 +64,34 @@ class EntityFactory:
             damage: Dégâts infligés par le piège (défaut: 10)
 
         Returns:
-            Instance de Trap créée via TrapCreator.
+            Instance de Trap fournie par TrapCreator, partagée entre les
+            pièges de mêmes dégâts.
         """
-        return TrapCreator(damage=damage).factory_method()
+        return TrapCreator(damage=damage).build()
     
     @staticmethod
-    def create_dragon(orientation : str = "U") -> Entity:
+    def create_dragon(orientation : str = "U", damage: int = 30) -> Entity:
         """Créer une entité Dragon (monstre).
 
+        Args:
+            orientation: Orientation du dragon ('R', 'L', 'U', 'D')
+            damage: Dégâts infligés par le dragon (défaut: 30)
+
         Returns:
             Instance de Dragon créée via DragonCreator.
         """
 
-        return DragonCreator().factory_method(orientation)
+        return DragonCreator().factory_method(orientation, damage)
 
     @staticmethod
-    def create_bombe() -> Bombe:
+    def create_bombe(damage: int = 40) -> Bombe:
         """Créer une entité Bombe.
 
+        Args:
+            damage: Dégâts infligés par l'explosion (défaut: 40)
+
         Returns:
             Instance de Bombe créée via BombeCreator.
         """
 
-        return BombeCreator().factory_method()
\ No newline at end of file
+        return BombeCreator().factory_method(damage)
\ No newline at end of file
@@ -6,6 +6,8 @@ from .entity import Entity
 class Floor(Entity):
     """Entité représentant un sol vide (case normale franchissable)."""
 
+    __slots__ = ("_damage",)
+
     def __init__(self, damage: int = 0) -> None:
         self._damage = int(damage)
 
@@ -4,18 +4,49 @@ from .path_strategies import PathStrategyFactory
 
 
 class Hero:
+    __slots__ = (
+        "pv_total", "pv_cur", "coord", "_isAlive", "_reachedGoal", "stepsTaken",
+        "path", "strategy", "hero_number", "ticktoAwake", "level",
+    )
+
     def __init__(self, pv_total, strategy: str, coord=None, hero_number = 1):
         self.pv_total = pv_total
         self.pv_cur = pv_total
         self.coord = coord
-        self.isAlive = False
-        self.reachedGoal = False
+        # Niveau tenant les compteurs vivants / arrivés (cf. Level)
+        self.level = None
+        self._isAlive = False
+        self._reachedGoal = False
         self.stepsTaken = 0
         self.path: Optional[List[tuple]] = None
         self.strategy = strategy
         self.hero_number = hero_number
         self.ticktoAwake = self.hero_number * TOURBOUCLE_REVEIl_HERO
 
+    @property
+    def isAlive(self) -> bool:
+        return self._isAlive
+
+    @isAlive.setter
+    def isAlive(self, value: bool) -> None:
+        value = bool(value)
+        if value != self._isAlive:
+            self._isAlive = value
+            if self.level is not None:
+                self.level.hero_alive_changed(self, value)
+
+    @property
+    def reachedGoal(self) -> bool:
+        return self._reachedGoal
+
+    @reachedGoal.setter
+    def reachedGoal(self, value: bool) -> None:
+        value = bool(value)
+        if value != self._reachedGoal:
+            self._reachedGoal = value
+            if self.level is not None:
+                self.level.hero_reached_goal_changed(self, value)
+
     def awake(self):
         self.isAlive = True
 
@@ -41,8 +72,7 @@ class Hero:
 
     def compute_path(self, dungeon, start, goal):
         """Compute path using the assigned strategy."""
-        path_strategy = PathStrategyFactory.create(self.strategy)
-        self.path = path_strategy.find_path(dungeon, start, goal)
+        self.path = PathStrategyFactory.find_path(self.strategy, dungeon, start, goal)
 
     def reset(self):
         """Reset the hero's state."""
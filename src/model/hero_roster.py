@@ -0,0 +1,220 @@
+"""Roster des héros rangé par colonnes (structure de tableaux).
+
+Pour les vagues de plusieurs milliers de héros, les états qui changent à
+chaque tick (position, points de vie, vivant, arrivé, curseur dans le
+chemin, tick de réveil) sont rangés dans des tableaux compacts indexés par
+le numéro d'ordre du héros, plutôt que dans un objet par héros.
+
+Les `Hero` du niveau deviennent des vues (`RosterHero`) sur ces tableaux :
+le reste du jeu (affichage, commandes, snapshots) les manipule comme
+avant, tandis que `Simulation.step` joue tout le roster d'un seul passage
+sur les tableaux (déplacements, dégâts, morts) sans passer par les vues.
+
+Le module `array` de la bibliothèque standard remplace NumPy, absent des
+dépendances du projet ; l'ordre des héros et les règles du tick restent
+ceux de la simulation objet, les deux donnent le même `waveResult`.
+
+Usage:
+    level = LevelBuilder().set_dungeon(dungeon).add_heroes(10_000).use_roster().build()
+    roster = level.roster
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional
+
+from .hero import Hero
+
+# Ligne d'une position absente (héros hors du donjon)
+NO_COORD = -1
+
+
+class RosterHero(Hero):
+    """Héros dont l'état courant est lu et écrit dans un `HeroRoster`."""
+
+    __slots__ = ("_roster", "_index")
+
+    @property
+    def index(self) -> int:
+        """Rang du héros dans le roster."""
+        return self._index
+
+    @property
+    def pv_cur(self) -> int:
+        return self._roster.pv[self._index]
+
+    @pv_cur.setter
+    def pv_cur(self, value: int) -> None:
+        self._roster.pv[self._index] = value
+
+    @property
+    def coord(self) -> Optional[tuple]:
+        roster, i = self._roster, self._index
+        row = roster.rows[i]
+        return None if row == NO_COORD else (row, roster.cols[i])
+
+    @coord.setter
+    def coord(self, value: Optional[tuple]) -> None:
+        roster, i = self._roster, self._index
+        if value is None:
+            roster.rows[i] = NO_COORD
+        else:
+            roster.rows[i], roster.cols[i] = value
+
+    @property
+    def isAlive(self) -> bool:
+        return bool(self._roster.alive[self._index])
+
+    @isAlive.setter
+    def isAlive(self, value: bool) -> None:
+        self._roster.set_alive(self._index, value)
+
+    @property
+    def reachedGoal(self) -> bool:
+        return bool(self._roster.reached[self._index])
+
+    @reachedGoal.setter
+    def reachedGoal(self, value: bool) -> None:
+        self._roster.set_reached(self._index, value)
+
+    @property
+    def stepsTaken(self) -> int:
+        return self._roster.steps[self._index]
+
+    @stepsTaken.setter
+    def stepsTaken(self, value: int) -> None:
+        self._roster.steps[self._index] = value
+
+    @property
+    def path(self) -> Optional[List[tuple]]:
+        return self._roster.paths[self._index]
+
+    @path.setter
+    def path(self, value: Optional[List[tuple]]) -> None:
+        self._roster.paths[self._index] = value
+
+    @property
+    def ticktoAwake(self) -> int:
+        return self._roster.wake[self._index]
+
+    @ticktoAwake.setter
+    def ticktoAwake(self, value: int) -> None:
+        self._roster.set_wake(self._index, value)
+
+
+class HeroRoster:
+    """États des héros d'une vague, un tableau par attribut.
+
+    Attributes:
+        heroes: Vues `RosterHero` en jeu (liste partagée avec `Level.heroes`)
+        views: Vues de tous les héros rangés, par index (y compris retirés)
+        pv, rows, cols, steps, wake: Points de vie, position, curseur dans le
+            chemin et tick de réveil de chaque héros
+        alive, reached: Drapeaux vivant / arrivé à la sortie
+        paths: Chemin de chaque héros
+    """
+
+    def __init__(self, heroes: Iterable[Hero] = ()) -> None:
+        self.heroes: List[RosterHero] = []
+        self.views: List[RosterHero] = []
+        self.pv = array("l")
+        self.rows = array("l")
+        self.cols = array("l")
+        self.steps = array("l")
+        self.wake = array("l")
+        self.alive = bytearray()
+        self.reached = bytearray()
+        self.paths: List[Optional[List[tuple]]] = []
+        # Index des héros vivants, triés (ordre de jeu du tick)
+        self._alive_order: List[int] = []
+        # Tick de réveil -> index des héros, reconstruit à la demande
+        self._wake_index: Optional[Dict[int, List[int]]] = None
+        for hero in heroes:
+            self.add(hero)
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def add(self, hero: Hero) -> RosterHero:
+        """Range l'état du héros dans les tableaux et retourne sa vue."""
+        if isinstance(hero, RosterHero) and hero._roster is self:
+            return hero
+        view = RosterHero.__new__(RosterHero)
+        view._roster = self
+        view._index = len(self.views)
+        view.level = None
+        view.pv_total = hero.pv_total
+        view.strategy = hero.strategy
+        view.hero_number = hero.hero_number
+        self.pv.append(hero.pv_cur)
+        self.rows.append(NO_COORD)
+        self.cols.append(NO_COORD)
+        self.steps.append(hero.stepsTaken)
+        self.wake.append(hero.ticktoAwake)
+        self.alive.append(0)
+        self.reached.append(0)
+        self.paths.append(hero.path)
+        self.views.append(view)
+        self.heroes.append(view)
+        view.coord = hero.coord
+        view.isAlive = hero.isAlive
+        view.reachedGoal = hero.reachedGoal
+        self._wake_index = None
+        return view
+
+    def retire(self, hero: RosterHero) -> None:
+        """Sort un héros du jeu ; son index reste réservé mais il ne se réveille plus."""
+        if hero._roster is self:
+            self.set_alive(hero._index, False)
+            self.set_wake(hero._index, 0)
+            if hero in self.heroes:
+                self.heroes.remove(hero)
+
+    def set_alive(self, index: int, value: bool) -> None:
+        value = bool(value)
+        if value == bool(self.alive[index]):
+            return
+        self.alive[index] = value
+        order = self._alive_order
+        if value:
+            insort(order, index)
+        else:
+            del order[bisect_left(order, index)]
+        view = self.views[index]
+        if view.level is not None:
+            view.level.hero_alive_changed(view, value)
+
+    def set_reached(self, index: int, value: bool) -> None:
+        value = bool(value)
+        if value == bool(self.reached[index]):
+            return
+        self.reached[index] = value
+        view = self.views[index]
+        if view.level is not None:
+            view.level.hero_reached_goal_changed(view, value)
+
+    def set_wake(self, index: int, tick: int) -> None:
+        self.wake[index] = tick
+        self._wake_index = None
+
+    def alive_indices(self) -> List[int]:
+        """Index des héros vivants, dans l'ordre de jeu (ne pas modifier)."""
+        return self._alive_order
+
+    def alive_heroes(self) -> List[RosterHero]:
+        views = self.views
+        return [views[i] for i in self._alive_order]
+
+    def count_alive(self) -> int:
+        return len(self._alive_order)
+
+    def due(self, tick: int) -> List[int]:
+        """Index des héros dont le réveil tombe à ce tick, triés."""
+        if self._wake_index is None:
+            index: Dict[int, List[int]] = {}
+            for i, wake_tick in enumerate(self.wake):
+                index.setdefault(wake_tick, []).append(i)
+            self._wake_index = index
+        return self._wake_index.get(tick, [])
@@ -0,0 +1,176 @@
+"""Cache LRU des donjons prédéfinis lus sur disque.
+
+Une sauvegarde (JSON ou binaire) n'est lue et analysée qu'une fois : elle
+est gardée sous forme de `CompactLayout` (dimensions et cases non vides),
+à partir duquel chaque chargement construit un `Dungeon` neuf. Rejouer ou
+recommencer un niveau ne relit donc pas le fichier.
+
+Chaque entrée est validée par la date de modification et la taille du
+fichier (un simple ``stat``) : une sauvegarde réécrite est relue au
+chargement suivant.
+
+Usage:
+    from src.model.layout_cache import layout_cache
+
+    dungeon = layout_cache.load("save/level1_dungeon.json")   # None si absent
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .binary_save import BINARY_EXTENSION, read_binary_save
+from .dungeon import Dungeon
+from .entity_factory import EntityFactory
+from .floor import Floor
+
+LAYOUT_CACHE_SIZE = 32
+
+# (row, col, type, damage, orientation) pour chaque case non vide
+Placement = Tuple[int, int, str, int, Optional[str]]
+
+
+@dataclass
+class CompactLayout:
+    """Donjon réduit à ses dimensions et à ses cases non vides."""
+
+    dimension: Tuple[int, int]
+    entry: Tuple[int, int]
+    exit: Tuple[int, int]
+    placements: List[Placement] = field(default_factory=list)
+
+    @classmethod
+    def from_dungeon(cls, dungeon: Dungeon) -> "CompactLayout":
+        placements = []
+        for row in dungeon.grid:
+            for cell in row:
+                entity = cell.entity
+                if entity is None or isinstance(entity, Floor):
+                    continue
+                placements.append((
+                    cell.coord[0],
+                    cell.coord[1],
+                    entity.type,
+                    entity.damage,
+                    getattr(entity, "orientation", None),
+                ))
+        return cls(tuple(dungeon.dimension), tuple(dungeon.entry), tuple(dungeon.exit), placements)
+
+    def build(self) -> Tuple[Dungeon, int]:
+        """Reconstruit le donjon et retourne aussi le coût total des entités."""
+        dungeon = Dungeon(dimension=self.dimension, entry=self.entry, exit=self.exit)
+        return dungeon, self._place(dungeon)
+
+    def apply(self, dungeon: Dungeon) -> int:
+        """Remet un donjon existant dans l'état du layout (entités neuves).
+
+        Le donjon garde son identité (vues, snapshots, caches de chemins qui le
+        référencent) ; retourne le coût total des entités.
+        """
+        dungeon.reset()
+        return self._place(dungeon)
+
+    def _place(self, dungeon: Dungeon) -> int:
+        total_cost = 0
+        for row, col, entity_type, damage, orientation in self.placements:
+            entity = create_entity(entity_type, damage, orientation)
+            total_cost += entity.cost
+            dungeon.place_entity(entity, (row, col))
+        return total_cost
+
+
+def create_entity(entity_type: str, damage: int, orientation: Optional[str]):
+    """Entité neuve décrite par son type (``WALL``, ``TRAP``...), ses dégâts et son orientation."""
+    if entity_type == "WALL":
+        return EntityFactory.create_wall()
+    if entity_type == "TRAP":
+        return EntityFactory.create_trap(damage=damage)
+    if entity_type == "DRAGON":
+        return EntityFactory.create_dragon(orientation=orientation or "U", damage=damage)
+    if entity_type == "BOMBE":
+        return EntityFactory.create_bombe(damage=damage)
+    return EntityFactory.create_floor()
+
+
+def _parse(path: str) -> CompactLayout:
+    """Lit et analyse une sauvegarde, binaire si son extension est ``.pcdb``."""
+    if path.endswith(BINARY_EXTENSION):
+        dungeon, _ = read_binary_save(path)
+    else:
+        from ..commands.importDungeon import dungeon_from_dict
+
+        with open(path, "r") as f:
+            dungeon = dungeon_from_dict(json.load(f))
+    return CompactLayout.from_dungeon(dungeon)
+
+
+class LayoutCache:
+    """Layouts analysés, du moins au plus récemment utilisé.
+
+    Attributes:
+        maxsize: Nombre maximal de fichiers gardés en mémoire
+        hits, misses: Compteurs de chargements servis par le cache ou relus
+    """
+
+    def __init__(self, maxsize: int = LAYOUT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], CompactLayout]]" = OrderedDict()
+        # Les donjons sont aussi préchargés depuis le thread des campagnes
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str) -> Optional[CompactLayout]:
+        """Retourne le layout du fichier, relu seulement s'il a changé.
+
+        Returns:
+            None si le fichier n'existe pas.
+        """
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        layout = _parse(key)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stamp, layout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return layout
+
+    def load(self, path: str) -> Optional[Dungeon]:
+        """Construit un donjon neuf à partir du fichier (None s'il n'existe pas)."""
+        layout = self.get(path)
+        if layout is None:
+            return None
+        dungeon, _ = layout.build()
+        return dungeon
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Cache partagé par toutes les campagnes du processus
+layout_cache = LayoutCache()
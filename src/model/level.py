@@ -18,6 +18,8 @@ from __future__ import annotations
 from .dungeon import Dungeon
 from typing import List, Optional
 from .hero import Hero
+from .hero_roster import HeroRoster
+from .layout_cache import CompactLayout
 
 
 class Level:
@@ -29,6 +31,14 @@ class Level:
         difficulty: Niveau de difficulté (1, 2, 3, ...)
         nb_heroes: Nombre de héros dans ce niveau
         heroes: Liste des héros du niveau
+        roster: Tableaux d'état des héros (None si les héros sont des objets
+            indépendants), cf. `use_roster`
+        alive: Héros en vie, tenus à jour par les héros eux-mêmes
+            (`Hero.awake`, `Hero.take_damage`...)
+        nb_reached_goal: Héros arrivés vivants à la sortie
+        layout: Sauvegarde dont le donjon est issu (``dungeon_file`` de la
+            campagne), rétablie à la réinitialisation de la simulation, cf.
+            `restore_layout`
     """
 
     def __init__(
@@ -43,7 +53,15 @@ class Level:
         self.difficulty = int(difficulty)
         self.heroes = list(heroes) if heroes else []
         self.nb_heroes = len(self.heroes)
+        self.roster: Optional[HeroRoster] = None
+        self.alive: set[Hero] = set()
+        self.nb_reached_goal = 0
+        for hero in self.heroes:
+            self._register(hero)
         self.dungeon = dungeon
+        self.layout: Optional[CompactLayout] = None
+        # Version du donjon quand il était identique au layout
+        self._layout_version: Optional[int] = None
         self.entry = self.dungeon.entry if self.dungeon else None
         self.exit = self.dungeon.exit if self.dungeon else None
 
@@ -52,15 +70,70 @@ class Level:
         """Alias pour difficulty (compatibilité avec Simulation)."""
         return self.difficulty
 
+    def use_roster(self) -> HeroRoster:
+        """Range l'état des héros dans un `HeroRoster`.
+
+        Les héros du niveau sont remplacés par des vues sur le roster, que
+        `Simulation.step` joue en un seul passage sur les tableaux.
+        """
+        if self.roster is None:
+            for hero in self.heroes:
+                self._unregister(hero)
+            self.roster = HeroRoster(self.heroes)
+            self.heroes = self.roster.heroes
+            for hero in self.heroes:
+                self._register(hero)
+        return self.roster
+
+    def _active_roster(self) -> Optional[HeroRoster]:
+        """Roster du niveau, s'il porte toujours la liste des héros."""
+        roster = self.roster
+        return roster if roster is not None and roster.heroes is self.heroes else None
+
+    def _register(self, hero: Hero) -> None:
+        """Rattache le héros au niveau, qui suit désormais son état."""
+        hero.level = self
+        if hero.isAlive:
+            self.alive.add(hero)
+        if hero.reachedGoal:
+            self.nb_reached_goal += 1
+
+    def _unregister(self, hero: Hero) -> None:
+        if hero.level is self:
+            hero.level = None
+        self.alive.discard(hero)
+        if hero.reachedGoal:
+            self.nb_reached_goal -= 1
+
+    def hero_alive_changed(self, hero: Hero, alive: bool) -> None:
+        """Appelé par un héros du niveau qui se réveille ou sort du jeu."""
+        if alive:
+            self.alive.add(hero)
+        else:
+            self.alive.discard(hero)
+
+    def hero_reached_goal_changed(self, hero: Hero, reached: bool) -> None:
+        self.nb_reached_goal += 1 if reached else -1
+
     def add_hero(self, hero: Hero) -> None:
         """Ajoute un héros au niveau."""
-        self.heroes.append(hero)
+        roster = self._active_roster()
+        if roster is not None:
+            hero = roster.add(hero)
+        else:
+            self.heroes.append(hero)
+        self._register(hero)
         self.nb_heroes = len(self.heroes)
 
     def remove_hero(self, hero: Hero) -> None:
         """Retire un héros du niveau."""
         if hero in self.heroes:
-            self.heroes.remove(hero)
+            roster = self._active_roster()
+            if roster is not None:
+                roster.retire(hero)
+            else:
+                self.heroes.remove(hero)
+            self._unregister(hero)
             self.nb_heroes = len(self.heroes)
 
     def awake_hero(self, hero : Hero) : 
@@ -68,11 +141,18 @@ class Level:
     
     def get_alive_heroes(self) -> List[Hero]:
         """Retourne la liste des héros encore en vie."""
-        return [h for h in self.heroes if h.isAlive]
+        roster = self._active_roster()
+        if roster is not None:
+            return roster.alive_heroes()
+        return [h for h in self.heroes if h in self.alive]
+
+    def get_nb_alive_heroes(self) -> int:
+        """Retourne le nombre de héros encore en vie."""
+        return len(self.alive)
     
     def get_nb_killed_heroes(self) -> int:
         """Retourne la liste des héros tués."""
-        return len([h for h in self.heroes if not h.isAlive])
+        return len(self.heroes) - len(self.alive)
 
     def get_nb_heroes(self) -> int :
         return self.nb_heroes
@@ -89,6 +169,30 @@ class Level:
         for hero in self.heroes:
             hero.awake()
 
+    def attach_layout(self, layout: CompactLayout) -> None:
+        """Associe au niveau la sauvegarde dont son donjon vient d'être construit."""
+        self.layout = layout
+        self._layout_version = self.dungeon.version
+
+    def restore_layout(self) -> None:
+        """Remet le donjon du niveau dans l'état de sa sauvegarde.
+
+        Un donjon jamais modifié depuis (même version, aucune entité active)
+        est laissé tel quel : un niveau préchargé garde ses chemins calculés.
+        """
+        dungeon = self.dungeon
+        if self._layout_version == dungeon.version and not dungeon.active_cells:
+            return
+        self.layout.apply(dungeon)
+        self._layout_version = dungeon.version
+
+    def set_dungeon(self, dungeon: Dungeon) -> None:
+        """Associe un nouveau donjon au niveau et recalcule les chemins des héros."""
+        self.dungeon = dungeon
+        self.entry = dungeon.entry
+        self.exit = dungeon.exit
+        self.reset()
+
     def reset(self) -> None:
         """Réinitialise l'état de tous les héros du niveau."""
         from .path_strategies import PathStrategyFactory
@@ -126,6 +230,7 @@ class LevelBuilder:
         self._nb_heroes: int = 0
         self._heroes: List[Hero] = []
         self._dungeon: Dungeon = None
+        self._use_roster: bool = False
 
     def set_dungeon(self, dungeon: Dungeon) -> "LevelBuilder":
         """Définit le donjon associé au niveau."""
@@ -142,6 +247,11 @@ class LevelBuilder:
         self._difficulty = max(1, int(difficulty))
         return self
 
+    def use_roster(self, enabled: bool = True) -> "LevelBuilder":
+        """Range l'état des héros dans un `HeroRoster` (vagues nombreuses)."""
+        self._use_roster = enabled
+        return self
+
     def add_hero(
         self, pv: int = 100, coord: tuple = None, strategy: str = "safest"
     ) -> "LevelBuilder":
@@ -197,6 +307,8 @@ class LevelBuilder:
             nb_heroes=len(self._heroes),
             heroes=self._heroes.copy(),
         )
+        if self._use_roster:
+            level.use_roster()
 
         if self._dungeon:
             from .path_strategies import PathStrategyFactory
@@ -220,6 +332,7 @@ class LevelBuilder:
         self._difficulty = 1
         self._heroes = []
         self._dungeon = None
+        self._use_roster = False
         return self
 
     def __repr__(self) -> str:
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import heapq
+import threading
+import weakref
+
+# Guards the per-dungeon cache tables below: levels are prefetched, paths
+# included, on a background thread while the current level is played. The
+# entries of one dungeon are only used by the thread that owns that dungeon.
+_cache_lock = threading.Lock()
 
 
 class PathStrategy(ABC):
@@ -25,6 +32,14 @@ class PathStrategy(ABC):
         """
         pass
 
+    def step_cost(self, dungeon, coord: Tuple[int, int]) -> int:
+        """Cost of entering a walkable tile (used by incremental planners)."""
+        return 1
+
+    def heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        """Admissible estimate of the cost from a to b (default: none)."""
+        return 0
+
 
 class ShortestPathStrategy(PathStrategy):
     """A* pathfinding that ignores traps (shortest path)."""
@@ -66,6 +81,9 @@ class ShortestPathStrategy(PathStrategy):
     def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
         """Manhattan distance heuristic."""
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return self._heuristic(a, b)
     
     def _get_neighbors(
         self,
@@ -125,8 +143,7 @@ class SafestPathStrategy(PathStrategy):
                 continue
             
             for neighbor in self._get_neighbors(dungeon, current):
-                cell = dungeon.get_cell(neighbor)
-                cell_damage = cell.entity.damage if cell.entity else 0
+                cell_damage = dungeon.get_cell(neighbor).get_damage()
                 new_damage = damage_score[current] + cell_damage
                 
                 if neighbor not in damage_score or new_damage < damage_score[neighbor]:
@@ -135,6 +152,10 @@ class SafestPathStrategy(PathStrategy):
                     heapq.heappush(open_set, (new_damage, neighbor))
         
         return []
+
+    def step_cost(self, dungeon, coord: Tuple[int, int]) -> int:
+        """Entering a tile costs its damage."""
+        return dungeon.get_cell(coord).get_damage()
     
     def _get_neighbors(
         self,
@@ -165,13 +186,309 @@ class SafestPathStrategy(PathStrategy):
         return path[::-1]
 
 
+class FlowFieldStrategy(PathStrategy):
+    """Shortest paths read from a BFS distance field rooted at the goal.
+
+    A single breadth-first search from the goal gives the distance of every
+    reachable tile; it is stored per dungeon and reused until the dungeon
+    `version` changes. Any hero, from any entry or from its current tile
+    mid-wave, then follows decreasing distances in O(path length).
+    """
+
+    # dungeon -> (version, {goal: {coord: distance}})
+    _fields: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    _DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    def find_path(
+        self,
+        dungeon,
+        start: Tuple[int, int],
+        goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Follow the distance field from start down to goal."""
+        if start == goal:
+            return [start]
+
+        field = self.distance_field(dungeon, goal)
+        path = [start]
+        current = start
+        if current not in field:
+            # The start tile itself may not be walkable: step onto the
+            # closest reachable neighbour first.
+            current = self._best_neighbor(field, current)
+            if current is None:
+                return []
+            path.append(current)
+
+        while current != goal:
+            current = self._best_neighbor(field, current)
+            path.append(current)
+        return path
+
+    def next_step(
+        self,
+        dungeon,
+        coord: Tuple[int, int],
+        goal: Tuple[int, int]
+    ):
+        """Return the next tile toward goal from coord, or None if cut off."""
+        if coord == goal:
+            return goal
+        return self._best_neighbor(self.distance_field(dungeon, goal), coord)
+
+    @classmethod
+    def distance_field(cls, dungeon, goal: Tuple[int, int]) -> Dict[Tuple[int, int], int]:
+        """Return the BFS distance of every tile that can reach goal."""
+        version = getattr(dungeon, "version", None)
+        with _cache_lock:
+            cached_version, fields = cls._fields.get(dungeon, (None, None))
+            if version is None or cached_version != version:
+                fields = {}
+                cls._fields[dungeon] = (version, fields)
+
+        field = fields.get(goal)
+        if field is None:
+            field = cls._bfs(dungeon, goal)
+            fields[goal] = field
+        return field
+
+    @classmethod
+    def _bfs(cls, dungeon, goal: Tuple[int, int]) -> Dict[Tuple[int, int], int]:
+        """Breadth-first search over walkable tiles, rooted at goal."""
+        if not dungeon.validMove(goal):
+            return {}
+        field = {goal: 0}
+        frontier = [goal]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for row, col in frontier:
+                for d_row, d_col in cls._DIRECTIONS:
+                    neighbor = (row + d_row, col + d_col)
+                    if neighbor not in field and dungeon.validMove(neighbor):
+                        field[neighbor] = distance
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return field
+
+    def _best_neighbor(self, field: Dict[Tuple[int, int], int], coord: Tuple[int, int]):
+        """Neighbour of coord with the smallest distance, or None."""
+        row, col = coord
+        best = None
+        for d_row, d_col in self._DIRECTIONS:
+            neighbor = (row + d_row, col + d_col)
+            distance = field.get(neighbor)
+            if distance is not None and (best is None or distance < field[best]):
+                best = neighbor
+        return best
+
+
+INFINITY = float("inf")
+
+
+class LPAStarPlanner:
+    """Lifelong Planning A* search between a fixed start and goal.
+
+    Keeps g/rhs values between calls so that, after a few tiles change,
+    only the part of the search affected by those tiles is redone.
+    Costs and heuristic come from the wrapped `PathStrategy`.
+    """
+
+    _DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    def __init__(self, strategy: PathStrategy, dungeon, start, goal):
+        self.strategy = strategy
+        # Planners are cached under their dungeon as a weak key: a strong
+        # reference here would keep the dungeon (and the planner) alive
+        self.dungeon = weakref.proxy(dungeon)
+        self.start = start
+        self.goal = goal
+        self.version = getattr(dungeon, "version", None)
+        self.g: Dict[Tuple[int, int], float] = {}
+        self.rhs: Dict[Tuple[int, int], float] = {start: 0}
+        self._queue: list = []
+        self._queued: Dict[Tuple[int, int], tuple] = {}
+        self._push(start)
+
+    def _neighbors(self, coord: Tuple[int, int]) -> List[Tuple[int, int]]:
+        row, col = coord
+        return [(row + d_row, col + d_col) for d_row, d_col in self._DIRECTIONS]
+
+    def _cost(self, coord: Tuple[int, int]) -> float:
+        if not self.dungeon.validMove(coord):
+            return INFINITY
+        return self.strategy.step_cost(self.dungeon, coord)
+
+    def _key(self, coord: Tuple[int, int]) -> tuple:
+        best = min(self.g.get(coord, INFINITY), self.rhs.get(coord, INFINITY))
+        return (best + self.strategy.heuristic(coord, self.goal), best)
+
+    def _push(self, coord: Tuple[int, int]) -> None:
+        key = self._key(coord)
+        self._queued[coord] = key
+        heapq.heappush(self._queue, (key, coord))
+
+    def _top_key(self) -> tuple:
+        # Entries are removed lazily: skip those that were re-queued or dropped
+        while self._queue:
+            key, coord = self._queue[0]
+            if self._queued.get(coord) == key:
+                return key
+            heapq.heappop(self._queue)
+        return (INFINITY, INFINITY)
+
+    def update_vertex(self, coord: Tuple[int, int]) -> None:
+        """Recompute rhs(coord) from its neighbours and requeue if inconsistent."""
+        if coord != self.start:
+            cost = self._cost(coord)
+            best = INFINITY
+            if cost != INFINITY:
+                for neighbor in self._neighbors(coord):
+                    g = self.g.get(neighbor, INFINITY)
+                    if g + cost < best:
+                        best = g + cost
+            self.rhs[coord] = best
+        self._queued.pop(coord, None)
+        if self.g.get(coord, INFINITY) != self.rhs.get(coord, INFINITY):
+            self._push(coord)
+
+    def compute(self) -> None:
+        """Expand vertices until the goal is locally consistent."""
+        while (self._top_key() < self._key(self.goal)
+               or self.rhs.get(self.goal, INFINITY) != self.g.get(self.goal, INFINITY)):
+            if not self._queue:
+                break
+            _, coord = heapq.heappop(self._queue)
+            self._queued.pop(coord, None)
+            rhs = self.rhs.get(coord, INFINITY)
+            if self.g.get(coord, INFINITY) > rhs:
+                self.g[coord] = rhs
+                for neighbor in self._neighbors(coord):
+                    if self.dungeon.is_within_bounds(neighbor):
+                        self.update_vertex(neighbor)
+            else:
+                self.g[coord] = INFINITY
+                self.update_vertex(coord)
+                for neighbor in self._neighbors(coord):
+                    if self.dungeon.is_within_bounds(neighbor):
+                        self.update_vertex(neighbor)
+
+    def apply_changes(self, changed: List[Tuple[int, int]]) -> None:
+        """Take edited tiles into account and repair the search."""
+        for coord in changed:
+            self.update_vertex(coord)
+        self.version = getattr(self.dungeon, "version", None)
+        self.compute()
+
+    def path(self) -> List[Tuple[int, int]]:
+        """Walk back from the goal along the cheapest predecessors."""
+        if self.start == self.goal:
+            return [self.start]
+        if self.g.get(self.goal, INFINITY) == INFINITY:
+            return []
+        path = [self.goal]
+        current = self.goal
+        while current != self.start:
+            cost = self._cost(current)
+            best, best_value = None, INFINITY
+            for neighbor in self._neighbors(current):
+                value = self.g.get(neighbor, INFINITY) + cost
+                if value < best_value:
+                    best, best_value = neighbor, value
+            current = best
+            path.append(current)
+        return path[::-1]
+
+
+class IncrementalPathStrategy(PathStrategy):
+    """Wraps a strategy with an LPA* planner repaired after each edit.
+
+    One planner is kept per (dungeon, start, goal). When the dungeon has
+    changed since the last call, only the tiles listed by
+    `dungeon.changes_since` are re-evaluated; if that history is not
+    available (reset, imported grid), the planner starts over.
+    """
+
+    base_class = ShortestPathStrategy
+
+    # dungeon -> {(strategy class, start, goal): planner}
+    _planners: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def __init__(self, base: Optional[PathStrategy] = None):
+        self.base = base if base is not None else self.base_class()
+        self._weight = 1
+
+    def step_cost(self, dungeon, coord: Tuple[int, int]) -> int:
+        # Base cost first, path length second: every step costs at least 1,
+        # so zero-damage tiles cannot create cycles when walking back.
+        return self.base.step_cost(dungeon, coord) * self._weight + 1
+
+    def heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return self.base.heuristic(a, b) * self._weight
+
+    def find_path(
+        self,
+        dungeon,
+        start: Tuple[int, int],
+        goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Return the planner's path, repairing it after dungeon edits."""
+        rows, cols = dungeon.dimension
+        self._weight = rows * cols + 1
+        with _cache_lock:
+            planners = self._planners.setdefault(dungeon, {})
+        key = (type(self.base), start, goal)
+        planner = planners.get(key)
+
+        changed = None
+        if planner is not None and hasattr(dungeon, "changes_since"):
+            changed = dungeon.changes_since(planner.version)
+        if changed is None:
+            planner = LPAStarPlanner(self, dungeon, start, goal)
+            planners[key] = planner
+            planner.compute()
+        elif changed:
+            planner.apply_changes(changed)
+        return planner.path()
+
+
+class IncrementalShortestPathStrategy(IncrementalPathStrategy):
+    """Incremental version of ShortestPathStrategy."""
+
+    base_class = ShortestPathStrategy
+
+
+class IncrementalSafestPathStrategy(IncrementalPathStrategy):
+    """Incremental version of SafestPathStrategy."""
+
+    base_class = SafestPathStrategy
+
+
 class PathStrategyFactory:
-    """Factory for creating path strategies."""
+    """Factory for creating path strategies.
+
+    Also keeps a path cache per dungeon, keyed by (strategy, start, goal)
+    and valid for a single `Dungeon.version`: heroes sharing a strategy on
+    an unchanged dungeon share a single search. On a miss, the shortest and
+    safest strategies are answered by their incremental version, so an edit
+    between two waves repairs the previous search instead of redoing it.
+    """
     
     _strategies = {
         "shortest": ShortestPathStrategy,
         "safest": SafestPathStrategy,
     }
+
+    # Strategy class -> incremental version used by find_path
+    _incremental = {
+        ShortestPathStrategy: IncrementalShortestPathStrategy,
+        SafestPathStrategy: IncrementalSafestPathStrategy,
+    }
+
+    # dungeon -> (version, {(strategy, start, goal): path})
+    _path_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
     
     @classmethod
     def create(cls, strategy_name: str) -> PathStrategy:
@@ -203,3 +520,62 @@ class PathStrategyFactory:
         if not issubclass(strategy_class, PathStrategy):
             raise TypeError(f"{strategy_class} must inherit from PathStrategy")
         cls._strategies[name.lower()] = strategy_class
+        cls.clear_cache()
+
+    @classmethod
+    def find_path(
+        cls,
+        strategy_name: str,
+        dungeon,
+        start: Tuple[int, int],
+        goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Find a path with the named strategy, reusing cached results.
+
+        The cache entry of a dungeon is dropped as soon as its `version`
+        changes. Dungeons without a `version` are never cached.
+
+        Returns:
+            A fresh list of coordinates from start to goal
+
+        Raises:
+            ValueError: If strategy name is unknown
+        """
+        strategy = cls.create(strategy_name)
+        version = getattr(dungeon, "version", None)
+        if version is None:
+            return strategy.find_path(dungeon, start, goal)
+
+        with _cache_lock:
+            try:
+                cached_version, paths = cls._path_cache.get(dungeon, (None, None))
+            except TypeError:
+                # Dungeon not weak-referenceable or not hashable
+                paths = None
+            else:
+                if cached_version != version:
+                    paths = {}
+                    cls._path_cache[dungeon] = (version, paths)
+        if paths is None:
+            return strategy.find_path(dungeon, start, goal)
+
+        key = (strategy_name.lower(), start, goal)
+        path = paths.get(key)
+        if path is None:
+            incremental = cls._incremental.get(type(strategy))
+            if incremental is not None:
+                strategy = incremental()
+            path = strategy.find_path(dungeon, start, goal)
+            paths[key] = path
+        return list(path)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached path."""
+        with _cache_lock:
+            cls._path_cache = weakref.WeakKeyDictionary()
+
+
+PathStrategyFactory.register_strategy("flowfield", FlowFieldStrategy)
+PathStrategyFactory.register_strategy("incremental_shortest", IncrementalShortestPathStrategy)
+PathStrategyFactory.register_strategy("incremental_safest", IncrementalSafestPathStrategy)
@@ -10,6 +10,8 @@ class Trap(Entity):
         damage: int -- dégâts infligés lorsqu'un héros déclenche le piège
     """
 
+    __slots__ = ("_damage",)
+
     def __init__(self, damage: int = 25):
         self._damage = int(damage)
 
@@ -15,6 +15,10 @@ class TrapCreator(EntityCreator):
         """
         self.damage = damage
 
+    def flyweight_key(self) -> tuple:
+        """Un piège partagé par valeur de dégâts."""
+        return (self.damage,)
+
     def factory_method(self) -> Trap:
         """Crée et retourne une nouvelle instance de Trap.
 
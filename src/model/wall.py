@@ -6,6 +6,8 @@ from .entity import Entity
 class Wall(Entity):
     """Entité représentant un mur (non franchissable)."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
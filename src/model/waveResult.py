@@ -25,12 +25,24 @@ class waveResult :
     def getResult(self) -> str :
         return f"Wave Result : {self.to_dict()}"
 
+    @staticmethod
+    def _tracking_level(simulation: 'Simulation'):
+        """Niveau dont les compteurs couvrent les héros de la simulation, s'il y en a un."""
+        level = simulation.level
+        return level if level is not None and level.heroes is simulation.heroes else None
+
     @staticmethod
     def getHerosKilled(simulation: 'Simulation') -> int:
+        level = waveResult._tracking_level(simulation)
+        if level is not None:
+            return level.get_nb_killed_heroes()
         return len([h for h in simulation.heroes if not h.isAlive])
 
     @staticmethod
     def getHerosSurvived(simulation: 'Simulation') -> int:
+        level = waveResult._tracking_level(simulation)
+        if level is not None:
+            return level.get_nb_alive_heroes()
         return len([h for h in simulation.heroes if h.isAlive])
     
     @classmethod
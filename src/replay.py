@@ -0,0 +1,296 @@
+"""Journal de rejeu d'une partie et rejeu headless.
+
+`ReplayLog` écrit, en ajout seul, un événement JSON par ligne :
+
+- ``setup`` : état de départ (donjon, roster, budget, score, dégâts
+  cumulés), réécrit quand le niveau ou le donjon est remplacé (niveau
+  suivant, import) ;
+- ``place`` / ``remove`` / ``reset`` : modifications du donjon demandées
+  par le joueur, réussies ou non ;
+- ``start`` / ``stop`` : démarrage et arrêt de la vague ;
+- ``ticks`` : nombre de ticks joués depuis l'événement précédent (les
+  ticks consécutifs tiennent sur une seule ligne) ;
+- ``end`` : `waveResult` de la partie à la fermeture du journal.
+
+Les commandes sont journalisées par le `GameInvoker` et les ticks par
+`Simulation.step`, quel que soit ce qui fait avancer la vague (commande
+startWave, `WaveLoop` du serveur web, etc.). La simulation étant
+déterministe, `replay` rejoue les mêmes commandes et le même nombre de
+ticks, sans affichage ni temporisation, et retrouve le même `waveResult`.
+
+Usage:
+    log = ReplayLog("replays/session.jsonl")
+    log.attach(game_controller)
+    ...
+    log.close()
+
+    result = replay("replays/session.jsonl")
+    python -m src.replay replays/*.jsonl --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from src.commands.placeEntity import placeEntity
+from src.commands.removeEntity import removeEntity
+from src.commands.resetDungeon import resetDungeon
+from src.commands.startWave import startWave
+from src.commands.stopWave import stopWave
+from src.model.layout_cache import CompactLayout, create_entity
+from src.model.level import LevelBuilder
+from src.model.waveResult import waveResult
+from src.simulation import Simulation
+
+REPLAY_FORMAT = 1
+
+Event = Dict[str, object]
+
+
+def _setup_event(simulation: Simulation) -> Event:
+    """État de départ de la simulation (layout, roster et compteurs)."""
+    layout = CompactLayout.from_dungeon(simulation.dungeon)
+    level = simulation.level
+    return {
+        "e": "setup",
+        "dimension": list(layout.dimension),
+        "entry": list(layout.entry),
+        "exit": list(layout.exit),
+        "placements": [list(p) for p in layout.placements],
+        "difficulty": level.difficulty,
+        "budget_tot": level.budget_tot,
+        "heroes": [[h.pv_total, h.strategy] for h in level.heroes],
+        "budget": simulation.current_budget,
+        "totalscore": simulation.totalscore,
+        "damage": simulation.dmgobserver.getTotalDmg(),
+    }
+
+
+class ReplayLog:
+    """Journal de rejeu d'une partie, écrit au fil de l'eau.
+
+    Attributes:
+        path: Fichier du journal (ouvert en ajout)
+        game_controller: Partie journalisée
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.game_controller = None
+        self._file = open(path, "a")
+        self._pending_ticks = 0
+        self._simulation = None
+        self._level = None
+        self._dungeon = None
+        self._write({"e": "header", "format": REPLAY_FORMAT})
+
+    def attach(self, game_controller) -> "ReplayLog":
+        """Journalise les commandes et les ticks de la partie."""
+        self.game_controller = game_controller
+        game_controller.invoker.replay_log = self
+        self.sync()
+        return self
+
+    def detach(self) -> None:
+        if self.game_controller is None:
+            return
+        if self.game_controller.invoker.replay_log is self:
+            self.game_controller.invoker.replay_log = None
+        if self._simulation is not None and self._simulation.recorder is self:
+            self._simulation.recorder = None
+        self.game_controller = None
+
+    def _write(self, event: Event) -> None:
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def _flush_ticks(self) -> None:
+        if self._pending_ticks:
+            self._write({"e": "ticks", "n": self._pending_ticks})
+            self._pending_ticks = 0
+
+    def sync(self) -> None:
+        """Écrit un nouvel état de départ si le niveau ou le donjon a été remplacé."""
+        simulation = self.game_controller.simulation if self.game_controller else None
+        if simulation is None or simulation.dungeon is None:
+            return
+        if simulation is not self._simulation:
+            if self._simulation is not None and self._simulation.recorder is self:
+                self._simulation.recorder = None
+            simulation.recorder = self
+        if (simulation is self._simulation and simulation.level is self._level
+                and simulation.dungeon is self._dungeon):
+            return
+        self._flush_ticks()
+        self._write(_setup_event(simulation))
+        self._file.flush()
+        self._simulation = simulation
+        self._level = simulation.level
+        self._dungeon = simulation.dungeon
+
+    def tick(self) -> None:
+        """Appelé par `Simulation.step` au début de chaque tick."""
+        self.sync()
+        self._pending_ticks += 1
+
+    def record(self, command) -> None:
+        """Journalise une commande exécutée par le `GameInvoker`."""
+        if isinstance(command, placeEntity):
+            entity = command.entity
+            event = {
+                "e": "place",
+                "pos": list(command.position),
+                "type": entity.type,
+                "damage": entity.damage,
+                "orientation": getattr(entity, "orientation", None),
+            }
+        elif isinstance(command, removeEntity):
+            event = {"e": "remove", "pos": list(command.coord)}
+        elif isinstance(command, resetDungeon):
+            event = {"e": "reset"}
+        elif isinstance(command, startWave):
+            event = {"e": "start"}
+        elif isinstance(command, stopWave):
+            event = {"e": "stop"}
+        else:
+            # Niveau suivant, import... : le prochain `sync` écrira le nouvel état
+            return
+        self._flush_ticks()
+        self._write(event)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Termine le journal par le résultat de la partie et le ferme."""
+        if self._file.closed:
+            return
+        self._flush_ticks()
+        if self._simulation is not None:
+            self._write({"e": "end", "result": waveResult.from_simulation(self._simulation).to_dict()})
+        self.detach()
+        self._file.close()
+
+
+def read_replay(path: str) -> List[Event]:
+    """Lit les événements d'un journal.
+
+    Raises:
+        ValueError: Si le fichier n'est pas un journal de rejeu lisible
+    """
+    with open(path, "r") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    if not events or events[0].get("e") != "header" or events[0].get("format") != REPLAY_FORMAT:
+        raise ValueError(f"{path}: format de journal de rejeu inconnu")
+    return events
+
+
+def _build_simulation(event: Event) -> Simulation:
+    layout = CompactLayout(
+        tuple(event["dimension"]),
+        tuple(event["entry"]),
+        tuple(event["exit"]),
+        [tuple(p) for p in event["placements"]],
+    )
+    dungeon, _ = layout.build()
+    builder = (LevelBuilder()
+               .set_dungeon(dungeon)
+               .set_budget(event["budget_tot"])
+               .set_difficulty(event["difficulty"]))
+    for pv, strategy in event["heroes"]:
+        builder.add_hero(pv=pv, strategy=strategy)
+    simulation = Simulation(builder.build())
+    simulation.current_budget = event["budget"]
+    simulation.totalscore = event["totalscore"]
+    simulation.score = event["totalscore"]
+    simulation.dmgobserver.totaldamage = event["damage"]
+    return simulation
+
+
+def replay(source: Union[str, Iterable[Event]]) -> waveResult:
+    """Rejoue un journal (chemin ou événements) et retourne le `waveResult` final.
+
+    Raises:
+        ValueError: Si le journal ne commence pas par un état de départ
+    """
+    events = read_replay(source) if isinstance(source, str) else source
+    simulation = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for event in events:
+            kind = event["e"]
+            if kind in ("header", "end"):
+                continue
+            if kind == "setup":
+                simulation = _build_simulation(event)
+                continue
+            if simulation is None:
+                raise ValueError("Journal de rejeu sans état de départ")
+            if kind == "place":
+                entity = create_entity(event["type"], event["damage"], event["orientation"])
+                placeEntity(simulation.dungeon, entity, tuple(event["pos"]), simulation).execute(None)
+            elif kind == "remove":
+                removeEntity(simulation.dungeon, tuple(event["pos"]), simulation).execute(None)
+            elif kind == "reset":
+                resetDungeon(simulation.dungeon, simulation).execute(None)
+            elif kind == "start":
+                # Les ticks de la vague sont rejoués par les événements "ticks"
+                startWave(simulation).prepare()
+            elif kind == "stop":
+                simulation.stop()
+            elif kind == "ticks":
+                for _ in range(event["n"]):
+                    simulation.step()
+    if simulation is None:
+        raise ValueError("Journal de rejeu sans état de départ")
+    return waveResult.from_simulation(simulation)
+
+
+def recorded_result(events: Sequence[Event]) -> Optional[dict]:
+    """`waveResult` enregistré à la fermeture du journal, s'il y en a un."""
+    for event in reversed(events):
+        if event["e"] == "end":
+            return event["result"]
+    return None
+
+
+def _replay_file(path: str) -> dict:
+    events = read_replay(path)
+    result = replay(events).to_dict()
+    expected = recorded_result(events)
+    return {"path": path, "result": result, "expected": expected,
+            "match": expected is None or expected == result}
+
+
+def replay_files(paths: Sequence[str], max_workers: Optional[int] = None) -> List[dict]:
+    """Rejoue plusieurs journaux en parallèle.
+
+    Returns:
+        Pour chaque journal : son chemin, le résultat rejoué, le résultat
+        enregistré (ou None) et ``match``.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return [_replay_file(path) for path in paths]
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_replay_file, paths, chunksize=chunksize))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Dungeon Manager - headless replayer")
+    parser.add_argument("logs", nargs="+", help="Replay logs (.jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    reports = replay_files(args.logs, args.workers)
+    for report in reports:
+        print(json.dumps(report))
+    return 0 if all(report["match"] for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 import os, time
+from dataclasses import dataclass, field
 
 from src.model.floor_creator import FloorCreator
 from .config import *
 from .model.hero import Hero
+from .model.hero_roster import HeroRoster
 from .model.waveResult import waveResult
 from .model.dungeon import Dungeon
 from .model.level import Level
@@ -15,6 +17,30 @@ from typing import List, Optional, Any, Dict
 from src.model import dungeon as dgeon
 
 
+# Hero attributes saved by Simulation.snapshot (the path list is shared)
+_HERO_FIELDS = ("pv_cur", "coord", "isAlive", "reachedGoal", "stepsTaken", "path", "ticktoAwake")
+
+# Simulation counters and flags saved by Simulation.snapshot
+_SIMULATION_FIELDS = (
+    "score", "totalscore", "current_budget", "ticks", "running",
+    "tresorReached", "allHeroesDead", "isSimStarted",
+)
+
+
+@dataclass
+class SimulationSnapshot:
+    """Saved state of a `Simulation`, see `Simulation.snapshot`."""
+
+    level: Optional[Level]
+    dungeon: Optional[Dungeon]
+    dungeon_snapshot: Any
+    hero_list: List[Hero]
+    heroes: List[Hero]
+    hero_states: List[tuple]
+    fields: Dict[str, Any]
+    damage: List[tuple] = field(default_factory=list)
+
+
 class Simulation:
     """Lightweight simulation orchestrator.
 
@@ -43,6 +69,8 @@ class Simulation:
         self.dmgobserver = DamageObserver()
         self.observers: List[Observer] = []
         self.totalscore = 0
+        # Optional replay log notified at every tick boundary (src.replay)
+        self.recorder = None
 
     def attach(self, observer: Observer) -> None:
         """Attach an observer to the simulation."""
@@ -59,10 +87,17 @@ class Simulation:
         for observer in self.observers:
             observer.update()
 
-    def launch(self) -> Dict[str, Any]:
+    def launch(
+        self, tick_delay: float = TICK_DELAY, max_ticks: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Launch the simulation loop.
 
         Awake a hero every TOURBOUCLE x round
+
+        Args:
+            tick_delay: Wall-clock pause between two ticks, in seconds. The
+                displays keep the default pacing; ``0`` disables sleeping.
+            max_ticks: Optional safety bound on the number of ticks.
         """
         self.running = True
         count_awake_hero = 0
@@ -74,9 +109,75 @@ class Simulation:
 
             self.step()
 
-            time.sleep(0.5)
+            if max_ticks is not None and self.ticks >= max_ticks:
+                self.running = False
+            elif tick_delay > 0:
+                time.sleep(tick_delay)
         return waveResult.from_simulation(self).to_dict()
 
+    def run_headless(self, max_ticks: Optional[int] = None) -> waveResult:
+        """Run the wave to completion as fast as possible, without display.
+
+        No wall-clock pause is made between ticks. Since a hero never needs
+        more steps than there are cells, the wave is bounded by default to
+        the grid area plus the awakening delay of the last hero, so a hero
+        stuck without a path cannot loop forever.
+
+        Returns:
+            The `waveResult` of the finished wave.
+        """
+        if max_ticks is None:
+            rows, cols = self.dungeon.dimension if self.dungeon else (0, 0)
+            max_ticks = rows * cols + TOURBOUCLE_REVEIl_HERO * (len(self.heroes) + 1)
+        self.isSimStarted = True
+        self.launch(tick_delay=0, max_ticks=max_ticks)
+        self.score = self.compute_score()
+        return waveResult.from_simulation(self)
+
+    def snapshot(self) -> SimulationSnapshot:
+        """Capture the simulation state so it can be branched and restored.
+
+        The grid is not copied: the dungeon snapshot is copy-on-write, so
+        its cost grows with the number of cells mutated afterwards. Heroes,
+        counters, budget and damage observer totals are copied.
+        """
+        damage_observers = [self.dmgobserver] + [
+            o for o in self.observers if isinstance(o, DamageObserver) and o is not self.dmgobserver
+        ]
+        return SimulationSnapshot(
+            level=self.level,
+            dungeon=self.dungeon,
+            dungeon_snapshot=self.dungeon.snapshot() if self.dungeon is not None else None,
+            hero_list=self.heroes,
+            heroes=list(self.heroes),
+            hero_states=[tuple(getattr(h, name) for name in _HERO_FIELDS) for h in self.heroes],
+            fields={name: getattr(self, name) for name in _SIMULATION_FIELDS},
+            damage=[(o, o.totaldamage, o.lastdamage) for o in damage_observers],
+        )
+
+    def restore(self, snapshot: SimulationSnapshot) -> None:
+        """Bring the simulation back to a snapshot, which stays reusable."""
+        self.level = snapshot.level
+        self.dungeon = snapshot.dungeon
+        if snapshot.dungeon_snapshot is not None:
+            self.dungeon.restore(snapshot.dungeon_snapshot)
+        self.heroes = snapshot.hero_list
+        self.heroes[:] = snapshot.heroes
+        # The level's alive set and reached-goal count follow the heroes
+        for hero, state in zip(snapshot.heroes, snapshot.hero_states):
+            for name, value in zip(_HERO_FIELDS, state):
+                setattr(hero, name, value)
+        for name, value in snapshot.fields.items():
+            setattr(self, name, value)
+        for observer, total, last in snapshot.damage:
+            observer.totaldamage = total
+            observer.lastdamage = last
+
+    def release(self, snapshot: SimulationSnapshot) -> None:
+        """Stop tracking dungeon mutations for a snapshot no longer needed."""
+        if snapshot.dungeon is not None and snapshot.dungeon_snapshot is not None:
+            snapshot.dungeon.release(snapshot.dungeon_snapshot)
+
     def stop(self) -> None:
         """Stop the simulation loop."""
         self.running = False
@@ -92,10 +193,16 @@ class Simulation:
         """
 
         self.ticks += 1
+        if self.recorder is not None:
+            self.recorder.tick()
         count_awake_hero = 0
         # Let dungeon perform an update if available
         if (self.dungeon )  :
             self.dungeon.update()
+
+        roster = self.level._active_roster() if self.level else None
+        if roster is not None and roster.heroes is self.heroes:
+            return self._step_roster(roster)
         
         # Let heroes act
         for h in list(self.heroes):
@@ -109,6 +216,7 @@ class Simulation:
                         damage = self.apply_cell_effects(h)
                         self.notifyDamageObserver(damage)
                         if self.check_on_treasure(h) and h.isAlive:
+                            h.reachedGoal = True
                             self.tresorReached = True
                             self.score = self.compute_score()
                             return waveResult.from_simulation(self).to_dict()
@@ -129,7 +237,7 @@ class Simulation:
         self.notify()
         wave_res_dict = waveResult.from_simulation(self).to_dict()
         
-        if not self.level.get_alive_heroes():
+        if not self.level.alive:
             self.allHeroesDead = True
             
             
@@ -137,6 +245,88 @@ class Simulation:
 
 
 
+    def _step_roster(self, roster: HeroRoster):
+        """Hero part of `step` played directly on the roster arrays.
+
+        Heroes act in index order and follow the same rules as the object
+        loop (awakening, move, cell and threat damage, treasure check), so
+        both backends produce the same wave. Walkability, cell damage and
+        threats only change between ticks, so they are looked up once per
+        visited cell and shared by all the heroes stepping on it.
+        """
+        dungeon = self.dungeon
+        exit = dungeon.exit
+        pv, rows, cols, steps, alive, paths = (
+            roster.pv, roster.rows, roster.cols, roster.steps, roster.alive, roster.paths
+        )
+        woken = [i for i in roster.due(self.ticks) if not alive[i]]
+        for i in woken:
+            roster.set_alive(i, True)
+
+        cells = {}
+        dead = []
+        for i in list(roster.alive_indices()):
+            try:
+                nextMove = paths[i][steps[i] + 1]
+                cell_info = cells.get(nextMove)
+                if cell_info is None:
+                    walkable = dungeon.validMove(nextMove)
+                    cell_info = cells[nextMove] = (
+                        walkable,
+                        dungeon.get_cell(nextMove).get_damage() if walkable else 0,
+                        tuple(dungeon.threats_at(nextMove)) if walkable else (),
+                    )
+                walkable, damage, threats = cell_info
+                if not walkable:
+                    continue
+                rows[i], cols[i] = nextMove
+                steps[i] += 1
+
+                # Same damage rules as Hero.take_damage / apply_cell_effects
+                hp = pv[i] - damage
+                if hp > 0:
+                    for source in threats:
+                        dmg = source.return_damage_if_CD()
+                        hp -= dmg
+                        damage += dmg
+                        if hp <= 0:
+                            hp = 0
+                if hp <= 0:
+                    hp = 0
+                    dead.append(i)
+                pv[i] = hp
+                self.notifyDamageObserver(damage)
+
+                if nextMove == exit:
+                    self.tresorReached = True
+                    if hp > 0:
+                        roster.set_reached(i, True)
+                        for j in dead:
+                            roster.set_alive(j, False)
+                        # Heroes after this one never got their turn
+                        for j in woken:
+                            if j > i:
+                                roster.set_alive(j, False)
+                        self.score = self.compute_score()
+                        return waveResult.from_simulation(self).to_dict()
+            except Exception:
+                print("illegal move")
+        for i in dead:
+            roster.set_alive(i, False)
+
+        self.score = self.compute_score()
+        try:
+            if self.dungeon and hasattr(self.dungeon, "score"):
+                self.score = int(getattr(self.dungeon, "score"))
+        except Exception:
+            pass
+
+        self.notify()
+        wave_res_dict = waveResult.from_simulation(self).to_dict()
+        if not self.level.alive:
+            self.allHeroesDead = True
+        return wave_res_dict
+
     def check_on_treasure(self, hero: Hero) -> bool:
         if hero.coord == self.dungeon.exit:
             self.tresorReached = True
@@ -151,12 +341,12 @@ class Simulation:
         totaldmg += cell.get_damage()
 
         if hero.isAlive : 
-            for row in self.dungeon.grid :
-                for cell in row :
-                    if coord in cell.entity.getrange() :
-                        dmg = cell.return_damage_if_CD()
-                        hero.take_damage(dmg)
-                        totaldmg += dmg
+            # Only the cells whose range covers the hero's tile are visited,
+            # thanks to the dungeon's reverse threat index.
+            for source in list(self.dungeon.threats_at(coord)) :
+                dmg = source.return_damage_if_CD()
+                hero.take_damage(dmg)
+                totaldmg += dmg
 
         return totaldmg
 
@@ -190,13 +380,17 @@ class Simulation:
         self.tresorReached = False
         self.allHeroesDead = False
         self.isSimStarted = False
-        if self.level:
-            self.level.reset()
         try:
-            if self.dungeon and hasattr(self.dungeon, "reset"):
+            if self.level and self.level.layout is not None and self.dungeon is self.level.dungeon:
+                # Level loaded from a save: bring its layout back instead of an empty grid
+                self.level.restore_layout()
+            elif self.dungeon and hasattr(self.dungeon, "reset"):
                 self.dungeon.reset()
         except Exception:
             pass
+        # Paths are computed on the dungeon as it will be played
+        if self.level:
+            self.level.reset()
 
     def get_all_hero_positions(self):
         a = []
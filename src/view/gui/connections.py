@@ -0,0 +1,140 @@
+"""Diffusion des frames vers les clients WebSocket.
+
+Chaque connexion a sa propre file d'envoi bornée, vidée par une tâche
+d'écriture dédiée : `broadcast` se contente de déposer le message dans
+chaque file et ne bloque jamais sur un client lent.
+
+Quand la file d'un client est pleine, les frames en attente sont périmées :
+elles sont remplacées par une seule frame décrivant l'état le plus récent
+(le snapshot fourni par ``resync``, ou à défaut le dernier message). Un
+client dont l'envoi échoue ou dépasse ``send_timeout`` est déconnecté.
+
+Usage:
+    manager = ConnectionManager(resync=lambda: json.dumps(tracker.snapshot()))
+    await manager.connect(websocket)
+    await manager.broadcast(message)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, Optional
+
+SEND_QUEUE_SIZE = 32
+SEND_TIMEOUT = 5.0
+
+
+class ClientConnection:
+    """File d'envoi et tâche d'écriture d'un client.
+
+    Attributes:
+        websocket: Socket du client
+        queue: Messages en attente d'envoi
+        alive: False dès qu'un envoi a échoué
+        dropped: Nombre de messages périmés abandonnés
+    """
+
+    def __init__(self, websocket, queue_size: int, send_timeout: float,
+                 on_dead: Callable[["ClientConnection"], None]) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.send_timeout = send_timeout
+        self.alive = True
+        self.dropped = 0
+        self._on_dead = on_dead
+        self.task = asyncio.get_running_loop().create_task(self._writer())
+
+    def push(self, message: str, resync: Optional[Callable[[], str]] = None) -> None:
+        """Met le message en file, en remplaçant les frames périmées si elle est pleine."""
+        if not self.alive:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(resync() if resync else message)
+
+    async def _writer(self) -> None:
+        while True:
+            message = await self.queue.get()
+            if not await self._send(message):
+                self.alive = False
+                self._on_dead(self)
+                return
+
+    async def _send(self, message: str) -> bool:
+        # asyncio.wait (et non wait_for) laisse toujours passer l'annulation
+        send = asyncio.ensure_future(self.websocket.send_text(message))
+        try:
+            done, _ = await asyncio.wait({send}, timeout=self.send_timeout)
+        except asyncio.CancelledError:
+            send.cancel()
+            raise
+        if not done:
+            send.cancel()
+            return False
+        return send.exception() is None
+
+    def close(self) -> None:
+        self.alive = False
+        self.task.cancel()
+
+
+class ConnectionManager:
+    """Ensemble des clients connectés à la WebSocket.
+
+    Attributes:
+        connections: Connexion de chaque socket
+        resync: Fonction retournant l'état complet courant (snapshot)
+    """
+
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE, send_timeout: float = SEND_TIMEOUT,
+                 resync: Optional[Callable[[], str]] = None) -> None:
+        self.connections: Dict[object, ClientConnection] = {}
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.resync = resync
+
+    @property
+    def active_connections(self) -> list:
+        return list(self.connections)
+
+    async def connect(self, websocket) -> None:
+        await websocket.accept()
+        self.connections[websocket] = ClientConnection(
+            websocket, self.queue_size, self.send_timeout, self._evict
+        )
+
+    def disconnect(self, websocket) -> None:
+        connection = self.connections.pop(websocket, None)
+        if connection is not None:
+            connection.close()
+
+    def _evict(self, connection: ClientConnection) -> None:
+        """Retire un client dont l'envoi a échoué et ferme sa socket."""
+        if self.connections.get(connection.websocket) is connection:
+            del self.connections[connection.websocket]
+        try:
+            asyncio.get_running_loop().create_task(self._close(connection.websocket))
+        except RuntimeError:
+            pass
+
+    @staticmethod
+    async def _close(websocket) -> None:
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    async def send(self, websocket, message: str) -> None:
+        """Envoie un message à un seul client, dans l'ordre de sa file."""
+        connection = self.connections.get(websocket)
+        if connection is not None:
+            connection.push(message, self.resync)
+
+    async def broadcast(self, message: str) -> None:
+        """Dépose le message dans la file de chaque client, sans attendre l'envoi."""
+        for connection in list(self.connections.values()):
+            connection.push(message, self.resync)
@@ -0,0 +1,222 @@
+"""Frames versionnées envoyées aux clients web par la WebSocket.
+
+Au lieu de prévenir les clients par un simple ``"dungeon_updated"`` (qui
+forçait chaque client à re-télécharger toute la grille), le serveur garde
+l'état déjà publié et n'envoie que ce qui a changé depuis la frame
+précédente :
+
+- les cases modifiées, lues dans `Dungeon.changes_since` ;
+- les héros dont la position, les PV ou l'état ont changé ;
+- les drapeaux de fin de vague, le score et le budget s'ils ont changé.
+
+Chaque frame porte un numéro de version. Une frame ``delta`` indique aussi
+la version sur laquelle elle s'applique (``base``) : un client qui n'a pas
+cette version demande un ``snapshot`` complet. Un snapshot est aussi
+envoyé à la connexion, et à la place d'un delta quand le donjon a été
+remplacé (niveau suivant, import) ou que son journal de modifications ne
+remonte plus assez loin.
+
+`GridCache` garde la grille sérialisée de ``GET /api/dungeon`` tant que la
+version du donjon ne change pas, avec un ``ETag`` pour répondre 304.
+
+Usage:
+    tracker = FrameTracker(simulation)
+    frame = tracker.next_frame()      # None si rien n'a changé
+    full = tracker.snapshot()
+
+    etag, body = grid_cache.get(dungeon)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def cell_type(dungeon, coord: Tuple[int, int]) -> str:
+    """Type affiché d'une case (orientation des dragons, entrée, sortie)."""
+    if coord == dungeon.entry:
+        return "START"
+    if coord == dungeon.exit:
+        return "EXIT"
+    entity = dungeon.get_cell(coord).entity
+    if entity is None:
+        return "FLOOR"
+    if entity.type == "DRAGON" and getattr(entity, "orientation", None):
+        return f"DRAGON{entity.orientation}"
+    return entity.type
+
+
+def serialize_grid(dungeon) -> List[List[Dict[str, Any]]]:
+    """Grille complète au format attendu par le client."""
+    rows, cols = dungeon.dimension
+    return [
+        [{"x": c, "y": r, "type": cell_type(dungeon, (r, c))} for c in range(cols)]
+        for r in range(rows)
+    ]
+
+
+def hero_positions(simulation) -> List[Dict[str, int]]:
+    """Positions des héros vivants, au format attendu par le client."""
+    if simulation is None:
+        return []
+    return [
+        {"x": hero.coord[1], "y": hero.coord[0]}
+        for hero in simulation.heroes
+        if hero.isAlive and hero.coord
+    ]
+
+
+class GridCache:
+    """Grille sérialisée du dernier donjon demandé, valable pour une version.
+
+    Les héros n'en font pas partie : leurs déplacements n'invalident pas
+    le cache.
+    """
+
+    def __init__(self) -> None:
+        self._dungeon = None
+        self._version = None
+        self._etag = ""
+        self._body = b""
+
+    def get(self, dungeon) -> Tuple[str, bytes]:
+        """Retourne (etag, corps JSON) de la grille, reconstruits si besoin."""
+        if dungeon is not self._dungeon or dungeon.version != self._version:
+            self._body = json.dumps({
+                "rows": dungeon.dimension[0],
+                "cols": dungeon.dimension[1],
+                "grid": serialize_grid(dungeon),
+            }).encode()
+            self._etag = '"' + hashlib.sha1(self._body).hexdigest()[:16] + '"'
+            self._dungeon = dungeon
+            self._version = dungeon.version
+        return self._etag, self._body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Indique si l'en-tête If-None-Match désigne l'ETag donné."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag[2:] == etag if tag.startswith("W/") else tag == etag for tag in candidates
+    )
+
+
+def hero_state(hero_id: int, hero) -> Dict[str, Any]:
+    coord = hero.coord
+    return {
+        "id": hero_id,
+        "x": coord[1] if coord else None,
+        "y": coord[0] if coord else None,
+        "pv": hero.pv_cur,
+        "alive": bool(hero.isAlive),
+    }
+
+
+class FrameTracker:
+    """Calcule les frames successives d'une simulation.
+
+    Attributes:
+        simulation: Simulation suivie (peut être remplacée au niveau suivant)
+        version: Numéro de la dernière frame produite
+    """
+
+    def __init__(self, simulation=None) -> None:
+        self.simulation = simulation
+        self.version = 0
+        self._simulation = None
+        self._dungeon = None
+        self._dungeon_version = None
+        self._heroes: Dict[int, Dict[str, Any]] = {}
+        self._flags: Dict[str, Any] = {}
+
+    def _flags_of(self) -> Dict[str, Any]:
+        sim = self.simulation
+        return {
+            "tresorReached": bool(sim.tresorReached),
+            "allHeroesDead": bool(sim.allHeroesDead),
+            "score": sim.score,
+            "money": sim.current_budget,
+            "level": sim.level.difficulty if sim.level else 1,
+        }
+
+    def _remember(self) -> None:
+        """Retient l'état courant comme état publié."""
+        sim = self.simulation
+        self._simulation = sim
+        self._dungeon = sim.dungeon
+        self._dungeon_version = sim.dungeon.version
+        self._heroes = {i: hero_state(i, h) for i, h in enumerate(sim.heroes)}
+        self._flags = self._flags_of()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """État complet à la version courante (connexion ou rattrapage).
+
+        Ne modifie pas l'état publié : les changements pas encore diffusés
+        figureront aussi dans le prochain delta, qui reste applicable.
+        """
+        sim = self.simulation
+        dungeon = sim.dungeon
+        heroes = [hero_state(i, h) for i, h in enumerate(sim.heroes)]
+        return {
+            "type": "snapshot",
+            "version": self.version,
+            "rows": dungeon.dimension[0],
+            "cols": dungeon.dimension[1],
+            "grid": serialize_grid(dungeon),
+            "heros": [h for h in heroes if h["alive"] and h["x"] is not None],
+            "heroes": heroes,
+            **self._flags_of(),
+        }
+
+    def next_frame(self) -> Optional[Dict[str, Any]]:
+        """Frame décrivant les changements depuis la précédente.
+
+        Returns:
+            Un delta, un snapshot si la simulation ou le donjon a été remplacé ou si l'écart
+            n'est plus reconstructible, ou None si rien n'a changé.
+        """
+        sim = self.simulation
+        if sim is None or sim.dungeon is None:
+            return None
+
+        dungeon = sim.dungeon
+        changes = None
+        if sim is self._simulation and dungeon is self._dungeon:
+            changes = dungeon.changes_since(self._dungeon_version)
+        if changes is None:
+            self._remember()
+            self.version += 1
+            return self.snapshot()
+
+        cells = [
+            {"x": c, "y": r, "type": cell_type(dungeon, (r, c))}
+            for r, c in dict.fromkeys(changes)
+        ]
+        heroes = []
+        for i, hero in enumerate(sim.heroes):
+            state = hero_state(i, hero)
+            if self._heroes.get(i) != state:
+                heroes.append(state)
+                self._heroes[i] = state
+        flags = {
+            key: value for key, value in self._flags_of().items()
+            if self._flags.get(key) != value
+        }
+        self._flags.update(flags)
+        self._dungeon_version = dungeon.version
+
+        if not (cells or heroes or flags):
+            return None
+        self.version += 1
+        return {
+            "type": "delta",
+            "version": self.version,
+            "base": self.version - 1,
+            "cells": cells,
+            "heroes": heroes,
+            "flags": flags,
+        }
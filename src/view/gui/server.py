@@ -1,9 +1,9 @@
 import sys
 import os
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import List
 import asyncio
 from pydantic import BaseModel
@@ -17,171 +17,178 @@ root_dir = os.path.abspath(os.path.join(current_dir, "../../../"))
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
-from src.observers.Observer import Observer
 from src.simulation import Simulation
 from src.commands.importDungeon import importDungeon
+from src.view.gui.frames import etag_matches, hero_positions
+from src.view.gui.sessions import GameSession, SessionLimitError, SessionRegistry
 
-# --- WEBSOCKETS ---
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+# Fréquence de l'éviction des sessions inactives (secondes)
+SESSION_EVICTION_PERIOD = 60
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+# --- SESSIONS ---
+# Chaque client joue sa propre partie, retrouvée par l'identifiant de session
+# présent dans les chemins /api/session/{session_id}/... et /ws/{session_id}
+class GuiContext:
+    campaign_path = "campaign.json"
+    # Répertoire des journaux de rejeu des sessions (désactivé si vide)
+    replay_dir = os.environ.get("DUNGEON_REPLAY_DIR")
+    # La partie passée à run_server est remise au premier client sans session
+    default_claimed = False
 
-manager = ConnectionManager()
+DEFAULT_SESSION_ID = "default"
 
-class DungeonObserver(Observer):
-    def __init__(self, manager: ConnectionManager):
-        self.manager = manager
+context = GuiContext()
+sessions = SessionRegistry(
+    lambda sid: GameSession.from_campaign(sid, context.campaign_path, context.replay_dir)
+)
+app = FastAPI()
 
-    def update(self):
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:  # 'get_running_loop' fails if no loop is running
-            loop = None
+def get_session(session_id: str) -> GameSession:
+    """Session demandée ; 404 si elle est inconnue ou a été évincée."""
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session inconnue ou expirée")
+    return session
 
-        if loop and loop.is_running():
-            loop.create_task(self.manager.broadcast("dungeon_updated"))
-        else:
-            print("No running event loop to schedule broadcast")
+async def evict_idle_sessions():
+    while True:
+        await asyncio.sleep(SESSION_EVICTION_PERIOD)
+        sessions.evict_idle()
 
-# --- CONTEXTE GLOBAL ---
-# Stocke uniquement le donjon à afficher
-class GuiContext:
-    dungeon = None
-    input_handler = None
-    simulation = None
-    game_controller = None
-
-context = GuiContext()
-app = FastAPI()
+@app.on_event("startup")
+async def start_session_eviction():
+    asyncio.get_running_loop().create_task(evict_idle_sessions())
 
 class PlaceEntityRequest(BaseModel):
     type_entity: str
     x: int
     y: int
 
+class WaveSpeedRequest(BaseModel):
+    ticks_per_second: float
+
 class SaveDungeonRequest(BaseModel):
     filename: str
     campaign_progress: list = []
 
 # --- ENDPOINTS ---
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+@app.post("/api/sessions")
+async def create_session():
+    """Crée une nouvelle partie et retourne son identifiant.
+
+    Le premier client reçoit la partie lancée en ligne de commande (session
+    "default"). 503 si toutes les sessions ont un client connecté.
+    """
+    if not context.default_claimed and sessions.get(DEFAULT_SESSION_ID) is not None:
+        context.default_claimed = True
+        return JSONResponse({"session_id": DEFAULT_SESSION_ID})
+    try:
+        session = sessions.create()
+    except SessionLimitError:
+        raise HTTPException(status_code=503, detail="Trop de parties en cours, réessayez plus tard")
+    return JSONResponse({"session_id": session.id})
+
+@app.delete("/api/session/{session_id}")
+async def delete_session(session_id: str):
+    get_session(session_id)
+    sessions.remove(session_id)
+    return JSONResponse({"deleted": True})
+
+@app.websocket("/ws/{session_id}")
+async def websocket_endpoint(websocket: WebSocket, session_id: str):
+    """Envoie un snapshot à la connexion puis les deltas de chaque tick.
+
+    Un client qui a manqué une version renvoie "snapshot" pour recevoir à
+    nouveau l'état complet.
+    """
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.close(code=4404)
+        return
+    manager = session.manager
+    frame_tracker = session.frame_tracker
     await manager.connect(websocket)
     try:
+        if frame_tracker.simulation:
+            await manager.send(websocket, json.dumps(frame_tracker.snapshot()))
         while True:
-            await websocket.receive_text() # Just keep connection open
+            message = await websocket.receive_text()
+            if message == "snapshot" and frame_tracker.simulation:
+                await manager.send(websocket, json.dumps(frame_tracker.snapshot()))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
 
-@app.get("/api/dungeon")
-async def get_dungeon():
-    """Renvoie l'état statique du donjon (Grille, Murs, Pièges, Entrée, Sortie)."""
-    if not context.dungeon:
-        return JSONResponse({"error": "Aucun donjon chargé"}, status_code=500)
+@app.get("/api/session/{session_id}/dungeon")
+async def get_dungeon(session_id: str, request: Request):
+    """Renvoie l'état statique du donjon (Grille, Murs, Pièges, Entrée, Sortie).
 
-    # Utiliser toujours le donjon de la simulation pour être sûr d'être synchro
-    dng = context.simulation.dungeon if context.simulation and context.simulation.dungeon else context.dungeon
-    
-    print(f"API Dungeon: Using dungeon from simulation, Level: {context.simulation.level.difficulty if context.simulation and context.simulation.level else 'unknown'}")
-
-   
-    # Sérialisation de la grille
-    serialized_grid = []
-    for r, row in enumerate(dng.grid):
-        row_data = []
-        for c, cell in enumerate(row):
-            # Type par défaut
-            entity_type = cell.entity.type if cell.entity else "FLOOR"
-            # Si l'entité est un dragon, inclure son orientation pour le frontend
-            try:
-                if cell.entity and getattr(cell.entity, 'type', None) == 'DRAGON' and hasattr(cell.entity, 'orientation'):
-                    # orientation est une lettre 'U','D','L' ou 'R'
-                    entity_type = f"DRAGON{cell.entity.orientation}"
-            except Exception:
-                # En cas d'entité malformée, conserver le type par défaut
-                pass
-            
-            # Surcharge pour l'affichage visuel (Départ / Arrivée)
-            if (r, c) == dng.entry:
-                entity_type = "START"
-            elif (r, c) == dng.exit:
-                entity_type = "EXIT"
-            
-            
-            row_data.append({
-                "x": c, 
-                "y": r, 
-                "type": entity_type
-            })
-            
-            # Log pour la position où on a placé la bombe (2, 0)
-            if r == 0 and c == 2:
-                print(f"Cell at ({r}, {c}) in serialization: entity_type = {entity_type}")
-        serialized_grid.append(row_data)
-
-    hero_positions = []
-    if context.simulation and context.simulation.heroes:
-        try:
-            for hero in context.simulation.heroes:
-                if hero.isAlive and hero.coord:
-                    hero_positions.append({"x": hero.coord[1], "y": hero.coord[0]})
-        except:
-            pass
+    La grille sérialisée est mise en cache par version du donjon ; un client
+    qui envoie l'ETag courant dans If-None-Match reçoit un 304 sans corps.
+    """
+    session = get_session(session_id)
+    dng = session.current_dungeon()
+    if not dng:
+        return JSONResponse({"error": "Aucun donjon chargé"}, status_code=500)
 
+    etag, body = session.grid_cache.get(dng)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/api/session/{session_id}/heroes")
+async def get_heroes(session_id: str):
+    """Positions des héros vivants et état de la vague (hors cache de la grille)."""
+    session = get_session(session_id)
+    sim = session.simulation
     return JSONResponse({
-        "rows": dng.dimension[0],
-        "cols": dng.dimension[1],
-        "grid": serialized_grid,
-        "heros": hero_positions,
-        "tresorReached": context.simulation.tresorReached if context.simulation else False,
-        "allHeroesDead": context.simulation.allHeroesDead if context.simulation else False
+        "heros": hero_positions(sim),
+        "tresorReached": sim.tresorReached if sim else False,
+        "allHeroesDead": sim.allHeroesDead if sim else False
     })
 
-@app.post("/api/place_entity/")
-async def place_entity(request: PlaceEntityRequest):
-    if not context.input_handler:
+@app.post("/api/session/{session_id}/place_entity/")
+async def place_entity(session_id: str, request: PlaceEntityRequest):
+    session = get_session(session_id)
+    if not session.input_handler:
         return JSONResponse({"entity_placed": "true"})
 
     # Log pour vérifier quel donjon est utilisé
-    print(f"Placing entity at ({request.y}, {request.x}) on dungeon level: {context.simulation.level.difficulty if context.simulation and context.simulation.level else 'unknown'}")
+    print(f"Placing entity at ({request.y}, {request.x}) on dungeon level: {session.simulation.level.difficulty if session.simulation and session.simulation.level else 'unknown'}")
 
     # Le modèle attend les coordonnées en (row, col), ce qui correspond à (y, x)
     # venant du front-end.
     match request.type_entity:
         case "trap":
-            context.input_handler.place_trap((request.y, request.x))
+            session.input_handler.place_trap((request.y, request.x))
         case "wall":
-            context.input_handler.place_wall((request.y, request.x))
+            session.input_handler.place_wall((request.y, request.x))
         case "dragonU":
-            context.input_handler.place_dragon((request.y, request.x), orientation="U")
+            session.input_handler.place_dragon((request.y, request.x), orientation="U")
         case "dragonL":
-            context.input_handler.place_dragon((request.y, request.x), orientation="L")
+            session.input_handler.place_dragon((request.y, request.x), orientation="L")
         case "dragonD":
-            context.input_handler.place_dragon((request.y, request.x), orientation="D")
+            session.input_handler.place_dragon((request.y, request.x), orientation="D")
         case "dragonR":
-            context.input_handler.place_dragon((request.y, request.x), orientation="R")
+            session.input_handler.place_dragon((request.y, request.x), orientation="R")
         case "bombe":
-            context.input_handler.place_bombe((request.y, request.x))
+            session.input_handler.place_bombe((request.y, request.x))
         case "floor":
-            context.input_handler.remove_entity((request.y, request.x))
+            session.input_handler.remove_entity((request.y, request.x))
+
+    session.observer.update()
 
-    return JSONResponse({"entity_placed": "true"})
+    # Le suivi de connexion se met à jour à partir des seules cases modifiées
+    return JSONResponse({
+        "entity_placed": "true",
+        "path_open": session.get_connectivity().is_connected()
+    })
 
-@app.get("/api/dungeon_data")
-async def get_dungeon_data():
-    if not context.simulation:
+@app.get("/api/session/{session_id}/dungeon_data")
+async def get_dungeon_data(session_id: str):
+    session = get_session(session_id)
+    if not session.simulation:
         return JSONResponse({"error": "Aucune simulation chargée"}, status_code=500)
 
     prices = {
@@ -196,70 +203,96 @@ async def get_dungeon_data():
     }
 
     return JSONResponse({
-        "money": context.simulation.current_budget,
+        "money": session.simulation.current_budget,
         "prices": prices,
-        "level": context.simulation.level.difficulty if context.simulation.level else 1,
-        "score": context.simulation.score if hasattr(context.simulation, 'score') else 0
+        "level": session.simulation.level.difficulty if session.simulation.level else 1,
+        "score": session.simulation.score if hasattr(session.simulation, 'score') else 0
     })
 
 
 
-@app.get("/api/next_level/")
-async def next_level():
-    if not context.input_handler:
+@app.get("/api/session/{session_id}/next_level/")
+async def next_level(session_id: str):
+    session = get_session(session_id)
+    if not session.input_handler:
         return JSONResponse({"next_level_change": "false"})
 
+    session.wave_loop.stop()
+
     # 1. On demande à l'handler de charger le niveau suivant
     # (Cela modifie self.simulation à l'intérieur de input_handler)
-    context.input_handler.load_next_level()
-    
-    # 2. CORRECTION CRITIQUE : On met à jour les références du serveur
-    # pour qu'elles pointent vers la NOUVELLE simulation créée par l'handler
-    context.simulation = context.input_handler.simulation
-    context.dungeon = context.input_handler.dungeon
+    session.input_handler.load_next_level()
     
-    # 3. CORRECTION IMPORTANTE : Réattacher l'Observer WebSocket
-    # La nouvelle simulation est toute neuve, elle n'a pas d'observer.
-    # Si on ne fait pas ça, le serveur ne préviendra plus le frontend des mises à jour.
-    observer = DungeonObserver(manager)
-    context.simulation.attach(observer)
+    # 2. CORRECTION CRITIQUE : On met à jour les références de la session
+    # pour qu'elles pointent vers la simulation de l'handler, et on y
+    # réattache l'Observer WebSocket
+    session.set_simulation(session.input_handler.simulation)
+    session.dungeon = session.input_handler.dungeon
+    session.observer.update()
     
-    print(f">>> Passage au niveau suivant. Difficulté: {context.simulation.level.difficulty}")
+    print(f">>> Passage au niveau suivant. Difficulté: {session.simulation.level.difficulty}")
     
     return JSONResponse({"next_level_change": "true"})
 
-@app.get("/api/start_simulation/")
-async def start_simulation():
-    if not context.input_handler:
+@app.get("/api/session/{session_id}/start_simulation/")
+async def start_simulation(session_id: str):
+    session = get_session(session_id)
+    if not session.input_handler:
         return JSONResponse({"simulation_started": "false", "error": "No input handler."})
 
     # The start_wave method returns False if a path is blocked
-    if not context.input_handler.start_wave():
+    if not session.input_handler.start_wave():
         return JSONResponse({"simulation_started": "false", "error": "Un chemin est bloqué, la simulation ne peut pas commencer."})
     
     return JSONResponse({"simulation_started": "true"})
 
-@app.post("/api/reset_simulation")
-async def reset_simulation():
-    if not context.simulation:
+@app.get("/api/session/{session_id}/wave")
+async def wave_state(session_id: str):
+    session = get_session(session_id)
+    return JSONResponse(session.wave_loop.state())
+
+@app.post("/api/session/{session_id}/wave/pause")
+async def pause_wave(session_id: str):
+    session = get_session(session_id)
+    session.wave_loop.pause()
+    return JSONResponse(session.wave_loop.state())
+
+@app.post("/api/session/{session_id}/wave/resume")
+async def resume_wave(session_id: str):
+    session = get_session(session_id)
+    session.wave_loop.resume()
+    return JSONResponse(session.wave_loop.state())
+
+@app.post("/api/session/{session_id}/wave/speed")
+async def set_wave_speed(session_id: str, request: WaveSpeedRequest):
+    session = get_session(session_id)
+    try:
+        session.wave_loop.set_speed(request.ticks_per_second)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return JSONResponse(session.wave_loop.state())
+
+@app.post("/api/session/{session_id}/reset_simulation")
+async def reset_simulation(session_id: str):
+    session = get_session(session_id)
+    if not session.simulation:
         return JSONResponse({"error": "Aucune simulation chargée"}, status_code=500)
     
     try:
-        # Réinitialiser la simulation
-        context.simulation.reset()
-        context.simulation.isSimStarted = False
+        # Arrêter la vague en cours puis réinitialiser la simulation
+        session.wave_loop.stop()
+        session.simulation.reset()
+        session.simulation.isSimStarted = False
         
         # Remettre les héros à leur position de départ et désactivés
-        if context.simulation.heroes and context.simulation.dungeon:
-            for hero in context.simulation.heroes:
-                hero.coord = context.simulation.dungeon.entry
+        if session.simulation.heroes and session.simulation.dungeon:
+            for hero in session.simulation.heroes:
+                hero.coord = session.simulation.dungeon.entry
                 hero.isAlive = False
                 hero.stepsTaken = 0
-        # Notifier les observers et forcer un broadcast websocket
+        # Notifier les observers (le donjon vidé part en snapshot)
         try:
-            context.simulation.notify()
-            # manager.broadcast est async - on l'attend pour garantir l'envoi
-            await manager.broadcast("dungeon_updated")
+            session.simulation.notify()
         except Exception:
             # Ne pas empêcher la réponse en cas d'erreur de notification
             pass
@@ -268,60 +301,65 @@ async def reset_simulation():
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
-@app.post("/api/save_dungeon")
-async def save_dungeon(request: SaveDungeonRequest):
-    if not context.dungeon:
+@app.post("/api/session/{session_id}/save_dungeon")
+async def save_dungeon(session_id: str, request: SaveDungeonRequest):
+    session = get_session(session_id)
+    if not session.dungeon:
         return JSONResponse({"error": "Aucun donjon chargé"}, status_code=500)
     
-    if not context.game_controller:
+    if not session.game_controller:
         return JSONResponse({"error": "Game controller non disponible"}, status_code=500)
     
     try:
         from src.commands.exportDungeon import exportDungeon
         
         # Créer la commande d'export avec le filename et la progression de campagne
-        command = exportDungeon(context.dungeon, request.filename, request.campaign_progress)
-        command.execute(context.game_controller)
+        command = exportDungeon(session.dungeon, request.filename, request.campaign_progress)
+        command.execute(session.game_controller)
         
         return JSONResponse({"saved": "true", "filename": request.filename})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
-@app.post("/api/move_hero")
-async def move_hero():
-    if not context.simulation:
+@app.post("/api/session/{session_id}/move_hero")
+async def move_hero(session_id: str):
+    session = get_session(session_id)
+    if not session.simulation:
         return JSONResponse({"error": "Aucune simulation chargée"}, status_code=500)
     
     try:
-        result = context.simulation.step()
+        result = session.simulation.step()
+        # La fin de vague (trésor atteint) ne passe pas par notify()
+        session.observer.update()
         return JSONResponse({
             "hero_moved": "true",
             "result": result,
-            "tresorReached": context.simulation.tresorReached,
-            "allHeroesDead": context.simulation.allHeroesDead
+            "tresorReached": session.simulation.tresorReached,
+            "allHeroesDead": session.simulation.allHeroesDead
         })
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
-@app.post("/api/import_dungeon")
-async def api_import_dungeon():
-    """Appelle uniquement `context.input_handler.import_dungeon()`.
+@app.post("/api/session/{session_id}/import_dungeon")
+async def api_import_dungeon(session_id: str):
+    """Appelle uniquement `session.input_handler.import_dungeon()`.
 
     Ce endpoint ne prend aucun payload et délègue l'import à
     l'`InputHandler` côté serveur (méthode `import_dungeon`).
     """
-    if not context.input_handler:
+    session = get_session(session_id)
+    if not session.input_handler:
         return JSONResponse({"error": "Aucun input_handler configuré"}, status_code=500)
 
     try:
         # N'exécute que la méthode publique de l'input handler.
-        context.input_handler.import_dungeon()
+        session.input_handler.import_dungeon()
         
         # Mettre à jour le contexte global avec le nouveau donjon
-        context.dungeon = context.simulation.dungeon
+        session.dungeon = session.simulation.dungeon
         
-        # Broadcast WebSocket pour forcer le client à rafraîchir
-        await manager.broadcast("dungeon_updated")
+        # Le donjon a été remplacé : les clients reçoivent un snapshot
+        session.observer.update()
         
         return JSONResponse({"imported": True})
     except Exception as e:
@@ -334,15 +372,17 @@ app.mount("/", StaticFiles(directory=static_path, html=True), name="static")
 # --- FONCTION DE LANCEMENT ---
 def run_server(dungeon_instance, input_handler, simulation):
     """
-    Configure le contexte avec le donjon fourni et lance le serveur.
+    Enregistre la partie fournie comme session "default" et lance le serveur.
+
+    Le premier client sans session la reçoit de POST /api/sessions (ou
+    l'ouvre avec ?session=default) ; les suivants obtiennent leur propre
+    session.
     """
-    context.dungeon = dungeon_instance
-    context.input_handler = input_handler
-    context.simulation = simulation
-    context.game_controller = input_handler.invoker.game_controller if input_handler and input_handler.invoker else None
-    
-    dungeon_observer = DungeonObserver(manager)
-    simulation.attach(dungeon_observer)
+    if input_handler and input_handler.campaign:
+        context.campaign_path = input_handler.campaign.campaign_json_path
+    session = GameSession(DEFAULT_SESSION_ID, input_handler, simulation)
+    session.dungeon = dungeon_instance
+    sessions.add(session)
 
     print(f"🚀 Serveur GUI lancé sur http://0.0.0.0:8000")
     print(f"Donjon de taille {dungeon_instance.dimension} chargé.")
@@ -0,0 +1,244 @@
+"""Parties indépendantes du serveur web, une par session.
+
+Chaque `GameSession` possède sa simulation, son contrôleur de jeu (et donc
+son `GameInvoker`), son observateur, sa boucle de vague, ses clients
+WebSocket et ses caches. Le serveur les retrouve par l'identifiant de
+session présent dans les chemins REST et l'URL de la WebSocket.
+
+`SessionRegistry` borne la mémoire utilisée : les sessions sans client
+connecté et inactives depuis ``idle_timeout`` sont évincées, et au-delà de
+``max_sessions`` la session sans client la moins récemment utilisée est
+fermée. Une session dont un client est connecté n'est jamais évincée : si
+toutes le sont, la création est refusée (`SessionLimitError`).
+
+Usage:
+    registry = SessionRegistry(lambda sid: GameSession.from_campaign(sid))
+    session = registry.create()          # SessionLimitError si tout est occupé
+    session = registry.get(session_id)   # None si inconnue ou évincée
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from src.controller.game_controller import GameController
+from src.controller.wave_loop import WaveLoop
+from src.model.campaign_manager import Campaign
+from src.model.connectivity import ReachabilityTracker
+from src.observers.Observer import Observer
+from src.replay import ReplayLog
+from src.simulation import Simulation
+from src.view.gui.connections import ConnectionManager
+from src.view.gui.frames import FrameTracker, GridCache
+from src.view.input_handler import InputHandler
+
+MAX_SESSIONS = int(os.environ.get("DUNGEON_MAX_SESSIONS", 512))
+SESSION_IDLE_TIMEOUT = 30 * 60.0
+
+
+class SessionLimitError(RuntimeError):
+    """Toutes les sessions ont un client connecté : aucune ne peut être évincée."""
+
+
+class DungeonObserver(Observer):
+    """Diffuse aux clients les changements de la simulation sous forme de frames."""
+
+    def __init__(self, manager: ConnectionManager, tracker: FrameTracker):
+        self.manager = manager
+        self.tracker = tracker
+
+    def update(self):
+        frame = self.tracker.next_frame()
+        if frame is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # 'get_running_loop' fails if no loop is running
+            loop = None
+
+        if loop and loop.is_running():
+            loop.create_task(self.manager.broadcast(json.dumps(frame)))
+
+
+class GameSession:
+    """Partie d'un client.
+
+    Attributes:
+        id: Identifiant de la session
+        simulation, input_handler, game_controller: Partie en cours
+        dungeon: Donjon de départ (celui de la simulation prime)
+        manager: Clients WebSocket de la session
+        frame_tracker, observer: Production et diffusion des frames
+        wave_loop: Boucle de vague de la session
+        replay_log: Journal de rejeu de la partie (None si désactivé)
+        grid_cache: Grille sérialisée de GET /dungeon
+        last_seen: Horodatage de la dernière requête
+    """
+
+    def __init__(self, session_id: str, input_handler: InputHandler, simulation: Simulation,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.id = session_id
+        self.input_handler = input_handler
+        self.simulation = None
+        self.dungeon = simulation.dungeon
+        self.game_controller = (
+            input_handler.invoker.game_controller if input_handler and input_handler.invoker else None
+        )
+        self.connectivity: Optional[ReachabilityTracker] = None
+        self.grid_cache = GridCache()
+        self.replay_log: Optional[ReplayLog] = None
+
+        # Un client en retard reçoit l'état complet à la place des frames périmées
+        self.frame_tracker = FrameTracker()
+        self.manager = ConnectionManager(resync=lambda: json.dumps(self.frame_tracker.snapshot()))
+        self.observer = DungeonObserver(self.manager, self.frame_tracker)
+        # La vague tourne côté serveur ; chaque tick pousse sa frame aux clients
+        self.wave_loop = WaveLoop(on_tick=self.observer.update)
+        if self.game_controller:
+            self.game_controller.wave_loop = self.wave_loop
+
+        self._clock = clock
+        self.last_seen = clock()
+        self.set_simulation(simulation)
+
+    @classmethod
+    def from_campaign(cls, session_id: str, campaign_path: str = "campaign.json",
+                      replay_dir: Optional[str] = None) -> GameSession:
+        """Nouvelle partie au premier niveau de la campagne.
+
+        Avec ``replay_dir``, la partie est journalisée dans
+        ``<replay_dir>/<session_id>.jsonl`` (cf. `src.replay`).
+        """
+        campaign = Campaign(campaign_path)
+        level = campaign.load_level(1)
+        if not level:
+            raise ValueError(f"{campaign_path}: impossible de charger le niveau 1")
+        simulation = Simulation(level, level.dungeon)
+        controller = GameController(None, simulation, campaign)
+        input_handler = InputHandler(simulation, simulation.dungeon, controller.invoker, campaign)
+        session = cls(session_id, input_handler, simulation)
+        if replay_dir:
+            os.makedirs(replay_dir, exist_ok=True)
+            path = os.path.join(replay_dir, f"{session_id}.jsonl")
+            session.replay_log = ReplayLog(path).attach(controller)
+        return session
+
+    def set_simulation(self, simulation: Simulation) -> None:
+        """Suit une nouvelle simulation (niveau suivant)."""
+        if self.simulation is not None and self.simulation is not simulation:
+            self.simulation.detach(self.observer)
+        self.simulation = simulation
+        self.frame_tracker.simulation = simulation
+        simulation.attach(self.observer)
+
+    def current_dungeon(self):
+        """Donjon affiché : celui de la simulation en priorité."""
+        if self.simulation and self.simulation.dungeon:
+            return self.simulation.dungeon
+        return self.dungeon
+
+    def get_connectivity(self) -> ReachabilityTracker:
+        """Suivi entrée/sortie du donjon courant, recréé si le donjon a changé."""
+        dng = self.current_dungeon()
+        if self.connectivity is None or self.connectivity.dungeon is not dng:
+            self.connectivity = ReachabilityTracker(dng)
+        return self.connectivity
+
+    def touch(self) -> None:
+        self.last_seen = self._clock()
+
+    def is_idle(self, idle_timeout: float) -> bool:
+        """Session sans client connecté ni requête depuis ``idle_timeout``."""
+        return not self.manager.connections and self._clock() - self.last_seen > idle_timeout
+
+    def close(self) -> None:
+        """Arrête la vague, le préchargement des niveaux et déconnecte les clients."""
+        self.wave_loop.stop()
+        if self.replay_log is not None:
+            self.replay_log.close()
+        self.simulation.detach(self.observer)
+        campaign = getattr(self.game_controller, "campaign", None)
+        if isinstance(campaign, Campaign):
+            campaign.close()
+        for websocket in self.manager.active_connections:
+            self.manager.disconnect(websocket)
+
+
+class SessionRegistry:
+    """Sessions actives, de la moins à la plus récemment utilisée.
+
+    Attributes:
+        factory: Construit une session à partir de son identifiant
+        max_sessions: Nombre maximal de sessions gardées en mémoire
+        idle_timeout: Inactivité (secondes) au-delà de laquelle une session
+            sans client est évincée
+    """
+
+    def __init__(self, factory: Callable[[str], GameSession], max_sessions: int = MAX_SESSIONS,
+                 idle_timeout: float = SESSION_IDLE_TIMEOUT) -> None:
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def create(self) -> GameSession:
+        """Crée une session, en faisant de la place si nécessaire.
+
+        Raises:
+            SessionLimitError: Si la limite est atteinte et que toutes les
+                sessions ont un client connecté
+        """
+        self._make_room()
+        session_id = secrets.token_urlsafe(12)
+        while session_id in self.sessions:
+            session_id = secrets.token_urlsafe(12)
+        return self.add(self.factory(session_id))
+
+    def add(self, session: GameSession) -> GameSession:
+        """Enregistre une session déjà construite.
+
+        Raises:
+            SessionLimitError: Comme `create`
+        """
+        self._make_room()
+        self.sessions[session.id] = session
+        return session
+
+    def _make_room(self) -> None:
+        """Évince les sessions inactives puis, si besoin, les moins récentes sans client."""
+        self.evict_idle()
+        while len(self.sessions) >= self.max_sessions:
+            unused = next((sid for sid, s in self.sessions.items() if not s.manager.connections), None)
+            if unused is None:
+                raise SessionLimitError(f"{len(self.sessions)} sessions avec des clients connectés")
+            self.remove(unused)
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        """Retourne la session et la marque comme utilisée."""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.touch()
+            self.sessions.move_to_end(session_id)
+        return session
+
+    def remove(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+
+    def evict_idle(self) -> int:
+        """Ferme les sessions inactives et retourne leur nombre."""
+        idle = [sid for sid, s in self.sessions.items() if s.is_idle(self.idle_timeout)]
+        for session_id in idle:
+            self.remove(session_id)
+        return len(idle)
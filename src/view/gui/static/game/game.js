@@ -16,7 +16,36 @@ const config = {
     }
 };
 
-const game = new Phaser.Game(config);
+// Chaque onglet joue sa propre partie côté serveur (session)
+let sessionId = null;
+let game = null;
+
+function api(path) {
+    return `/api/session/${sessionId}/${path}`;
+}
+
+async function resolveSession() {
+    const requested = new URLSearchParams(window.location.search).get('session')
+        || sessionStorage.getItem('sessionId');
+    if (requested) {
+        const resp = await fetch(`/api/session/${requested}/wave`);
+        if (resp.ok) {
+            sessionStorage.setItem('sessionId', requested);
+            return requested;
+        }
+    }
+    // Session inconnue ou expirée : on en crée une nouvelle
+    const data = await (await fetch('/api/sessions', { method: 'POST' })).json();
+    sessionStorage.setItem('sessionId', data.session_id);
+    return data.session_id;
+}
+
+resolveSession()
+    .then(id => {
+        sessionId = id;
+        game = new Phaser.Game(config);
+    })
+    .catch(err => console.error("Impossible d'ouvrir une session:", err));
 
 const TILE_WIDTH = 64;
 const TILE_HEIGHT = 32;
@@ -25,10 +54,15 @@ const TILE_HEIGHT = 32;
 let gridObjects = [];
 let selectedEntityType = 'trap';
 let gameStarted = false;
-let heroMoveInterval = null;
+let wavePaused = false;
 let gameEnded = false; // Nouvelle variable pour suivre la fin du jeu
 let isInitialLoad = true; // Pour la gestion du rafraîchissement en cas de défaite
 
+// État reconstruit à partir des frames WebSocket (snapshot puis deltas)
+let dungeonState = null;
+let frameVersion = -1;
+let awaitingSnapshot = false;
+
 function preload() {
     this.load.image('floor', 'assets/floor.png');
     this.load.image('wall', 'assets/wall.png');
@@ -51,17 +85,14 @@ function create() {
 
     // Connexion WebSocket
     const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    const ws = new WebSocket(`${wsProtocol}//${window.location.host}/ws`);
+    const ws = new WebSocket(`${wsProtocol}//${window.location.host}/ws/${sessionId}`);
 
     ws.onopen = () => {
         console.log("WebSocket connection established.");
     };
 
     ws.onmessage = (event) => {
-        if (event.data === "dungeon_updated") {
-            console.log("Dungeon update received. Refreshing...");
-            refreshDungeon(scene, true);
-        }
+        applyFrame(scene, ws, JSON.parse(event.data));
     };
 
     // Gestion de la sélection dans la sidebar
@@ -91,6 +122,33 @@ function create() {
         }
     });
 
+    // Pause / reprise et vitesse de la vague (jouée par le serveur)
+    const pauseButton = document.getElementById('pause-button');
+    if (pauseButton) {
+        pauseButton.addEventListener('click', () => {
+            if (!gameStarted) return;
+            const action = wavePaused ? 'resume' : 'pause';
+            fetch(api(`wave/${action}`), { method: 'POST' })
+                .then(res => res.json())
+                .then(state => {
+                    wavePaused = state.paused;
+                    pauseButton.textContent = wavePaused ? 'Reprendre' : 'Pause';
+                })
+                .catch(err => console.error('Erreur pause/reprise:', err));
+        });
+    }
+
+    const speedSelect = document.getElementById('speed-select');
+    if (speedSelect) {
+        speedSelect.addEventListener('change', () => {
+            fetch(api('wave/speed'), {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ ticks_per_second: parseFloat(speedSelect.value) })
+            }).catch(err => console.error('Erreur vitesse:', err));
+        });
+    }
+
     // Gestion du bouton réinitialiser
     const resetButton = document.getElementById('reset-button');
     if(resetButton){
@@ -113,7 +171,7 @@ function create() {
         importBtn.addEventListener('click', async () => {
             setImportStatus('Import en cours...');
             try{
-                const resp = await fetch('/api/import_dungeon', { method: 'POST' });
+                const resp = await fetch(api('import_dungeon'), { method: 'POST' });
                 if(resp.ok){
                     setImportStatus('Donjon importé avec succès.');
                     
@@ -202,10 +260,14 @@ function refreshDungeon(scene, forceRebuild = false) {
     console.log("refreshDungeon called with forceRebuild:", forceRebuild, "gridObjects.length:", gridObjects.length);
     displayGameStatusMessage(''); // Cache le message de statut à chaque rafraîchissement
     
-    // Récupérer les nouvelles données du donjon (avec cache-busting)
-    fetch('/api/dungeon?t=' + new Date().getTime())
-        .then(res => res.json())
-        .then(data => {
+    // La grille est revalidée par ETag (304 si inchangée), les héros viennent
+    // d'un endpoint séparé pour ne pas invalider le cache de la grille
+    Promise.all([
+        fetch(api('dungeon'), { cache: 'no-cache' }).then(res => res.json()),
+        fetch(api('heroes')).then(res => res.json())
+    ])
+        .then(([grid, heroes]) => {
+            const data = { ...grid, ...heroes };
             console.log("Dungeon data received:", data);
 
             if (isInitialLoad) {
@@ -243,7 +305,7 @@ function refreshDungeon(scene, forceRebuild = false) {
         .catch(err => console.error("Erreur chargement donjon:", err));
 
     // Récupérer les données de la sidebar (argent, prix)
-    fetch('/api/dungeon_data')
+    fetch(api('dungeon_data'))
         .then(res => res.json())
         .then(data => {
             console.log("Sidebar data received:", data);
@@ -252,6 +314,65 @@ function refreshDungeon(scene, forceRebuild = false) {
         .catch(err => console.error("Erreur chargement données sidebar:", err));
 }
 
+function applyFrame(scene, ws, frame) {
+    if (frame.type === 'snapshot') {
+        dungeonState = frame;
+        frameVersion = frame.version;
+        awaitingSnapshot = false;
+        buildIsoGrid(scene, dungeonState);
+        updateSidebar(dungeonState);
+        handleEndFlags(scene, dungeonState);
+        return;
+    }
+    if (frame.type !== 'delta' || awaitingSnapshot) return;
+    // Frame déjà couverte par un snapshot plus récent
+    if (frame.version <= frameVersion) return;
+
+    // Version manquée : on redemande l'état complet
+    if (dungeonState === null || frame.base !== frameVersion) {
+        awaitingSnapshot = true;
+        ws.send('snapshot');
+        return;
+    }
+    frameVersion = frame.version;
+
+    frame.cells.forEach(cell => {
+        dungeonState.grid[cell.y][cell.x].type = cell.type;
+    });
+    frame.heroes.forEach(hero => {
+        dungeonState.heroes[hero.id] = hero;
+    });
+    dungeonState.heros = dungeonState.heroes.filter(hero => hero.alive && hero.x !== null);
+    Object.assign(dungeonState, frame.flags);
+
+    if (frame.cells.length > 0) {
+        buildIsoGrid(scene, dungeonState);
+    } else if (frame.heroes.length > 0) {
+        updateHeroesOnly(scene, dungeonState);
+    }
+    if (Object.keys(frame.flags).length > 0) {
+        updateSidebar(dungeonState);
+        handleEndFlags(scene, dungeonState);
+    }
+}
+
+function handleEndFlags(scene, data) {
+    // Seule une vague en cours peut se terminer
+    if (!gameStarted || gameEnded) return;
+    if (data.tresorReached) {
+        gameEnded = true;
+        displayGameStatusMessage('Défaite ! Le trésor a été pillé.', true);
+        stopGame();
+    } else if (data.allHeroesDead) {
+        gameEnded = true;
+        displayGameStatusMessage('Victoire ! Tous les héros sont morts.');
+        stopGame();
+        setTimeout(() => {
+            loadNextLevel(scene);
+        }, 5000);
+    }
+}
+
 function buildIsoGrid(scene, data) {
     // Supprimer tous les objets de la grille existants avant de reconstruire
     gridObjects.forEach(obj => {
@@ -366,7 +487,7 @@ function handleTileClick(scene, cell) {
     
     console.log("Sending request with body:", JSON.stringify(requestBody));
 
-    fetch(`/api/place_entity/`, {
+    fetch(api('place_entity/'), {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json'
@@ -382,14 +503,19 @@ function handleTileClick(scene, cell) {
             });
         }
         console.log("Entity placed successfully");
-        // Si le placement est réussi, on rafraîchit l'affichage
-        refreshDungeon(scene, true);
+        return response.json();
+    })
+    .then(data => {
+        // La case modifiée arrive par la WebSocket
+        if (data && data.path_open === false) {
+            displayGameStatusMessage('Attention : ce placement bloque le chemin des héros.', true);
+        }
     })
     .catch(error => console.error('Error placing entity:', error));
 }
 
 function startGame(scene) {
-    fetch('/api/start_simulation/')
+    fetch(api('start_simulation/'))
         .then(res => res.json())
         .then(data => {
             if (data.simulation_started === "false" || data.simulation_started === false) {
@@ -426,12 +552,13 @@ function startGame(scene) {
                 const resetButton = document.getElementById('reset-button');
                 resetButton.disabled = true;
                 
-                // Démarrer le déplacement automatique du héros toutes les 0.5 secondes
-                heroMoveInterval = setInterval(() => {
-                    moveHero(scene);
-                }, 500);
+                // La vague tourne côté serveur, les ticks arrivent par la WebSocket
+                wavePaused = false;
+                const pauseButton = document.getElementById('pause-button');
+                pauseButton.disabled = false;
+                pauseButton.textContent = 'Pause';
                 
-                console.log("Game started - Hero moving automatically");
+                console.log("Game started - Wave running on the server");
             }
         })
         .catch(error => {
@@ -441,12 +568,15 @@ function startGame(scene) {
 }
 
 function stopGame() {
-    if (heroMoveInterval) {
-        clearInterval(heroMoveInterval);
-        heroMoveInterval = null;
-    }
     gameStarted = false;
 
+    const pauseButton = document.getElementById('pause-button');
+    if (pauseButton) {
+        pauseButton.disabled = true;
+        pauseButton.textContent = 'Pause';
+    }
+    wavePaused = false;
+
     // Réactiver les boutons de réinitialisation si le jeu est terminé
     const resetButton = document.getElementById('reset-button');
     if (resetButton) {
@@ -486,7 +616,7 @@ function resetGame(scene) {
     resetButton.disabled = false;
     
     // Réinitialiser la simulation côté serveur
-    fetch('/api/reset_simulation', {
+    fetch(api('reset_simulation'), {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json'
@@ -538,7 +668,7 @@ function saveGame(scene) {
 
         console.log("Sending fetch request to /api/save_dungeon");
         
-        fetch('/api/save_dungeon', {
+        fetch(api('save_dungeon'), {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -568,67 +698,6 @@ function saveGame(scene) {
         });
     }
 }
-function moveHero(scene) {
-    fetch('/api/move_hero', { // Changed from /api/start_simulation/ to /api/move_hero
-        method: 'POST', // Changed to POST as per server definition
-        headers: {
-            'Content-Type': 'application/json'
-        }
-    })
-    .then(response => {
-        if (!response.ok) {
-            return response.text().then(text => { throw new Error(text) });
-        }
-        return response.json(); 
-    })
-    .then(data => {
-        console.log('Hero moved:', data);
-        if (data.simulation_started === "false") {
-            alert("Chemin impossible")
-            clearInterval(heroMoveInterval);
-            heroMoveInterval = null
-             // Réinitialiser l'état du jeu
-    gameStarted = false;
-    
-    // Réactiver la sidebar
-    const sidebarItems = document.getElementById('sidebar-items');
-    sidebarItems.classList.remove('disabled');
-    
-    // Réactiver le bouton lancer
-    const launchButton = document.getElementById('launch-button');
-    launchButton.disabled = false;
-    launchButton.textContent = 'Lancer';
-    
-    // Réactiver le bouton réinitialiser
-    const resetButton = document.getElementById('reset-button');
-    resetButton.disabled = false;
-
-    
-        }else{
-            if (data.tresorReached) {
-            gameEnded = true;
-            displayGameStatusMessage('Défaite ! Le trésor a été pillé.', true);
-            stopGame();
-        } else if (data.allHeroesDead) {
-            gameEnded = true;
-            displayGameStatusMessage('Victoire ! Tous les héros sont morts.');
-            stopGame();
-            // Passer au niveau suivant après un délai plus long
-            setTimeout(() => {
-                loadNextLevel(scene);
-            }, 5000);
-        }else{
-refreshDungeon(scene, false);
-        }
-        checkAllHeroesDead(scene);
-        }
-
-        
-    })
-    .catch(error => console.error('Error moving hero:', error));
-}
-
-
 function updateHeroesOnly(scene, data) {
     const heroes = data.heros || [];
     const grid = data.grid;
@@ -662,7 +731,7 @@ function updateHeroesOnly(scene, data) {
 }
 
 function loadNextLevel(scene) {
-    fetch('/api/next_level/', {
+    fetch(api('next_level/'), {
         method: 'GET',
         headers: {
             'Content-Type': 'application/json'
@@ -709,69 +778,6 @@ function loadNextLevel(scene) {
 }
 
 
-function checkAllHeroesDead(scene) {
-    fetch('/api/dungeon?t=' + new Date().getTime())
-        .then(res => res.json())
-        .then(data => {
-            const heroes = data.heros || [];
-            if (heroes.length === 0) {
-                // Tous les héros sont morts, passer au niveau suivant
-                console.log("All heroes dead - moving to next level");
-                
-                // Arrêter le déplacement automatique
-                if (heroMoveInterval) {
-                    clearInterval(heroMoveInterval);
-                    heroMoveInterval = null;
-                }
-                
-                // Appeler la route next_level
-                fetch('/api/next_level/', {
-                    method: 'GET',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    }
-                })
-                .then(response => {
-                    if (!response.ok) {
-                        return response.text().then(text => { throw new Error(text) });
-                    }
-                    return response.json();
-                })
-                .then(data => {
-                    console.log('Next level loaded:', data);
-                    
-                    // Attendre un peu que le serveur soit prêt
-                    setTimeout(() => {
-                        // Vider complètement la grille pour forcer la reconstruction
-                        gridObjects.forEach(obj => {
-                            if (obj && obj.destroy) {
-                                obj.destroy();
-                            }
-                        });
-                        gridObjects = [];
-                        
-                        // Réinitialiser le jeu et rafraîchir l'affichage
-                        gameStarted = false;
-                        refreshDungeon(scene, true);
-                        
-                        // Réactiver la sidebar et les boutons
-                        const sidebarItems = document.getElementById('sidebar-items');
-                        sidebarItems.classList.remove('disabled');
-                        
-                        const launchButton = document.getElementById('launch-button');
-                        launchButton.disabled = false;
-                        launchButton.textContent = 'Lancer';
-                        
-                        const resetButton = document.getElementById('reset-button');
-                        resetButton.disabled = false;
-                    }, 100);
-                })
-                .catch(error => console.error('Error loading next level:', error));
-            }
-        })
-        .catch(error => console.error('Error checking heroes status:', error));
-}
-
 function update() {
     const speed = 8;
     if (this.cursors.left.isDown) this.cameras.main.scrollX -= speed;
@@ -0,0 +1,79 @@
+"""Tests pour l'évaluation en lot des donjons."""
+
+import json
+
+from src.batch import CompactLayout, WaveSetup, evaluate_layouts
+from src.model.cell import Cell
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.level import LevelBuilder
+
+
+def create_test_dungeon(rows=5, cols=5):
+    """Helper pour créer un donjon de test."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    return Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+
+
+def create_level(dungeon):
+    return (LevelBuilder()
+            .set_dungeon(dungeon)
+            .set_budget(500)
+            .add_hero(pv=50, strategy="shortest")
+            .add_hero(pv=50, strategy="safest")
+            .build())
+
+
+def test_compact_layout_round_trip():
+    """Test que le layout compact reconstruit le même donjon."""
+    dungeon = create_test_dungeon()
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.place_entity(EntityFactory.create_trap(damage=15), (2, 2))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="R"), (3, 0))
+
+    rebuilt, cost = CompactLayout.from_dungeon(dungeon).build()
+
+    assert rebuilt.get_cell((1, 1)).entity.type == "WALL"
+    assert rebuilt.get_cell((2, 2)).entity.damage == 15
+    assert rebuilt.get_cell((3, 0)).entity.orientation == "R"
+    assert cost == 8 + 30 + 68
+
+
+def test_evaluate_layouts_inline_matches_pool():
+    """Test que le pool de processus donne les mêmes résultats qu'en série."""
+    empty = create_test_dungeon()
+    trapped = create_test_dungeon()
+    for c in range(5):
+        trapped.place_entity(EntityFactory.create_trap(damage=60), (2, c))
+    level = create_level(empty)
+
+    serial = evaluate_layouts([empty, trapped], level, max_workers=1)
+    parallel = evaluate_layouts([empty, trapped], level, max_workers=2)
+
+    assert serial == parallel
+    assert serial[0]["heroesSurvived"] == 2
+    assert serial[1]["heroesKilled"] == 2
+    assert serial[1]["construction_cost"] == 150
+
+
+def test_evaluate_layouts_from_save_file(tmp_path):
+    """Test l'évaluation d'une sauvegarde JSON."""
+    grid = [
+        [{"type": "Floor", "position": [r, c], "damage": 0} for c in range(4)]
+        for r in range(4)
+    ]
+    save = tmp_path / "layout.json"
+    save.write_text(json.dumps({
+        "dimension": [4, 4], "entry": [0, 0], "exit": [3, 3],
+        "grid": grid, "current_budget": 80,
+    }))
+    setup = WaveSetup(budget=100, difficulty=1, heroes=[(10, "shortest")])
+
+    results = evaluate_layouts([str(save)], setup, max_workers=1)
+
+    assert results == [{
+        "heroesKilled": 0, "heroesSurvived": 1, "construction_cost": 20,
+        "score": 0, "turns": results[0]["turns"],
+    }]
@@ -0,0 +1,40 @@
+"""Tests pour le banc de mesure."""
+
+import json
+
+from src.benchmark import BENCHMARKS, build_dungeon, main, run_benchmarks
+from src.model.connectivity import ReachabilityTracker
+
+
+def test_build_dungeon_keeps_entry_and_exit_connected():
+    """Test que même un donjon très dense reste traversable."""
+    dungeon = build_dungeon(12, density=0.9, seed=3)
+
+    assert ReachabilityTracker(dungeon).is_connected()
+    assert build_dungeon(12, 0.9, seed=3).grid[5][5].entity.type == dungeon.grid[5][5].entity.type
+
+
+def test_run_benchmarks_covers_every_combination():
+    """Test que chaque mesure produit une entrée par combinaison de paramètres."""
+    report = run_benchmarks(sizes=[6], densities=[0.0, 0.2], heroes=[1, 2], repeat=1)
+
+    results = report["results"]
+    step = [r for r in results if r["benchmark"] == "step"]
+    shortest = [r for r in results if r["benchmark"] == "shortest"]
+
+    assert {r["benchmark"] for r in results} == set(BENCHMARKS)
+    assert len(step) == 4
+    assert len(shortest) == 2 and shortest[0]["heroes"] is None
+    assert all(0 <= r["min"] <= r["mean"] for r in results)
+    assert report["meta"]["unit"] == "s"
+
+
+def test_main_writes_json(tmp_path):
+    """Test l'écriture du rapport dans un fichier."""
+    output = tmp_path / "bench.json"
+
+    main(["--benchmarks", "shortest", "update", "--sizes", "5",
+          "--densities", "0.1", "--repeat", "1", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert [r["benchmark"] for r in report["results"]] == ["shortest", "update"]
@@ -0,0 +1,132 @@
+"""Tests pour le format de sauvegarde binaire."""
+
+import json
+import os
+
+import pytest
+
+from src.commands.exportDungeon import exportDungeon
+from src.commands.importDungeon import dungeon_from_dict
+from src.controller.game_controller import GameController
+from src.model.binary_save import read_binary_save, write_binary_save
+from src.model.cell import Cell
+from src.model.compact_dungeon import CompactDungeon
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.layout_cache import CompactLayout
+from src.model.level import Level
+from src.simulation import Simulation
+from unittest.mock import MagicMock
+
+
+def create_test_dungeon(rows=5, cols=6):
+    """Helper pour créer un donjon de test."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.place_entity(EntityFactory.create_trap(damage=17), (2, 3))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="L"), (3, 5))
+    dungeon.place_entity(EntityFactory.create_bombe(), (4, 0))
+    return dungeon
+
+
+def snapshot(dungeon):
+    return [
+        [(cell.entity.type, cell.entity.damage, getattr(cell.entity, "orientation", None))
+         for cell in row]
+        for row in dungeon.grid
+    ]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_binary_round_trip(tmp_path, compact):
+    """Test que l'écriture puis la lecture conservent toute la grille."""
+    dungeon = create_test_dungeon()
+    path = str(tmp_path / "dungeon.pcdb")
+
+    write_binary_save(path, dungeon, level_id=3, current_budget=42)
+    loaded, header = read_binary_save(path, compact=compact)
+
+    assert isinstance(loaded, CompactDungeon) == compact
+    assert header == {"level_id": 3, "current_budget": 42}
+    assert loaded.dimension == (5, 6)
+    assert loaded.entry == (0, 0) and loaded.exit == (4, 5)
+    assert snapshot(loaded) == snapshot(dungeon)
+    assert len(loaded.threats_at((3, 4))) == 1
+
+
+def test_binary_matches_json_export(tmp_path, monkeypatch):
+    """Test la compatibilité aller-retour avec le format JSON."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("save")
+    dungeon = create_test_dungeon()
+    controller = MagicMock()
+    controller.simulation = Simulation(Level(dungeon=dungeon))
+
+    exportDungeon(dungeon, "layout").execute(controller)
+    exportDungeon(dungeon, "layout", binary=True).execute(controller)
+
+    with open("save/layout.json") as f:
+        from_json = dungeon_from_dict(json.load(f))
+    from_binary, header = read_binary_save("save/layout.pcdb")
+
+    assert snapshot(from_json) == snapshot(from_binary)
+    assert header["current_budget"] == controller.simulation.current_budget
+
+
+def test_binary_rejects_other_files(tmp_path):
+    """Test qu'un fichier étranger est refusé."""
+    path = tmp_path / "bad.pcdb"
+    path.write_bytes(b"not a dungeon save at all, sorry!!!!!!!!")
+
+    with pytest.raises(ValueError):
+        read_binary_save(str(path))
+
+
+def test_binary_keeps_bomb_and_dragon_damage(tmp_path):
+    """Test que les dégâts non standard des bombes et dragons survivent à l'aller-retour."""
+    dungeon = create_test_dungeon()
+    dungeon.place_entity(EntityFactory.create_bombe(damage=55), (4, 0))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="U", damage=45), (0, 3))
+    path = str(tmp_path / "dungeon.pcdb")
+
+    write_binary_save(path, dungeon)
+    loaded, _ = read_binary_save(path)
+    compact, _ = read_binary_save(path, compact=True)
+    rebuilt, _ = CompactLayout.from_dungeon(loaded).build()
+
+    assert loaded.get_cell((4, 0)).entity.damage == 55
+    assert loaded.get_cell((0, 3)).entity.damage == 45
+    assert snapshot(loaded) == snapshot(compact) == snapshot(rebuilt) == snapshot(dungeon)
+
+
+def test_binary_rejects_truncated_file(tmp_path):
+    """Test qu'une sauvegarde coupée après l'en-tête est refusée clairement."""
+    path = str(tmp_path / "dungeon.pcdb")
+    write_binary_save(path, create_test_dungeon())
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-4])
+
+    with pytest.raises(ValueError, match="tronquée"):
+        read_binary_save(path)
+
+
+def test_import_picks_the_binary_save_when_no_json(tmp_path, monkeypatch):
+    """Test que l'import d'une sauvegarde listée seulement en binaire la lit en binaire."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("save")
+    dungeon = create_test_dungeon()
+    write_binary_save("save/only.pcdb", dungeon, level_id=2, current_budget=42)
+    campaign = MagicMock()
+    campaign.load_level.return_value = Level(dungeon=dungeon)
+    controller = GameController(MagicMock(), Simulation(Level(dungeon=Dungeon((2, 2), (0, 0), (1, 1)))), campaign)
+
+    imported = controller.import_dungeon("only")
+
+    assert snapshot(imported) == snapshot(dungeon)
+    assert controller.simulation.current_budget == 42
+    campaign.load_level.assert_called_once_with(2)
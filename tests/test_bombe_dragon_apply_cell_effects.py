@@ -51,3 +51,19 @@ def test_dragon_apply_cell_effects():
     sim.apply_cell_effects(hero2)
     assert hero.pv_cur == 80
     assert hero2.pv_cur == 80
+
+
+def test_triggered_bombe_leaves_threat_index():
+    dungeon = create_test_dungeon()
+
+    dungeon.place_entity(Bombe(damage=40), (1, 2))
+    hero = Hero(pv_total=100, strategy="random", coord=(1, 1))
+    hero.awake()
+    sim = Simulation(level=Level(dungeon=dungeon), dungeon=dungeon)
+
+    sim.apply_cell_effects(hero)
+    # La bombe explose puis disparaît à la mise à jour suivante du donjon
+    dungeon.update()
+
+    assert isinstance(dungeon.get_cell((1, 2)).entity, Floor)
+    assert dungeon.threats_at((1, 1)) == []
@@ -3,8 +3,13 @@
 import pytest
 import tempfile
 import os
+import json
+import threading
+from src.model import campaign_manager
 from src.model.campaign_manager import Campaign
-from src.model.level import LevelBuilder
+from src.model.dungeon import Dungeon
+from src.model.level import Level, LevelBuilder
+from src.model.path_strategies import PathStrategyFactory
 
 
 def test_campaign_init():
@@ -120,3 +125,86 @@ def test_is_completed():
     
     campaign.complete_level(5)
     assert campaign.is_completed(5) is True
+
+
+def _write_campaign(tmp_path, count):
+    levels = [
+        {
+            "id": i,
+            "difficulty": i,
+            "budget": 100 + i,
+            "dimensions": {"width": 4, "height": 4},
+            "entry": {"row": 0, "col": 0},
+            "exit": {"row": 3, "col": 3},
+            "heroes": [{"pv": 50, "strategy": "shortest"}],
+        }
+        for i in range(1, count + 1)
+    ]
+    path = tmp_path / "campaign.json"
+    path.write_text(json.dumps({"campaign": {"name": "Test"}, "levels": levels}))
+    return str(path)
+
+
+def test_level_configs_are_indexed_by_id(tmp_path):
+    """Test que chaque configuration est retrouvée par son identifiant."""
+    campaign = Campaign(_write_campaign(tmp_path, 300), prefetch=False)
+
+    assert campaign._get_level_config(250)["budget"] == 350
+    assert campaign._get_level_config(301) is None
+    assert campaign.load_level(300).budget_tot == 400
+
+
+def test_next_level_is_prefetched_and_used_once(tmp_path):
+    """Test que le niveau suivant est construit en arrière-plan, chemins compris, puis consommé."""
+    campaign = Campaign(_write_campaign(tmp_path, 3))
+    try:
+        campaign.load_level(1)
+        campaign._prefetched[2].result(timeout=5)
+        assert campaign.is_prefetched(2)
+        prefetched = campaign._prefetched[2].result()
+        path = prefetched.heroes[0].path
+        assert path
+
+        level = campaign.load_next_level()
+
+        assert level is prefetched
+        assert level.heroes[0].path is path
+        assert campaign._current_level_num == 2
+        assert not campaign.is_prefetched(2)
+        assert campaign.load_level(2) is not prefetched
+    finally:
+        campaign.close()
+
+
+def test_campaigns_share_one_prefetch_thread(tmp_path):
+    """Test que les campagnes préchargent sur un seul thread pendant que la partie calcule ses chemins."""
+    path = _write_campaign(tmp_path, 3)
+    campaigns = [Campaign(path) for _ in range(5)]
+    try:
+        for campaign in campaigns:
+            campaign.load_level(1)
+            # Le thread de préchargement remplit les mêmes caches de chemins
+            for _ in range(20):
+                dungeon = Dungeon(dimension=(6, 6), entry=(0, 0), exit=(5, 5))
+                assert len(PathStrategyFactory.find_path("shortest", dungeon, (0, 0), (5, 5))) == 11
+        for campaign in campaigns:
+            level = campaign._prefetched[2].result(timeout=5)
+            assert isinstance(level, Level) and level.heroes[0].path
+        assert campaign_manager._shared_prefetch_executor() is campaign_manager._prefetch_executor
+        prefetch_threads = [t for t in threading.enumerate() if t.name.startswith("campaign-prefetch")]
+        assert len(prefetch_threads) == 1
+    finally:
+        for campaign in campaigns:
+            campaign.close()
+
+
+def test_prefetch_disabled_and_last_level(tmp_path):
+    """Test qu'aucun niveau n'est préchargé sans option ni après le dernier."""
+    campaign = Campaign(_write_campaign(tmp_path, 2), prefetch=False)
+    campaign.load_level(1)
+    assert campaign._prefetched == {}
+
+    campaign = Campaign(_write_campaign(tmp_path, 2))
+    campaign.load_level(2)
+    assert campaign._prefetched == {}
+    campaign.close()
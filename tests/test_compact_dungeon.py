@@ -0,0 +1,129 @@
+"""Tests pour le backend compact du donjon."""
+
+from src.model.bombe import Bombe
+from src.model.cell import Cell
+from src.model.compact_dungeon import CompactDungeon, CellView
+from src.model.dragon import Dragon
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.floor import Floor
+from src.model.hero import Hero
+from src.model.level import Level, LevelBuilder
+from src.model.trap import Trap
+from src.model.wall import Wall
+from src.simulation import Simulation
+
+
+def create_test_dungeon(rows=6, cols=6):
+    """Helper pour créer un donjon de test."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    return Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+
+
+def populate(dungeon):
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 2))
+    dungeon.place_entity(EntityFactory.create_trap(damage=20), (2, 0))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="D"), (0, 4))
+    dungeon.place_entity(EntityFactory.create_bombe(), (4, 2))
+    return dungeon
+
+
+def test_compact_dungeon_mirrors_entities():
+    """Test que les vues reconstruisent les mêmes entités."""
+    compact = CompactDungeon.from_dungeon(populate(create_test_dungeon()))
+
+    assert isinstance(compact.get_cell((1, 1)).entity, Wall)
+    assert isinstance(compact.get_cell((2, 0)).entity, Trap)
+    assert compact.get_cell((2, 0)).get_damage() == 20
+    dragon = compact.get_cell((0, 4)).entity
+    assert isinstance(dragon, Dragon) and dragon.orientation == "D"
+    assert isinstance(compact.get_cell((3, 3)).entity, Floor)
+    assert [cell.coord for cell in compact.grid[4]][2] == (4, 2)
+
+
+def test_compact_dungeon_valid_move():
+    """Test que validMove suit murs, dragons et bornes."""
+    compact = CompactDungeon.from_dungeon(populate(create_test_dungeon()))
+
+    assert not compact.validMove((1, 1))
+    assert not compact.validMove((0, 4))
+    assert not compact.validMove((-1, 0))
+    assert not compact.validMove((0, 6))
+    assert compact.validMove((2, 0))
+
+
+def test_compact_dungeon_threats_and_bomb_removal():
+    """Test l'index des menaces et l'explosion d'une bombe."""
+    compact = CompactDungeon((5, 5), entry=(0, 0), exit=(4, 4))
+    compact.place_entity(Bombe(damage=40), (1, 2))
+    hero = Hero(pv_total=100, strategy="random", coord=(1, 1))
+    hero.awake()
+    sim = Simulation(level=Level(dungeon=compact), dungeon=compact)
+
+    assert compact.threats_at((1, 1)) == [CellView(compact, 7, (1, 2))]
+    sim.apply_cell_effects(hero)
+    compact.update()
+
+    assert hero.pv_cur == 60
+    assert isinstance(compact.get_cell((1, 2)).entity, Floor)
+    assert compact.threats_at((1, 1)) == []
+
+
+def test_compact_dungeon_wave_matches_dungeon():
+    """Test qu'une vague donne le même résultat sur les deux backends."""
+    results = []
+    for dungeon in (populate(create_test_dungeon()),
+                    CompactDungeon.from_dungeon(populate(create_test_dungeon()))):
+        level = (LevelBuilder()
+                 .set_dungeon(dungeon)
+                 .add_hero(pv=60, strategy="shortest")
+                 .add_hero(pv=60, strategy="safest")
+                 .build())
+        results.append(Simulation(level, dungeon).run_headless().to_dict())
+
+    assert results[0] == results[1]
+
+
+def test_compact_dungeon_dragon_cooldown_cycle():
+    """Test le cycle de cooldown d'un dragon sur les tableaux."""
+    compact = CompactDungeon((5, 5), entry=(0, 0), exit=(4, 4))
+    compact.place_entity(Dragon("R", damage=30), (2, 0))
+    source = compact.get_cell((2, 0))
+
+    assert source.return_damage_if_CD() == 30
+    compact.update()
+    assert source.return_damage_if_CD() == 0
+    assert compact.entity_at(source.index).current_cooldown == 4
+
+    for _ in range(4):
+        compact.update()
+    assert compact.active == set()
+    assert source.return_damage_if_CD() == 30
+
+
+def test_compact_snapshot_restores_touched_cells_and_reset():
+    """Test que le snapshot compact ne recopie que les cases modifiées et annule reset."""
+    dungeon = CompactDungeon((6, 6), entry=(0, 0), exit=(5, 5))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="R"), (2, 2))
+    before = [dungeon.entity_at(i).type for i in range(36)]
+    snapshot = dungeon.snapshot()
+
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.get_cell((2, 2)).return_damage_if_CD()
+    dungeon.update()
+    assert len(snapshot) == 2 and dungeon.cooldown[dungeon._index((2, 2))] > 0
+
+    dungeon.restore(snapshot)
+    assert [dungeon.entity_at(i).type for i in range(36)] == before
+    assert not dungeon.validMove((2, 2)) and dungeon.validMove((1, 1))
+    assert dungeon.cooldown[dungeon._index((2, 2))] == 0 and not dungeon.active
+    assert [c.coord for c in dungeon.threats_at((2, 3))] == [(2, 2)]
+
+    dungeon.reset()
+    dungeon.restore(snapshot)
+    assert [dungeon.entity_at(i).type for i in range(36)] == before
+    assert [c.coord for c in dungeon.threats_at((2, 3))] == [(2, 2)]
+    dungeon.release(snapshot)
@@ -0,0 +1,108 @@
+"""Tests pour la diffusion WebSocket à files bornées."""
+
+import asyncio
+
+from src.view.gui.connections import ConnectionManager
+
+
+class FakeWebSocket:
+    """Socket factice : enregistre les messages, peut bloquer ou échouer."""
+
+    def __init__(self, stall=False, fail=False):
+        self.sent = []
+        self.closed = False
+        self.stall = stall
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        if self.fail:
+            raise ConnectionError("socket fermée")
+        if self.stall:
+            await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+async def settle():
+    for _ in range(50):
+        await asyncio.sleep(0)
+
+
+def test_broadcast_reaches_every_client():
+    """Test que chaque client reçoit les messages dans l'ordre."""
+    async def scenario():
+        manager = ConnectionManager()
+        a, b = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(a)
+        await manager.connect(b)
+        for i in range(3):
+            await manager.broadcast(str(i))
+        await settle()
+        return a.sent, b.sent
+
+    sent_a, sent_b = asyncio.run(scenario())
+    assert sent_a == sent_b == ["0", "1", "2"]
+
+
+def test_slow_client_does_not_block_others():
+    """Test qu'un client bloqué ne retarde pas les autres et voit ses frames coalescées."""
+    async def scenario():
+        manager = ConnectionManager(queue_size=2, resync=lambda: "snapshot")
+        slow, fast = FakeWebSocket(stall=True), FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+        for i in range(10):
+            await manager.broadcast(str(i))
+            await settle()
+        slow_connection = manager.connections[slow]
+        slow.stall = False
+        slow.release.set()
+        await settle()
+        return slow.sent, fast.sent, slow_connection.dropped
+
+    slow_sent, fast_sent, dropped = asyncio.run(scenario())
+    assert fast_sent == [str(i) for i in range(10)]
+    assert dropped > 0
+    assert slow_sent[-1] == "snapshot"
+    assert len(slow_sent) < 10
+
+
+def test_dead_socket_is_evicted():
+    """Test qu'un client dont l'envoi échoue est retiré et fermé."""
+    async def scenario():
+        manager = ConnectionManager()
+        dead, ok = FakeWebSocket(fail=True), FakeWebSocket()
+        await manager.connect(dead)
+        await manager.connect(ok)
+        await manager.broadcast("frame")
+        await settle()
+        await manager.broadcast("frame")
+        await settle()
+        return manager.active_connections, dead.closed, ok.sent
+
+    connections, closed, ok_sent = asyncio.run(scenario())
+    assert len(connections) == 1
+    assert closed is True
+    assert ok_sent == ["frame", "frame"]
+
+
+def test_stalled_send_times_out():
+    """Test qu'un envoi qui ne se termine jamais évince le client."""
+    async def scenario():
+        manager = ConnectionManager(send_timeout=0.01)
+        stalled = FakeWebSocket(stall=True)
+        await manager.connect(stalled)
+        await manager.broadcast("frame")
+        await asyncio.sleep(0.05)
+        await settle()
+        return manager.active_connections, stalled.closed
+
+    connections, closed = asyncio.run(scenario())
+    assert connections == []
+    assert closed is True
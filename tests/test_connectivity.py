@@ -0,0 +1,58 @@
+"""Tests pour le suivi incrémental de connexion entrée/sortie."""
+
+from src.model.cell import Cell
+from src.model.compact_dungeon import CompactDungeon
+from src.model.connectivity import ReachabilityTracker
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+
+
+def create_test_dungeon(rows=4, cols=4):
+    """Helper pour créer un donjon de test."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    return Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+
+
+def test_tracker_detects_blocking_wall_line():
+    """Test qu'une ligne de murs coupe la connexion."""
+    dungeon = create_test_dungeon()
+    tracker = ReachabilityTracker(dungeon)
+    assert tracker.is_connected()
+
+    for col in range(3):
+        dungeon.place_entity(EntityFactory.create_wall(), (2, col))
+    assert tracker.is_connected()
+
+    dungeon.place_entity(EntityFactory.create_wall(), (2, 3))
+    assert not tracker.is_connected()
+    assert not tracker.is_reachable((3, 0))
+
+
+def test_tracker_reopens_without_full_rebuild(monkeypatch):
+    """Test qu'une case libérée étend la zone sans tout recalculer."""
+    dungeon = create_test_dungeon()
+    for col in range(4):
+        dungeon.place_entity(EntityFactory.create_wall(), (2, col))
+    tracker = ReachabilityTracker(dungeon)
+    assert not tracker.is_connected()
+
+    rebuilds = []
+    monkeypatch.setattr(tracker, "rebuild", lambda: rebuilds.append(True))
+    dungeon.place_entity(EntityFactory.create_trap(damage=5), (2, 1))
+
+    assert tracker.is_connected()
+    assert rebuilds == []
+
+
+def test_tracker_rebuilds_after_reset():
+    """Test que la réinitialisation du donjon est prise en compte."""
+    dungeon = CompactDungeon((3, 3), entry=(0, 0), exit=(2, 2))
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 2))
+    dungeon.place_entity(EntityFactory.create_dragon(), (2, 1))
+    tracker = ReachabilityTracker(dungeon)
+    assert not tracker.is_connected()
+
+    dungeon.reset()
+    assert tracker.is_connected()
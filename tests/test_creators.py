@@ -4,6 +4,8 @@ from src.model.entity_creator import EntityCreator
 from src.model.floor_creator import FloorCreator
 from src.model.wall_creator import WallCreator
 from src.model.trap_creator import TrapCreator
+from src.model.bombe_creator import BombeCreator
+from src.model.dragon_creator import DragonCreator
 from src.model.entity import Entity
 from src.model.floor import Floor
 from src.model.wall import Wall
@@ -79,11 +81,21 @@ def test_trap_creator_edge_cases():
 
 
 def test_creators_multiple_instances():
-    """Test que chaque appel à build() crée une nouvelle instance."""
+    """Test que chaque appel à factory_method() crée une nouvelle instance."""
     creator = FloorCreator()
 
-    floor1 = creator.build()
-    floor2 = creator.build()
+    floor1 = creator.factory_method()
+    floor2 = creator.factory_method()
 
     assert floor1 is not floor2
     assert floor1.type == floor2.type
+
+
+def test_creators_share_stateless_entities():
+    """Test que build() partage les entités sans état, pas les dragons ni les bombes."""
+    assert FloorCreator().build() is FloorCreator().build()
+    assert WallCreator().build() is WallCreator().build()
+    assert TrapCreator(damage=12).build() is TrapCreator(damage=12).build()
+    assert TrapCreator(damage=12).build() is not TrapCreator(damage=13).build()
+    assert BombeCreator().build() is not BombeCreator().build()
+    assert DragonCreator().factory_method("U") is not DragonCreator().factory_method("U")
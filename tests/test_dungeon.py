@@ -200,3 +200,127 @@ def test_dungeon_multiple_entities_placement():
 
     assert dungeon.get_cell((1, 0)).get_damage() == 5
     assert dungeon.get_cell((2, 2)).get_damage() == 20
+
+
+def test_dungeon_threat_index_follows_placement():
+    """Test que l'index des menaces suit les placements et remplacements."""
+    rows, cols = 5, 5
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="R"), (2, 0))
+    source = dungeon.get_cell((2, 0))
+    assert dungeon.threats_at((2, 3)) == [source]
+    assert dungeon.threats_at((1, 3)) == []
+
+    dungeon.place_entity(EntityFactory.create_wall(), (2, 0))
+    assert dungeon.threats_at((2, 3)) == []
+
+
+def test_dungeon_threat_index_cleared_on_remove_and_reset():
+    """Test que remove_monster et reset vident l'index des menaces."""
+    rows, cols = 4, 4
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+
+    dungeon.place_entity(EntityFactory.create_bombe(), (1, 1))
+    assert len(dungeon.threats_at((0, 0))) == 1
+
+    dungeon.get_cell((1, 1)).remove_monster()
+    assert isinstance(dungeon.get_cell((1, 1)).entity, Floor)
+    assert dungeon.threat_index == {}
+
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="D"), (0, 2))
+    dungeon.reset()
+    assert dungeon.threat_index == {}
+
+
+def test_dungeon_update_only_visits_active_cells():
+    """Test que update ne suit que les entités déclenchées ou en cooldown."""
+    rows, cols = 5, 5
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+    dragon = EntityFactory.create_dragon(orientation="R")
+    dungeon.place_entity(dragon, (2, 0))
+    assert dungeon.active_cells == set()
+
+    source = dungeon.get_cell((2, 0))
+    assert source.return_damage_if_CD() == dragon.damage
+    assert dungeon.active_cells == {source}
+
+    dungeon.update()
+    assert dragon.current_cooldown == dragon.max_cooldown
+    for _ in range(dragon.max_cooldown):
+        dungeon.update()
+    assert dragon.current_cooldown == 0
+    assert dungeon.active_cells == set()
+
+
+def _types(dungeon):
+    return [[cell.entity.type for cell in row] for row in dungeon.grid]
+
+
+def test_dungeon_snapshot_copies_only_mutated_cells():
+    """Test que le snapshot ne recopie que les cases modifiées."""
+    dungeon = Dungeon(dimension=(50, 50), entry=(0, 0), exit=(49, 49))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="R"), (5, 5))
+    before = _types(dungeon)
+    snapshot = dungeon.snapshot()
+
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.place_entity(EntityFactory.create_trap(damage=5), (1, 1))
+    dungeon.get_cell((5, 5)).return_damage_if_CD()
+    dungeon.update()
+
+    assert len(snapshot) == 2
+    dragon = dungeon.get_cell((5, 5)).entity
+    assert dragon.current_cooldown > 0 or dragon.triggered
+
+    dungeon.restore(snapshot)
+
+    assert _types(dungeon) == before
+    assert dragon.current_cooldown == 0 and not dragon.triggered
+    assert dungeon.threats_at((5, 6)) == [dungeon.get_cell((5, 5))]
+    assert dungeon.get_cell((5, 5)) not in dungeon.active_cells
+    assert dungeon.changes_since(snapshot.version) is not None
+
+
+def test_dungeon_snapshot_survives_reset_and_grid_replacement():
+    """Test que reset et remplacement de grille sont annulés par restore."""
+    dungeon = Dungeon(dimension=(4, 4), entry=(0, 0), exit=(3, 3))
+    dungeon.place_entity(EntityFactory.create_wall(), (2, 2))
+    before = _types(dungeon)
+    snapshot = dungeon.snapshot()
+
+    dungeon.reset()
+    dungeon.restore(snapshot)
+    assert _types(dungeon) == before
+
+    dungeon.grid = dungeon.blank_grid(4, 4)
+    dungeon.restore(snapshot)
+    assert _types(dungeon) == before
+    assert dungeon.grid is snapshot.grid
+
+
+def test_dungeon_nested_snapshots():
+    """Test que restaurer un ancien snapshot est vu par les plus récents."""
+    dungeon = Dungeon(dimension=(3, 3), entry=(0, 0), exit=(2, 2))
+    first = dungeon.snapshot()
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    second = dungeon.snapshot()
+
+    dungeon.restore(first)
+    assert dungeon.get_cell((1, 1)).entity.type == "FLOOR"
+    dungeon.restore(second)
+    assert dungeon.get_cell((1, 1)).entity.type == "WALL"
+
+    dungeon.release(first)
+    dungeon.place_entity(EntityFactory.create_trap(), (0, 1))
+    assert dungeon.get_cell((0, 1)) not in first.cells
+    assert dungeon.get_cell((0, 1)) in second.cells
@@ -0,0 +1,144 @@
+"""Tests pour les frames WebSocket (snapshot et deltas)."""
+
+from src.model.cell import Cell
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.level import LevelBuilder
+from src.simulation import Simulation
+from src.view.gui.frames import (
+    FrameTracker, GridCache, cell_type, etag_matches, hero_positions,
+)
+
+
+def create_simulation(rows=5, cols=5):
+    """Helper pour créer une simulation avec un héros sur un donjon vide."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+    level = (LevelBuilder()
+             .set_dungeon(dungeon)
+             .add_hero(pv=100, strategy="shortest")
+             .build())
+    return Simulation(level)
+
+
+def test_first_frame_is_a_snapshot():
+    """Test que la première frame contient toute la grille."""
+    sim = create_simulation()
+    tracker = FrameTracker(sim)
+
+    frame = tracker.next_frame()
+
+    assert frame["type"] == "snapshot"
+    assert frame["version"] == 1
+    assert len(frame["grid"]) == 5 and len(frame["grid"][0]) == 5
+    assert frame["grid"][0][0]["type"] == "START"
+    assert frame["grid"][4][4]["type"] == "EXIT"
+    assert tracker.next_frame() is None
+
+
+def test_delta_contains_only_changed_cells():
+    """Test qu'un placement produit un delta d'une seule case."""
+    sim = create_simulation()
+    tracker = FrameTracker(sim)
+    tracker.next_frame()
+
+    sim.dungeon.place_entity(EntityFactory.create_dragon(orientation="L"), (2, 2))
+    frame = tracker.next_frame()
+
+    assert frame["type"] == "delta"
+    assert frame["base"] == 1 and frame["version"] == 2
+    assert frame["cells"] == [{"x": 2, "y": 2, "type": "DRAGONL"}]
+    assert frame["heroes"] == []
+
+
+def test_delta_tracks_hero_moves_and_flags():
+    """Test qu'un tick ne publie que le héros déplacé et les drapeaux modifiés."""
+    sim = create_simulation()
+    hero = sim.heroes[0]
+    hero.coord = sim.dungeon.entry
+    hero.compute_path(sim.dungeon, sim.dungeon.entry, sim.dungeon.exit)
+    tracker = FrameTracker(sim)
+    tracker.next_frame()
+
+    sim.step()
+    frame = tracker.next_frame()
+
+    assert frame["type"] == "delta"
+    assert frame["cells"] == []
+    assert len(frame["heroes"]) == 1
+    state = frame["heroes"][0]
+    assert (state["y"], state["x"]) == hero.coord
+    assert state["alive"] is True
+    assert "level" not in frame["flags"]
+
+
+def test_replaced_dungeon_sends_snapshot():
+    """Test qu'un nouveau donjon (import, niveau suivant) force un snapshot."""
+    sim = create_simulation()
+    tracker = FrameTracker(sim)
+    tracker.next_frame()
+
+    sim.dungeon = create_simulation(3, 3).dungeon
+    frame = tracker.next_frame()
+
+    assert frame["type"] == "snapshot"
+    assert frame["rows"] == 3
+
+
+def test_reset_dungeon_sends_snapshot():
+    """Test qu'un donjon vidé (journal effacé) force un snapshot."""
+    sim = create_simulation()
+    tracker = FrameTracker(sim)
+    tracker.next_frame()
+
+    sim.dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    sim.dungeon.reset()
+
+    assert tracker.next_frame()["type"] == "snapshot"
+
+
+def test_snapshot_does_not_swallow_pending_changes():
+    """Test qu'un snapshot de connexion laisse les changements dans le prochain delta."""
+    sim = create_simulation()
+    tracker = FrameTracker(sim)
+    tracker.next_frame()
+
+    sim.dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    snapshot = tracker.snapshot()
+    frame = tracker.next_frame()
+
+    assert snapshot["grid"][1][1]["type"] == "WALL"
+    assert snapshot["version"] == 1
+    assert frame["base"] == 1
+    assert cell_type(sim.dungeon, (1, 1)) == "WALL"
+
+
+def test_grid_cache_is_kept_while_the_dungeon_is_unchanged():
+    """Test que la grille n'est resérialisée qu'après une modification."""
+    sim = create_simulation()
+    cache = GridCache()
+
+    etag, body = cache.get(sim.dungeon)
+    sim.heroes[0].coord = (1, 0)
+    sim.heroes[0].awake()
+    again_etag, again_body = cache.get(sim.dungeon)
+
+    assert again_etag == etag and again_body is body
+    assert hero_positions(sim) == [{"x": 0, "y": 1}]
+
+    sim.dungeon.place_entity(EntityFactory.create_wall(), (2, 2))
+    new_etag, new_body = cache.get(sim.dungeon)
+
+    assert new_etag != etag
+    assert b'"WALL"' in new_body
+
+
+def test_etag_matches():
+    """Test la comparaison avec l'en-tête If-None-Match."""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+    assert not etag_matches(None, '"abc"')
@@ -0,0 +1,109 @@
+"""Tests pour le générateur procédural de donjons."""
+
+import json
+
+import pytest
+
+from src.batch import evaluate_layouts
+from src.benchmark import build_dungeon
+from src.commands.importDungeon import dungeon_from_dict
+from src.generator import STYLES, generate_dungeon, generate_layouts, main, write_dungeon
+from src.model.binary_save import read_binary_save
+from src.model.connectivity import ReachabilityTracker
+from src.model.level import LevelBuilder
+
+
+def _types(dungeon):
+    return [[cell.entity.type for cell in row] for row in dungeon.grid]
+
+
+@pytest.mark.parametrize("style", STYLES)
+def test_generate_dungeon_is_deterministic_and_connected(style):
+    """Test qu'une graine donne toujours le même donjon, traversable."""
+    dungeon = generate_dungeon(21, 31, seed=5, style=style, wall_density=0.6,
+                               dragon_density=0.1, trap_density=0.05, bomb_density=0.05)
+
+    assert _types(dungeon) == _types(generate_dungeon(
+        21, 31, seed=5, style=style, wall_density=0.6,
+        dragon_density=0.1, trap_density=0.05, bomb_density=0.05))
+    assert ReachabilityTracker(dungeon).is_connected()
+    assert dungeon.dimension == (21, 31)
+    assert dungeon.get_cell((0, 0)).entity.type == "FLOOR"
+    assert dungeon.get_cell((20, 30)).entity.type == "FLOOR"
+
+
+def test_generate_dungeon_respects_densities():
+    """Test que les entités sont placées selon leurs densités."""
+    dungeon = generate_dungeon(40, 40, seed=1, style="rooms", wall_density=0.5,
+                               trap_density=0.05, dragon_density=0.02, bomb_density=0.0)
+    counts = {}
+    for row in _types(dungeon):
+        for entity_type in row:
+            counts[entity_type] = counts.get(entity_type, 0) + 1
+
+    assert counts["TRAP"] == 80
+    assert counts["DRAGON"] == 32
+    assert "BOMBE" not in counts
+    assert counts["WALL"] <= 0.5 * 1600 + 1
+
+
+def test_generate_dungeon_maze_density_braids_walls():
+    """Test qu'une densité de murs plus faible ouvre le labyrinthe."""
+    perfect = generate_dungeon(21, 21, seed=2, style="maze", wall_density=1.0)
+    braided = generate_dungeon(21, 21, seed=2, style="maze", wall_density=0.2)
+
+    def walls(dungeon):
+        return sum(row.count("WALL") for row in _types(dungeon))
+
+    assert walls(braided) <= 0.2 * 441 < walls(perfect)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"style": "spiral"},
+    {"wall_density": 1.5},
+    {"exit": (0, 0)},
+    {"entry": (30, 0)},
+])
+def test_generate_dungeon_rejects_invalid_parameters(kwargs):
+    """Test que les paramètres invalides lèvent ValueError."""
+    with pytest.raises(ValueError):
+        generate_dungeon(10, 10, seed=0, **kwargs)
+
+
+def test_write_dungeon_uses_existing_save_formats(tmp_path):
+    """Test que le donjon s'écrit en JSON comme en binaire et se relit à l'identique."""
+    dungeon = generate_dungeon(12, 9, seed=4, style="cave", dragon_density=0.05)
+    json_path = str(tmp_path / "cave.json")
+    binary_path = str(tmp_path / "cave.pcdb")
+
+    write_dungeon(dungeon, json_path, level_id=2, current_budget=50)
+    write_dungeon(dungeon, binary_path, level_id=2, current_budget=50)
+
+    with open(json_path) as f:
+        data = json.load(f)
+    assert data["level_id"] == 2 and data["current_budget"] == 50
+    assert _types(dungeon_from_dict(data)) == _types(dungeon)
+    assert _types(read_binary_save(binary_path)[0]) == _types(dungeon)
+
+
+def test_generated_layouts_feed_batch_and_benchmarks():
+    """Test que les donjons générés s'utilisent en lot et dans le banc de mesure."""
+    layouts = generate_layouts(2, 10, 10, seed=3, style="maze", wall_density=0.5)
+    level = LevelBuilder().set_dungeon(layouts[0]).add_hero(pv=100).build()
+
+    results = evaluate_layouts(layouts, level, max_workers=1)
+
+    assert len(results) == 2
+    assert _types(layouts[1]) == _types(generate_dungeon(10, 10, seed=4, style="maze",
+                                                         wall_density=0.5))
+    assert ReachabilityTracker(build_dungeon(15, 0.8, seed=1, style="cave")).is_connected()
+
+
+def test_main_writes_save(tmp_path, capsys):
+    """Test de la ligne de commande."""
+    output = str(tmp_path / "rooms.json")
+    main(["8", "12", "--seed", "9", "--style", "rooms", "--output", output])
+
+    with open(output) as f:
+        assert json.load(f)["dimension"] == [8, 12]
+    assert output in capsys.readouterr().out
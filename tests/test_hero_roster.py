@@ -0,0 +1,104 @@
+"""Tests pour le roster des héros en structure de tableaux."""
+
+from src.benchmark import build_dungeon, build_level, start_wave
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.hero import Hero
+from src.model.hero_roster import HeroRoster, RosterHero
+from src.model.level import LevelBuilder
+from src.simulation import Simulation
+
+
+def _wave(roster, style="scatter", density=0.3, heroes=30, seed=3):
+    dungeon = build_dungeon(25, density, seed, style)
+    simulation = Simulation(build_level(dungeon, heroes, roster))
+    start_wave(simulation)
+    result = simulation.run_headless()
+    states = [(h.pv_cur, h.coord, h.isAlive, h.reachedGoal, h.stepsTaken) for h in simulation.heroes]
+    level = simulation.level
+    counts = (len(level.alive), level.get_nb_killed_heroes(), level.nb_reached_goal)
+    return result.to_dict(), states, counts, simulation.dmgobserver.getTotalDmg(), simulation.tresorReached
+
+
+def test_views_read_and_write_the_arrays():
+    hero = Hero(40, "shortest", coord=(2, 3), hero_number=5)
+    roster = HeroRoster([hero])
+    view = roster.heroes[0]
+
+    assert isinstance(view, RosterHero) and isinstance(view, Hero)
+    assert (view.pv_cur, view.coord, view.ticktoAwake, view.strategy) == (40, (2, 3), 5, "shortest")
+
+    view.awake()
+    view.take_damage(15)
+    view.move((2, 4))
+    assert roster.pv[0] == 25 and (roster.rows[0], roster.cols[0]) == (2, 4)
+    assert roster.alive[0] and roster.steps[0] == 1
+    assert roster.alive_heroes() == [view]
+
+    view.take_damage(30)
+    assert view.pv_cur == 0 and not view.isAlive and roster.count_alive() == 0
+
+    view.reset()
+    assert view.coord is None and view.pv_cur == 40
+
+
+def test_builder_turns_heroes_into_views():
+    dungeon = Dungeon((5, 5), (0, 0), (4, 4))
+    level = LevelBuilder().set_dungeon(dungeon).add_heroes(3, strategy="shortest").use_roster().build()
+
+    assert level.roster is not None and level.heroes is level.roster.heroes
+    assert all(isinstance(h, RosterHero) for h in level.heroes)
+    assert level.heroes[0].coord == (0, 0) and level.heroes[0].path[-1] == (4, 4)
+
+    level.add_hero(Hero(10, "safest"))
+    assert len(level.roster) == 4 and isinstance(level.heroes[-1], RosterHero)
+
+    removed = level.heroes[1]
+    removed.awake()
+    level.remove_hero(removed)
+    assert level.nb_heroes == 3 and removed not in level.heroes
+    assert level.get_alive_heroes() == [] and level.get_nb_killed_heroes() == 3
+
+
+def test_roster_wave_matches_object_wave():
+    for style in ("scatter", "cave", "maze"):
+        for density in (0.1, 0.3, 0.5):
+            assert _wave(True, style, density) == _wave(False, style, density)
+
+
+def test_roster_step_stops_on_treasure_like_object_step():
+    """Le héros qui atteint la sortie arrête le tick : les suivants ne se réveillent pas."""
+    results = []
+    for roster in (False, True):
+        dungeon = Dungeon((1, 3), (0, 0), (0, 2))
+        level = LevelBuilder().set_dungeon(dungeon).add_heroes(3, strategy="shortest").use_roster(roster).build()
+        simulation = Simulation(level)
+        start_wave(simulation)
+        # Réveils aux ticks 1, 2 et 2 : le premier héros sort au tick 2
+        simulation.heroes[2].ticktoAwake = 2
+        simulation.step()
+        simulation.step()
+        results.append(([(h.isAlive, h.coord) for h in simulation.heroes], simulation.tresorReached))
+
+    assert results[0] == results[1]
+    assert results[1] == ([(True, (0, 2)), (False, (0, 0)), (False, (0, 0))], True)
+
+
+def test_roster_snapshot_restore():
+    dungeon = Dungeon((1, 6), (0, 0), (0, 5))
+    dungeon.place_entity(EntityFactory.create_trap(damage=30), (0, 2))
+    level = LevelBuilder().set_dungeon(dungeon).add_heroes(4, pv=50, strategy="shortest").use_roster().build()
+    simulation = Simulation(level)
+    start_wave(simulation)
+    for _ in range(2):
+        simulation.step()
+
+    snapshot = simulation.snapshot()
+    before = [(h.pv_cur, h.coord, h.isAlive) for h in simulation.heroes]
+    for _ in range(3):
+        simulation.step()
+    simulation.restore(snapshot)
+
+    assert [(h.pv_cur, h.coord, h.isAlive) for h in simulation.heroes] == before
+    assert level.roster.count_alive() == sum(alive for _, _, alive in before)
+    assert set(level.alive) == set(level.get_alive_heroes())
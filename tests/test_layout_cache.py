@@ -0,0 +1,140 @@
+"""Tests pour le cache des donjons prédéfinis."""
+
+import json
+import os
+
+from src.commands.exportDungeon import dungeon_to_dict
+from src.commands.nextlevel import nextLevel
+from src.model.binary_save import write_binary_save
+from src.model.campaign_manager import Campaign
+from src.model.dungeon import Dungeon
+from src.model.entity_factory import EntityFactory
+from src.model.layout_cache import LayoutCache
+from src.simulation import Simulation
+
+
+def _dungeon():
+    dungeon = Dungeon(dimension=(4, 5), entry=(0, 0), exit=(3, 4))
+    dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+    dungeon.place_entity(EntityFactory.create_trap(damage=7), (2, 3))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="L"), (0, 4))
+    return dungeon
+
+
+def _types(dungeon):
+    return [[cell.entity.type for cell in row] for row in dungeon.grid]
+
+
+def _write_json(path, dungeon):
+    with open(path, "w") as f:
+        json.dump(dungeon_to_dict(dungeon), f)
+
+
+def test_cache_parses_once_and_builds_fresh_dungeons(tmp_path, monkeypatch):
+    """Test qu'un fichier inchangé n'est analysé qu'une fois."""
+    path = str(tmp_path / "level.json")
+    _write_json(path, _dungeon())
+    cache = LayoutCache()
+
+    first = cache.load(path)
+    monkeypatch.setattr("builtins.open", None)
+    second = cache.load(path)
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert second is not first
+    assert _types(second) == _types(_dungeon())
+    assert second.get_cell((2, 3)).entity.damage == 7
+
+
+def test_cache_reloads_modified_file(tmp_path):
+    """Test qu'une sauvegarde réécrite est relue."""
+    path = str(tmp_path / "level.json")
+    _write_json(path, _dungeon())
+    cache = LayoutCache()
+    cache.load(path)
+
+    changed = _dungeon()
+    changed.place_entity(EntityFactory.create_wall(), (3, 0))
+    _write_json(path, changed)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.load(path).get_cell((3, 0)).entity.type == "WALL"
+    assert cache.misses == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test que le cache est borné."""
+    cache = LayoutCache(maxsize=2)
+    paths = [str(tmp_path / f"level{i}.pcdb") for i in range(3)]
+    for path in paths:
+        write_binary_save(path, _dungeon())
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+
+    assert len(cache) == 2
+    cache.get(paths[1])
+    assert cache.misses == 4
+    assert cache.get(str(tmp_path / "missing.json")) is None
+
+
+def test_campaign_loads_dungeon_file(tmp_path, monkeypatch):
+    """Test que load_level utilise le donjon nommé par dungeon_file."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("save")
+    _write_json("save/first.json", _dungeon())
+    with open("campaign.json", "w") as f:
+        json.dump({"levels": [
+            {"id": 1, "budget": 50, "dungeon_file": "first",
+             "heroes": [{"pv": 50, "strategy": "shortest"}]},
+            {"id": 2, "dungeon_file": "missing",
+             "dimensions": {"width": 3, "height": 3},
+             "entry": {"row": 0, "col": 0}, "exit": {"row": 2, "col": 2}},
+        ]}, f)
+    cache = LayoutCache()
+    campaign = Campaign("campaign.json", prefetch=False, layout_cache=cache)
+
+    level = campaign.load_level(1)
+    replay = campaign.load_level(1)
+
+    assert _types(level.dungeon) == _types(_dungeon())
+    assert level.dungeon is not replay.dungeon
+    assert level.heroes[0].path
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert campaign.load_level(2).dungeon.dimension == (3, 3)
+
+
+def test_reset_and_next_level_keep_the_saved_layout(tmp_path, monkeypatch):
+    """Test que nextLevel et reset rétablissent le donjon sauvegardé au lieu de le vider."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("save")
+    saved = _dungeon()
+    saved.place_entity(EntityFactory.create_bombe(), (3, 1))
+    _write_json("save/first.json", saved)
+    _write_json("save/second.json", saved)
+    with open("campaign.json", "w") as f:
+        json.dump({"levels": [
+            {"id": 1, "dungeon_file": "first", "heroes": [{"pv": 50, "strategy": "shortest"}]},
+            {"id": 2, "dungeon_file": "second", "heroes": [{"pv": 50, "strategy": "shortest"}]},
+        ]}, f)
+    campaign = Campaign("campaign.json", prefetch=False, layout_cache=LayoutCache())
+    simulation = Simulation(campaign.load_level(1))
+    # Donjon encore intact : rien à reconstruire
+    version = simulation.dungeon.version
+    simulation.reset()
+    assert simulation.dungeon.version == version
+
+    simulation.dungeon.place_entity(EntityFactory.create_wall(), (2, 0))
+    simulation.reset()
+    assert _types(simulation.dungeon) == _types(saved)
+    assert simulation.heroes[0].path
+
+    simulation.allHeroesDead = True
+    nextLevel(campaign, simulation).execute()
+    assert simulation.level.difficulty == 1 and campaign._current_level_num == 2
+    assert _types(simulation.dungeon) == _types(saved)
+    assert simulation.dungeon.get_cell((2, 3)).entity.damage == 7
+    assert simulation.heroes[0].path
@@ -132,6 +132,31 @@ def test_level_get_alive_heroes():
     assert alive[0].pv_total == 80
 
 
+def test_level_tracks_alive_killed_and_reached_counts():
+    """Test que les compteurs du niveau suivent les héros sans les parcourir."""
+    heroes = [Hero(pv_total=50, strategy="random") for _ in range(3)]
+    heroes[2].isAlive = True
+    level = Level(heroes=heroes)
+    assert level.alive == {heroes[2]}
+
+    level.awake_all_heroes()
+    heroes[0].take_damage(80)
+    heroes[0].take_damage(10)
+    heroes[1].reachedGoal = True
+    assert level.get_nb_alive_heroes() == 2 and level.get_nb_killed_heroes() == 1
+    assert level.nb_reached_goal == 1
+
+    extra = Hero(pv_total=10, strategy="random")
+    extra.awake()
+    level.add_hero(extra)
+    level.remove_hero(heroes[1])
+    assert level.alive == {heroes[2], extra} and level.nb_reached_goal == 0
+    assert heroes[1].level is None
+
+    level.reset()
+    assert level.alive == set() and level.get_nb_killed_heroes() == 3
+
+
 def test_level_remove_hero():
     """Test suppression d'un héros."""
     hero = Hero(pv_total=100, strategy="random")
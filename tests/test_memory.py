@@ -0,0 +1,81 @@
+"""Tests de l'empreinte mémoire des cases, entités et héros (__slots__)."""
+
+import pickle
+import tracemalloc
+
+from src.model.bombe import Bombe
+from src.model.cell import Cell
+from src.model.dragon import Dragon
+from src.model.dungeon import Dungeon
+from src.model.entity import Entity
+from src.model.entity_factory import EntityFactory
+from src.model.floor import Floor
+from src.model.hero import Hero
+from src.model.trap import Trap
+from src.model.wall import Wall
+
+GRID_SIZE = 500
+HERO_COUNT = 10_000
+# Sans __slots__ : ~176 octets par case et ~231 par héros
+MAX_BYTES_PER_CELL = 160
+MAX_BYTES_PER_HERO = 210
+
+
+def _traced(build):
+    """Construit l'objet et retourne (objet, octets alloués pendant la construction)."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        obj = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return obj, after - before
+
+
+def test_no_instance_dict():
+    instances = [
+        Cell((0, 0)), Floor(), Wall(), Trap(damage=5), Dragon(orientation="U"), Bombe(),
+        Hero(10, "shortest", coord=(0, 0)),
+    ]
+    for instance in instances:
+        assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+
+def test_entities_still_implement_entity_abc():
+    for entity in (Floor(), Wall(), Trap(damage=5), Dragon(orientation="U"), Bombe()):
+        assert isinstance(entity, Entity)
+
+
+def test_memory_per_cell_on_large_grid():
+    dungeon, size = _traced(lambda: Dungeon((GRID_SIZE, GRID_SIZE), (0, 0), (GRID_SIZE - 1, GRID_SIZE - 1)))
+    assert size / (GRID_SIZE * GRID_SIZE) < MAX_BYTES_PER_CELL
+    assert dungeon.grid[GRID_SIZE - 1][GRID_SIZE - 1].coord == (GRID_SIZE - 1, GRID_SIZE - 1)
+
+
+def test_memory_per_hero():
+    heroes, size = _traced(
+        lambda: [Hero(100, "shortest", coord=(0, 0), hero_number=i) for i in range(HERO_COUNT)]
+    )
+    assert size / len(heroes) < MAX_BYTES_PER_HERO
+
+
+def test_pickle_round_trip():
+    dungeon = Dungeon((5, 5), (0, 0), (4, 4))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="L"), (2, 2))
+    dungeon.place_entity(EntityFactory.create_trap(damage=7), (1, 1))
+    dungeon.grid[2][2].return_damage_if_CD()
+
+    copy = pickle.loads(pickle.dumps(dungeon))
+    dragon = copy.grid[2][2].entity
+    assert dragon.orientation == "L"
+    assert dragon.triggered == dungeon.grid[2][2].entity.triggered
+    assert copy.grid[1][1].entity.damage == 7
+    assert copy.grid[2][2].dungeon is copy
+    assert copy.snapshot() is not None
+
+    hero = Hero(50, "safest", coord=(1, 1), hero_number=3)
+    hero.take_damage(20)
+    restored = pickle.loads(pickle.dumps(hero))
+    assert (restored.pv_cur, restored.coord, restored.strategy, restored.ticktoAwake) == (
+        30, (1, 1), "safest", hero.ticktoAwake)
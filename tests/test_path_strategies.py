@@ -1,10 +1,18 @@
 """Tests for pathfinding strategies."""
 
+import gc
+import weakref
+
 import pytest
 from src.model.path_strategies import (
     PathStrategy,
     ShortestPathStrategy,
     SafestPathStrategy,
+    FlowFieldStrategy,
+    IncrementalShortestPathStrategy,
+    IncrementalPathStrategy,
+    IncrementalSafestPathStrategy,
+    LPAStarPlanner,
     PathStrategyFactory
 )
 from src.model.dungeon import Dungeon
@@ -232,6 +240,152 @@ class TestSafestPathStrategy:
         assert path == []
 
 
+class TestFlowFieldStrategy:
+    """Tests for FlowFieldStrategy."""
+
+    def test_registered_in_factory(self):
+        """Test that the strategy is available by name."""
+        assert isinstance(PathStrategyFactory.create("flowfield"), FlowFieldStrategy)
+
+    def test_path_length_matches_shortest(self):
+        """Test that the flow field gives shortest-length paths."""
+        dungeon = create_dungeon_with_walls()
+        flow = FlowFieldStrategy().find_path(dungeon, (0, 0), (4, 4))
+        shortest = ShortestPathStrategy().find_path(dungeon, (0, 0), (4, 4))
+
+        assert flow[0] == (0, 0)
+        assert flow[-1] == (4, 4)
+        assert len(flow) == len(shortest)
+        assert all(dungeon.validMove(coord) for coord in flow)
+
+    def test_single_search_for_many_starts(self, monkeypatch):
+        """Test that several starts and re-plans share one BFS."""
+        dungeon = create_simple_dungeon()
+        calls = []
+        original_bfs = FlowFieldStrategy._bfs.__func__
+
+        def counting_bfs(cls, dungeon, goal):
+            calls.append(goal)
+            return original_bfs(cls, dungeon, goal)
+
+        monkeypatch.setattr(FlowFieldStrategy, "_bfs", classmethod(counting_bfs))
+        strategy = FlowFieldStrategy()
+
+        strategy.find_path(dungeon, (0, 0), (2, 2))
+        strategy.find_path(dungeon, (0, 2), (2, 2))
+        assert strategy.next_step(dungeon, (1, 2), (2, 2)) == (2, 2)
+        assert len(calls) == 1
+
+        dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+        strategy.find_path(dungeon, (0, 0), (2, 2))
+        assert len(calls) == 2
+
+    def test_no_path_exists(self):
+        """Test that a walled-off goal gives an empty path."""
+        dungeon = create_simple_dungeon()
+        dungeon.place_entity(EntityFactory.create_wall(), (1, 2))
+        dungeon.place_entity(EntityFactory.create_wall(), (2, 1))
+
+        assert FlowFieldStrategy().find_path(dungeon, (0, 0), (2, 2)) == []
+
+
+class TestIncrementalPathStrategy:
+    """Tests for the LPA*-based incremental strategies."""
+
+    def test_matches_base_strategies(self):
+        """Test that incremental paths have the same quality as the base ones."""
+        dungeon = create_dungeon_with_walls()
+
+        shortest = IncrementalShortestPathStrategy().find_path(dungeon, (0, 0), (4, 4))
+        safest = IncrementalSafestPathStrategy().find_path(dungeon, (0, 0), (4, 4))
+
+        assert len(shortest) == len(ShortestPathStrategy().find_path(dungeon, (0, 0), (4, 4)))
+        assert calculate_path_damage(dungeon, safest) == calculate_path_damage(
+            dungeon, SafestPathStrategy().find_path(dungeon, (0, 0), (4, 4))
+        )
+
+    def test_repairs_after_single_edit(self, monkeypatch):
+        """Test that an edit repairs the planner instead of starting over."""
+        dungeon = create_dungeon_with_traps()
+        strategy = IncrementalShortestPathStrategy()
+        first = strategy.find_path(dungeon, (0, 0), (4, 4))
+
+        created = []
+        original_init = LPAStarPlanner.__init__
+
+        def tracking_init(self, *args):
+            created.append(args)
+            original_init(self, *args)
+
+        monkeypatch.setattr(LPAStarPlanner, "__init__", tracking_init)
+        blocked = first[2]
+        dungeon.place_entity(EntityFactory.create_wall(), blocked)
+        repaired = strategy.find_path(dungeon, (0, 0), (4, 4))
+
+        assert created == []
+        assert blocked not in repaired
+        assert len(repaired) == len(ShortestPathStrategy().find_path(dungeon, (0, 0), (4, 4)))
+
+    def test_reports_blocked_then_reopened_goal(self):
+        """Test blocking and unblocking the only route."""
+        dungeon = create_simple_dungeon()
+        strategy = IncrementalShortestPathStrategy()
+        dungeon.place_entity(EntityFactory.create_wall(), (1, 2))
+        dungeon.place_entity(EntityFactory.create_wall(), (2, 1))
+
+        assert strategy.find_path(dungeon, (0, 0), (2, 2)) == []
+
+        dungeon.place_entity(EntityFactory.create_floor(), (2, 1))
+        assert strategy.find_path(dungeon, (0, 0), (2, 2))[-1] == (2, 2)
+
+    def test_level_heroes_use_the_planner(self, monkeypatch):
+        """Test that shortest/safest heroes are repaired by the planner after an edit."""
+        from src.model.level import LevelBuilder
+
+        dungeon = create_dungeon_with_walls()
+        level = (LevelBuilder()
+                 .set_dungeon(dungeon)
+                 .add_hero(pv=50, strategy="shortest")
+                 .add_hero(pv=50, strategy="safest")
+                 .build())
+        planners = IncrementalPathStrategy._planners[dungeon]
+        assert set(planners) == {
+            (ShortestPathStrategy, (0, 0), (4, 4)),
+            (SafestPathStrategy, (0, 0), (4, 4)),
+        }
+
+        created = []
+        original_init = LPAStarPlanner.__init__
+
+        def tracking_init(self, *args):
+            created.append(args)
+            original_init(self, *args)
+
+        blocked = level.heroes[1].path[1]
+        dungeon.place_entity(EntityFactory.create_wall(), blocked)
+        monkeypatch.setattr(LPAStarPlanner, "__init__", tracking_init)
+        level.reset()
+
+        assert created == []
+        assert blocked not in level.heroes[1].path
+        assert calculate_path_damage(dungeon, level.heroes[1].path) == calculate_path_damage(
+            dungeon, SafestPathStrategy().find_path(dungeon, (0, 0), (4, 4))
+        )
+        assert len(level.heroes[0].path) == len(ShortestPathStrategy().find_path(dungeon, (0, 0), (4, 4)))
+
+    def test_planners_do_not_keep_their_dungeon_alive(self):
+        """Test that a cached planner lets its dungeon be collected."""
+        dungeon = create_dungeon_with_traps()
+        PathStrategyFactory.find_path("shortest", dungeon, (0, 0), (4, 4))
+        assert IncrementalPathStrategy._planners[dungeon]
+        ref = weakref.ref(dungeon)
+
+        del dungeon
+        gc.collect()
+
+        assert ref() is None
+
+
 class TestPathStrategyFactory:
     """Tests for PathStrategyFactory."""
     
@@ -283,6 +437,30 @@ class TestPathStrategyFactory:
         with pytest.raises(TypeError):
             PathStrategyFactory.register_strategy("invalid", NotAStrategy)
 
+    def test_find_path_reuses_cache_until_dungeon_changes(self, monkeypatch):
+        """Test that cached paths are shared until the dungeon version moves."""
+        calls = []
+
+        class CountingStrategy(ShortestPathStrategy):
+            def find_path(self, dungeon, start, goal):
+                calls.append((start, goal))
+                return super().find_path(dungeon, start, goal)
+
+        # Registration and cached paths must not leak into other tests
+        monkeypatch.setitem(PathStrategyFactory._strategies, "counting", CountingStrategy)
+        monkeypatch.setattr(PathStrategyFactory, "_path_cache", weakref.WeakKeyDictionary())
+        dungeon = create_simple_dungeon()
+
+        first = PathStrategyFactory.find_path("counting", dungeon, (0, 0), (2, 2))
+        second = PathStrategyFactory.find_path("counting", dungeon, (0, 0), (2, 2))
+        assert first == second
+        assert first is not second
+        assert len(calls) == 1
+
+        dungeon.place_entity(EntityFactory.create_wall(), (1, 1))
+        PathStrategyFactory.find_path("counting", dungeon, (0, 0), (2, 2))
+        assert len(calls) == 2
+
 
 class TestStrategyIntegration:
     """Integration tests for path strategies with heroes and levels."""
@@ -0,0 +1,145 @@
+"""Tests pour le journal de rejeu et le rejeu headless."""
+
+import json
+
+import pytest
+
+from src.commands.placeEntity import placeEntity
+from src.commands.startWave import startWave
+from src.controller.game_controller import GameController
+from src.model.entity_factory import EntityFactory
+from src.model.dungeon import Dungeon
+from src.model.level import LevelBuilder
+from src.model.waveResult import waveResult
+from src.replay import ReplayLog, main, read_replay, replay, replay_files
+from src.simulation import Simulation
+
+
+def _level(size=6, budget=500):
+    dungeon = Dungeon(dimension=(size, size), entry=(0, 0), exit=(size - 1, size - 1))
+    return (LevelBuilder()
+            .set_dungeon(dungeon)
+            .set_budget(budget)
+            .add_hero(pv=60, strategy="shortest")
+            .add_hero(pv=80, strategy="safest")
+            .add_hero(pv=40, strategy="shortest")
+            .build())
+
+
+def _controller():
+    level = _level()
+    return GameController(None, Simulation(level, level.dungeon))
+
+
+def _place(controller, entity, position):
+    """Place une entité par le GameInvoker, comme l'InputHandler."""
+    simulation = controller.simulation
+    controller.invoker.push_command(placeEntity(simulation.dungeon, entity, position, simulation))
+    controller.invoker.execute()
+
+
+def _build(controller):
+    controller.place_trap((1, 1), damage=15)
+    controller.place_wall((0, 2))
+    _place(controller, EntityFactory.create_dragon(orientation="D"), (2, 0))
+    _place(controller, EntityFactory.create_bombe(), (3, 3))
+    controller.place_trap((4, 4), damage=5)
+    controller.remove_entity((4, 4))
+
+
+def _play(controller, max_ticks=200):
+    """Joue la vague comme l'interface terminal : une commande startWave par tick."""
+    simulation = controller.simulation
+    while not (simulation.tresorReached or simulation.allHeroesDead) and simulation.ticks < max_ticks:
+        controller.start_wave()
+    controller.stop()
+
+
+def test_replay_reproduces_final_wave_result(tmp_path, capsys):
+    """Test que le rejeu retrouve exactement le waveResult de la partie."""
+    path = str(tmp_path / "session.jsonl")
+    controller = _controller()
+    log = ReplayLog(path).attach(controller)
+    _build(controller)
+    _play(controller)
+    expected = waveResult.from_simulation(controller.simulation).to_dict()
+    log.close()
+
+    events = read_replay(path)
+    kinds = [event["e"] for event in events]
+
+    assert kinds[:2] == ["header", "setup"]
+    assert kinds.count("place") == 5 and kinds.count("remove") == 1
+    assert "ticks" in kinds and kinds[-1] == "end"
+    assert events[-1]["result"] == expected
+    assert replay(path).to_dict() == expected
+    assert controller.simulation.recorder is None
+
+
+def test_ticks_driven_outside_commands_are_recorded(tmp_path):
+    """Test que les ticks joués directement (boucle de vague) sont journalisés."""
+    path = str(tmp_path / "loop.jsonl")
+    controller = _controller()
+    log = ReplayLog(path).attach(controller)
+    _build(controller)
+    controller.invoker.push_command(startWave(controller.simulation))
+    controller.invoker.execute()
+    for _ in range(7):
+        controller.simulation.step()
+    expected = waveResult.from_simulation(controller.simulation).to_dict()
+    log.close()
+
+    ticks = sum(event["n"] for event in read_replay(path) if event["e"] == "ticks")
+    assert ticks == controller.simulation.ticks == 8
+    assert replay(path).to_dict() == expected
+
+
+def test_replaced_level_writes_new_setup(tmp_path):
+    """Test qu'un changement de niveau réécrit l'état de départ."""
+    path = str(tmp_path / "levels.jsonl")
+    controller = _controller()
+    log = ReplayLog(path).attach(controller)
+    _build(controller)
+    _play(controller, max_ticks=5)
+
+    controller.setup_level(_level(size=5, budget=300))
+    controller.place_wall((1, 0))
+    _play(controller)
+    expected = waveResult.from_simulation(controller.simulation).to_dict()
+    log.close()
+
+    setups = [event for event in read_replay(path) if event["e"] == "setup"]
+    assert len(setups) == 2 and setups[1]["dimension"] == [5, 5]
+    assert replay(path).to_dict() == expected
+
+
+def test_replay_rejects_foreign_files(tmp_path):
+    """Test qu'un fichier qui n'est pas un journal est refusé."""
+    path = tmp_path / "other.jsonl"
+    path.write_text(json.dumps({"e": "ticks", "n": 3}) + "\n")
+
+    with pytest.raises(ValueError):
+        read_replay(str(path))
+    with pytest.raises(ValueError):
+        replay([{"e": "ticks", "n": 1}])
+
+
+def test_replay_files_and_cli(tmp_path, capsys):
+    """Test du rejeu en lot et de la ligne de commande."""
+    paths = []
+    for i in range(2):
+        path = str(tmp_path / f"s{i}.jsonl")
+        controller = _controller()
+        log = ReplayLog(path).attach(controller)
+        _build(controller)
+        _play(controller, max_ticks=3 + i)
+        log.close()
+        paths.append(path)
+
+    capsys.readouterr()
+    reports = replay_files(paths, max_workers=1)
+
+    assert [r["result"]["turns"] for r in reports] == [3, 4]
+    assert all(r["match"] for r in reports)
+    assert main(paths + ["--workers", "1"]) == 0
+    assert len(capsys.readouterr().out.strip().splitlines()) == 2
@@ -0,0 +1,130 @@
+"""Tests pour les sessions du serveur web."""
+
+import os
+
+import pytest
+
+from src.model.entity_factory import EntityFactory
+from src.view.gui.sessions import GameSession, SessionLimitError, SessionRegistry
+
+CAMPAIGN = os.path.join(os.path.dirname(__file__), "..", "campaign.json")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_registry(clock=None, **kwargs):
+    def factory(session_id):
+        session = GameSession.from_campaign(session_id, CAMPAIGN)
+        if clock is not None:
+            session._clock = clock
+            session.touch()
+        return session
+    return SessionRegistry(factory, **kwargs)
+
+
+def test_sessions_are_independent():
+    """Test que deux sessions ont chacune leur simulation et leur donjon."""
+    registry = make_registry()
+    a, b = registry.create(), registry.create()
+
+    assert a.id != b.id
+    assert a.simulation is not b.simulation
+    assert a.game_controller.wave_loop is a.wave_loop
+
+    a.input_handler.place_wall((1, 1))
+
+    assert a.current_dungeon().get_cell((1, 1)).entity.type == "WALL"
+    assert b.current_dungeon().get_cell((1, 1)).entity.type != "WALL"
+    assert a.frame_tracker.version > b.frame_tracker.version
+
+
+def test_get_unknown_session_returns_none():
+    """Test qu'un identifiant inconnu ne crée pas de session."""
+    registry = make_registry()
+    assert registry.get("inconnue") is None
+    assert len(registry) == 0
+
+
+def test_idle_sessions_are_evicted():
+    """Test que les sessions inactives sans client sont fermées."""
+    clock = FakeClock()
+    registry = make_registry(clock, idle_timeout=60)
+    idle = registry.create()
+    clock.now = 30
+    active = registry.create()
+
+    clock.now = 80
+    registry.get(active.id)
+
+    assert registry.evict_idle() == 1
+    assert registry.get(idle.id) is None
+    assert registry.get(active.id) is active
+
+
+def test_registry_is_bounded():
+    """Test qu'au-delà de la limite la session la moins récente est fermée."""
+    registry = make_registry(max_sessions=2)
+    first, second = registry.create(), registry.create()
+    registry.get(first.id)
+
+    third = registry.create()
+
+    assert len(registry) == 2
+    assert registry.get(second.id) is None
+    assert registry.get(first.id) is first
+    assert registry.get(third.id) is third
+
+
+def test_connected_sessions_are_never_evicted():
+    """Test qu'au-delà de la limite seule une session sans client est fermée."""
+    registry = make_registry(max_sessions=2)
+    first, second = registry.create(), registry.create()
+    # Client factice connecté à la session la moins récente
+    first.manager.connections[object()] = None
+
+    third = registry.create()
+
+    assert registry.get(first.id) is first
+    assert registry.get(second.id) is None
+    assert registry.get(third.id) is third
+
+
+def test_create_refused_when_every_session_is_connected():
+    """Test que la création échoue plutôt que de couper une partie en cours."""
+    registry = make_registry(max_sessions=1)
+    busy = registry.create()
+    busy.manager.connections[object()] = None
+    built = []
+    registry.factory = lambda sid: built.append(sid)
+
+    with pytest.raises(SessionLimitError):
+        registry.create()
+
+    assert built == []
+    assert registry.get(busy.id) is busy
+
+
+def test_set_simulation_moves_the_observer():
+    """Test qu'au changement de simulation l'observateur suit la nouvelle."""
+    registry = make_registry()
+    session = registry.create()
+    old = session.simulation
+    new = GameSession.from_campaign("autre", CAMPAIGN).simulation
+
+    session.set_simulation(new)
+
+    assert session.observer not in old.observers
+    assert session.observer in new.observers
+    assert session.frame_tracker.simulation is new
+
+
+def test_unknown_campaign_raises():
+    """Test qu'une campagne sans niveau 1 est refusée."""
+    with pytest.raises(ValueError):
+        GameSession.from_campaign("x", "introuvable.json")
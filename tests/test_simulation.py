@@ -6,6 +6,7 @@ from src.simulation import Simulation
 from src.model.level import Level, LevelBuilder
 from src.model.hero import Hero
 from src.model.dungeon import Dungeon
+from src.model.compact_dungeon import CompactDungeon
 from src.model.cell import Cell
 from src.model.trap import Trap
 from src.model.floor import Floor
@@ -270,6 +271,39 @@ def test_simulation_launch_single_step(mock_sleep):
     assert sim.ticks >= 1
 
 
+@patch("time.sleep", return_value=None)
+def test_simulation_run_headless_reaches_exit_without_sleep(mock_sleep):
+    """Test run_headless : la vague va au bout sans temporisation."""
+    dungeon = create_test_dungeon()
+    level = (LevelBuilder()
+             .set_dungeon(dungeon)
+             .add_hero(pv=100, strategy="shortest")
+             .build())
+    sim = Simulation(level=level, dungeon=dungeon)
+
+    result = sim.run_headless()
+
+    assert not mock_sleep.called
+    assert sim.tresorReached
+    assert result.heroesSurvived == 1
+    assert result.turns == sim.ticks
+
+
+def test_simulation_run_headless_is_bounded():
+    """Test run_headless : un héros sans chemin ne bloque pas la boucle."""
+    dungeon = create_test_dungeon()
+    level = (LevelBuilder()
+             .set_dungeon(dungeon)
+             .add_hero(pv=100, strategy="random")
+             .build())
+    sim = Simulation(level=level, dungeon=dungeon)
+
+    result = sim.run_headless(max_ticks=10)
+
+    assert result.turns == 10
+    assert not sim.running
+
+
 def test_simulation_apply_cell_effects():
     """Test de apply_cell_effects."""
     dungeon = create_test_dungeon()
@@ -338,3 +372,76 @@ def test_simulation_step_multiple_heroes():
     assert hero1.coord == (1, 2)
     assert hero2.coord == (2, 2)
     assert sim.ticks == 1
+
+
+def _branching_simulation(backend=Dungeon):
+    dungeon = Dungeon(dimension=(6, 6), entry=(0, 0), exit=(5, 5))
+    dungeon.place_entity(EntityFactory.create_dragon(orientation="D"), (0, 3))
+    dungeon.place_entity(EntityFactory.create_trap(damage=10), (0, 1))
+    if backend is CompactDungeon:
+        dungeon = CompactDungeon.from_dungeon(dungeon)
+    level = (LevelBuilder().set_dungeon(dungeon).set_budget(200)
+             .add_hero(pv=100, strategy="shortest")
+             .add_hero(pv=60, strategy="safest")
+             .build())
+    sim = Simulation(level)
+    sim.isSimStarted = True
+    return sim
+
+
+def _state(sim):
+    return (
+        [(h.pv_cur, h.coord, h.isAlive, h.stepsTaken) for h in sim.heroes],
+        sim.ticks, sim.score, sim.current_budget, sim.dmgobserver.getTotalDmg(),
+        (len(sim.level.alive), sim.level.get_nb_killed_heroes(), sim.level.nb_reached_goal),
+        [[(c.entity.type, c.entity.current_cooldown) for c in row] for row in sim.dungeon.grid],
+    )
+
+
+@pytest.mark.parametrize("backend", [Dungeon, CompactDungeon])
+def test_simulation_snapshot_restore_branches(backend):
+    """Test qu'une branche jouée puis annulée ne laisse aucune trace."""
+    sim = _branching_simulation(backend)
+    sim.step()
+    sim.step()
+    before = _state(sim)
+    snapshot = sim.snapshot()
+
+    sim.current_budget -= 68
+    sim.dungeon.place_entity(EntityFactory.create_dragon(orientation="L"), (1, 5))
+    for _ in range(6):
+        sim.step()
+    assert _state(sim) != before
+
+    sim.restore(snapshot)
+    assert _state(sim) == before
+
+    # Le même snapshot resert : la branche rejouée donne le même résultat
+    for _ in range(6):
+        sim.step()
+    after_first = _state(sim)
+    sim.restore(snapshot)
+    for _ in range(6):
+        sim.step()
+    assert _state(sim) == after_first
+    sim.release(snapshot)
+
+
+@pytest.mark.parametrize("backend", [Dungeon, CompactDungeon])
+def test_simulation_snapshot_matches_unbranched_run(backend):
+    """Test qu'après restore, la suite de la vague est identique à une vague sans branche."""
+    reference = _branching_simulation(backend)
+    branched = _branching_simulation(backend)
+    for _ in range(3):
+        reference.step()
+        branched.step()
+
+    snapshot = branched.snapshot()
+    branched.dungeon.place_entity(EntityFactory.create_wall(), (2, 2))
+    branched.step()
+    branched.restore(snapshot)
+
+    for _ in range(8):
+        reference.step()
+        branched.step()
+    assert _state(branched) == _state(reference)
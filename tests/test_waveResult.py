@@ -31,6 +31,15 @@ def test_waveResult_from_simulation_counts_and_fields():
     assert wr.turns == 42
 
 
+def test_waveResult_counts_follow_hero_events():
+    sim = make_sim_with_heroes(alive_counts=[True, True, False])
+    sim.heroes[0].take_damage(100)
+    sim.heroes[2].awake()
+
+    wr = waveResult.from_simulation(sim)
+    assert (wr.heroesSurvived, wr.heroesKilled) == (2, 1)
+
+
 def test_waveResult_to_dict_and_repr_and_helpers():
     sim = make_sim_with_heroes(alive_counts=[False, False], budget_tot=100, current_budget=80)
     # check static helpers directly
@@ -0,0 +1,99 @@
+"""Tests pour la boucle de vague asynchrone."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.commands.startWave import startWave
+from src.commands.stopWave import stopWave
+from src.controller.wave_loop import WaveLoop
+from src.model.cell import Cell
+from src.model.dungeon import Dungeon
+from src.model.level import LevelBuilder
+from src.simulation import Simulation
+
+
+def create_simulation(rows=1, cols=6):
+    """Helper pour créer une simulation avec un héros dans un couloir."""
+    grid = [[Cell((r, c), None) for c in range(cols)] for r in range(rows)]
+    dungeon = Dungeon(
+        dimension=(rows, cols), grid=grid, entry=(0, 0), exit=(rows - 1, cols - 1)
+    )
+    level = (LevelBuilder()
+             .set_dungeon(dungeon)
+             .add_hero(pv=100, strategy="shortest")
+             .build())
+    return Simulation(level)
+
+
+def test_wave_runs_to_the_end_and_publishes_each_tick():
+    """Test que la boucle joue la vague jusqu'au trésor en appelant on_tick."""
+    sim = create_simulation()
+    ticks = []
+
+    async def scenario():
+        loop = WaveLoop(ticks_per_second=60, on_tick=lambda: ticks.append(sim.ticks))
+        controller = MagicMock(wave_loop=loop)
+        assert startWave(sim).execute(controller) is True
+        await asyncio.wait_for(loop._task, timeout=2)
+        return loop.running
+
+    running = asyncio.run(scenario())
+    assert sim.tresorReached is True
+    assert running is False and sim.running is False
+    assert ticks == list(range(1, sim.ticks + 1))
+
+
+def test_pause_and_resume():
+    """Test que la pause gèle les ticks jusqu'à la reprise."""
+    sim = create_simulation(cols=40)
+
+    async def scenario():
+        loop = WaveLoop(ticks_per_second=60)
+        loop.start(sim)
+        await asyncio.sleep(0.05)
+        loop.pause()
+        await asyncio.sleep(0.03)
+        frozen = sim.ticks
+        await asyncio.sleep(0.05)
+        paused_ticks = sim.ticks
+        loop.resume()
+        await asyncio.sleep(0.05)
+        resumed_ticks = sim.ticks
+        loop.stop()
+        return frozen, paused_ticks, resumed_ticks
+
+    frozen, paused_ticks, resumed_ticks = asyncio.run(scenario())
+    assert frozen == paused_ticks
+    assert resumed_ticks > paused_ticks
+
+
+def test_stop_wave_command_cancels_the_task():
+    """Test que stopWave annule la tâche de la boucle."""
+    sim = create_simulation(cols=40)
+
+    async def scenario():
+        loop = WaveLoop(ticks_per_second=20)
+        controller = MagicMock(wave_loop=loop)
+        startWave(sim).execute(controller)
+        await asyncio.sleep(0.01)
+        stopWave(sim).execute(controller)
+        await asyncio.sleep(0.1)
+        return loop.running, sim.ticks
+
+    running, ticks = asyncio.run(scenario())
+    assert running is False
+    assert ticks <= 2
+    assert sim.tresorReached is False
+
+
+def test_set_speed_validates_rate():
+    """Test que la cadence doit être strictement positive et bornée."""
+    loop = WaveLoop()
+    loop.set_speed(8)
+    assert loop.state()["ticks_per_second"] == 8
+    with pytest.raises(ValueError):
+        loop.set_speed(0)
+    with pytest.raises(ValueError):
+        loop.set_speed(1000)